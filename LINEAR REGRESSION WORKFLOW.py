@@ -13,6 +13,8 @@ import statsmodels.stats.stattools as stattools
 from statsmodels.stats.outliers_influence import variance_inflation_factor
 import matplotlib.pyplot as plt
 
+from hac import HAC_KERNELS, hac_table, hac_vcov, select_bandwidth
+
 # ==============================
 # 1. LOAD DATA
 # ==============================
@@ -139,6 +141,16 @@ print("\n===== ROBUST STANDARD ERRORS (HC3) =====")
 robust_model = model.get_robustcov_results(cov_type='HC3')
 print(robust_model.summary())
 
+print("\n===== HAC (NEWEY-WEST) STANDARD ERRORS =====")
+
+# Same residuals under each kernel, with Andrews and Newey-West plug-in bandwidths
+for kernel in HAC_KERNELS:
+    for method in ("andrews", "newey-west"):
+        bandwidth = select_bandwidth(X.values, residuals.values, kernel=kernel, method=method)
+        hac_cov = hac_vcov(X.values, residuals.values, kernel=kernel, bandwidth=bandwidth)
+        print(f"\n{kernel.title()} kernel, {method} bandwidth = {bandwidth:.2f}")
+        print(hac_table(model.params, hac_cov, names=X.columns, df_resid=model.df_resid))
+
 # ==============================
 # 9. DIAGNOSTIC PLOTS
 # ==============================
@@ -10,6 +10,8 @@ from statsmodels.stats.diagnostic import het_breuschpagan, acorr_breusch_godfrey
 from statsmodels.stats.stattools import jarque_bera
 from statsmodels.stats.stattools import durbin_watson
 
+from hac import hac_table, hac_vcov, select_bandwidth
+
 # -----------------------------------------
 # 1. Load Data
 # -----------------------------------------
@@ -73,7 +75,17 @@ print("\nBreusch-Godfrey Test")
 print(dict(zip(bg_labels, bg_test)))
 
 # -----------------------------------------
-# 7. Prediction Example
+# 7. HAC (Newey-West) Standard Errors
+# -----------------------------------------
+# Bartlett kernel with an Andrews (1991) plug-in bandwidth
+hac_bandwidth = select_bandwidth(X.values, model.resid.values, kernel="bartlett", method="andrews")
+hac_cov = hac_vcov(X.values, model.resid.values, kernel="bartlett", bandwidth=hac_bandwidth)
+
+print(f"\nHAC Standard Errors (Bartlett, bandwidth={hac_bandwidth:.2f})")
+print(hac_table(model.params, hac_cov, names=X.columns, df_resid=model.df_resid))
+
+# -----------------------------------------
+# 8. Prediction Example
 # -----------------------------------------
 new_data = pd.DataFrame({
     'const':[1],
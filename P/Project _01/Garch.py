@@ -1,7 +1,16 @@
 import argparse
+import contextlib
+import importlib.util
+import io
+import math
 import os
+import sys
 import tempfile
+import time
 import warnings
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 
 os.environ.setdefault("MPLCONFIGDIR", tempfile.gettempdir())
 
@@ -11,26 +20,282 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from arch import arch_model
+from scipy.stats import norm
 
-from time_series_utils import load_time_series
+from batch_utils import DEFAULT_N_JOBS, resolve_batch_inputs, resolve_n_jobs
+from fit_cache import FitCache
+from histogram_quantiles import HistogramQuantiles
+from instrumentation import StageProfiler, build_run_record, profiled, write_chrome_trace, write_run_record
+from time_series_utils import RESAMPLE_PERIODS, is_store_uri, load_time_series, stream_time_series
+
+
+# Volatility families that arch_model spells with an extra asymmetry order.
+ASYMMETRIC_VOL_MODELS = {"GJR": "GARCH"}
+TOURNAMENT_VOLS = ("GARCH", "GJR", "EGARCH", "FIGARCH")
+TOURNAMENT_DISTS = ("normal", "t", "skewt")
+
+
+def build_arch_model(returns, p=1, q=1, mean="Constant", vol="GARCH", dist="normal"):
+    if vol in ASYMMETRIC_VOL_MODELS:
+        return arch_model(returns, mean=mean, vol=ASYMMETRIC_VOL_MODELS[vol], p=p, o=1, q=q, dist=dist)
+    return arch_model(returns, mean=mean, vol=vol, p=p, q=q, dist=dist)
+
+
+def fit_candidate(returns, p, q, mean="Constant", vol="GARCH", dist="normal", tol=None, maxiter=None, starting_values=None):
+    options = {"maxiter": maxiter} if maxiter is not None else None
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        candidate_model = build_arch_model(returns, p=p, q=q, mean=mean, vol=vol, dist=dist)
+        return candidate_model.fit(disp="off", tol=tol, options=options, starting_values=starting_values)
+
+
+def score_candidate(returns_values, p, q, mean, vol, dist, criterion):
+    try:
+        candidate_result = fit_candidate(returns_values, p, q, mean, vol, dist)
+        score = float(getattr(candidate_result, criterion))
+    except Exception as exc:
+        return p, q, None, str(exc)
+    return p, q, score, None
+
+
+def tournament_specs(vols=TOURNAMENT_VOLS, dists=TOURNAMENT_DISTS, max_p=2, max_q=2):
+    specs = []
+    for vol in vols:
+        # FIGARCH only admits p, q in {0, 1}.
+        orders = [(1, 1)] if vol == "FIGARCH" else [(p, q) for p in range(1, max_p + 1) for q in range(1, max_q + 1)]
+        for dist in dists:
+            specs.extend((vol, p, q, dist) for p, q in orders)
+    return specs
+
+
+def format_spec(spec):
+    vol, p, q, dist = spec
+    return f"{vol}({p}, {q}) dist={dist}"
+
+
+def score_spec(returns_values, spec, mean, criterion, tol=None, maxiter=None, starting_values=None):
+    vol, p, q, dist = spec
+    try:
+        candidate_result = fit_candidate(
+            returns_values, p, q, mean, vol, dist, tol=tol, maxiter=maxiter, starting_values=starting_values
+        )
+        score = float(getattr(candidate_result, criterion))
+    except Exception as exc:
+        return spec, None, None, str(exc)
+    if not math.isfinite(score):
+        return spec, None, None, "non-finite information criterion"
+    return spec, score, candidate_result.params.to_numpy(), None
+
+
+class GarchStreamState:
+    """Recursion state needed to advance a fitted GARCH(p, q) one tick at a time."""
+
+    __slots__ = (
+        "mu", "omega", "alphas", "betas", "return_type", "last_level",
+        "recent_sq_resid", "recent_variance", "last_variance", "next_variance",
+        "observations", "sum_sq_std_resid",
+    )
+
+    def __init__(self, mu, omega, alphas, betas, return_type, last_level, recent_sq_resid, recent_variance, last_variance, next_variance):
+        self.mu = mu
+        self.omega = omega
+        self.alphas = alphas
+        self.betas = betas
+        self.return_type = return_type
+        self.last_level = last_level
+        # Most recent value first, bounded by the ARCH and GARCH orders.
+        self.recent_sq_resid = deque(recent_sq_resid, maxlen=len(alphas))
+        self.recent_variance = deque(recent_variance, maxlen=len(betas))
+        self.last_variance = last_variance
+        self.next_variance = next_variance
+        self.observations = 0
+        self.sum_sq_std_resid = 0.0
+
+    def is_reference_level(self, level):
+        # A level later ticks can be measured against: finite, and positive for log returns.
+        return math.isfinite(level) and (level > 0 if self.return_type == "log" else level != 0)
+
+    def push(self, level):
+        previous_level = self.last_level
+        if self.return_type == "log":
+            ret = 100 * math.log(level / previous_level) if level > 0 and previous_level > 0 else math.nan
+        else:
+            ret = 100 * (level / previous_level - 1) if previous_level != 0 else math.nan
+        if not math.isfinite(ret):
+            # A rejected tick must not become the reference for the next one,
+            # unless the current reference cannot produce a return at all.
+            if self.is_reference_level(level) and not self.is_reference_level(previous_level):
+                self.last_level = level
+            return False
+        self.last_level = level
+
+        variance = self.next_variance
+        resid = ret - self.mu
+        sq_resid = resid * resid
+        self.observations += 1
+        self.sum_sq_std_resid += sq_resid / variance
+
+        self.recent_sq_resid.appendleft(sq_resid)
+        self.recent_variance.appendleft(variance)
+        self.last_variance = variance
+
+        next_variance = self.omega
+        for alpha, value in zip(self.alphas, self.recent_sq_resid):
+            next_variance += alpha * value
+        for beta, value in zip(self.betas, self.recent_variance):
+            next_variance += beta * value
+        self.next_variance = next_variance
+        return True
+
+    def variance_forecast(self, horizon):
+        """Variance forecasts for steps 1..horizon from the current recursion state.
+
+        Future squared residuals are replaced by their expectation, the variance
+        forecast for the same step, as in arch's analytic forecasts.
+        """
+        sq_resid = deque(self.recent_sq_resid, maxlen=len(self.alphas))
+        variance_lags = deque(self.recent_variance, maxlen=len(self.betas))
+        forecasts = np.empty(horizon)
+        variance = self.next_variance
+        for step in range(horizon):
+            forecasts[step] = variance
+            sq_resid.appendleft(variance)
+            variance_lags.appendleft(variance)
+            variance = self.omega
+            for alpha, value in zip(self.alphas, sq_resid):
+                variance += alpha * value
+            for beta, value in zip(self.betas, variance_lags):
+                variance += beta * value
+        return forecasts
+
+    def drift_statistic(self):
+        # Under a correctly specified model E[z^2] = 1; the statistic is the
+        # standardised deviation of the running sum of z^2 since the last fit.
+        if self.observations == 0:
+            return 0.0
+        return (self.sum_sq_std_resid - self.observations) / math.sqrt(2 * self.observations)
+
+
+def garch_term_structure(omega, persistence, next_variance, horizon):
+    """Per-step and cumulative variance for steps 1..horizon of a GARCH(1, 1)-type recursion.
+
+    With persistence ``phi`` the k-step forecast is
+    ``s2 + phi**(k - 1) * (h1 - s2)`` where ``s2 = omega / (1 - phi)``; the
+    cumulative sum has the matching geometric-series closed form.
+    """
+    steps = np.arange(horizon, dtype=float)
+    decay = persistence**steps
+    if persistence == 1.0:
+        step_variance = next_variance + omega * steps
+        cumulative_variance = np.cumsum(step_variance)
+    else:
+        long_run = omega / (1.0 - persistence)
+        gap = next_variance - long_run
+        step_variance = long_run + decay * gap
+        cumulative_variance = long_run * (steps + 1) + gap * (1.0 - decay * persistence) / (1.0 - persistence)
+    return step_variance, cumulative_variance
+
+
+DEFAULT_QUANTILES = (0.01, 0.05, 0.5, 0.95, 0.99)
+DEFAULT_VAR_LEVELS = (0.99, 0.975)
+PILOT_PATHS = 20_000
+
+
+def _simulate_chunk(state, horizon, n_paths, draw, on_step):
+    alphas = np.asarray(state.alphas)
+    betas = np.asarray(state.betas)
+    sq_resid = np.tile(np.asarray(state.recent_sq_resid, dtype=float), (n_paths, 1))
+    variance_lags = np.tile(np.asarray(state.recent_variance, dtype=float), (n_paths, 1))
+    variance = np.full(n_paths, state.next_variance)
+    cumulative = np.zeros(n_paths)
+
+    for step in range(horizon):
+        resid = np.sqrt(variance) * draw(n_paths)
+        returns = state.mu + resid
+        cumulative += returns
+        on_step(step, returns, cumulative, variance)
+
+        if alphas.size:
+            sq_resid = np.roll(sq_resid, 1, axis=1)
+            sq_resid[:, 0] = resid * resid
+        if betas.size:
+            variance_lags = np.roll(variance_lags, 1, axis=1)
+            variance_lags[:, 0] = variance
+        variance = state.omega + sq_resid @ alphas + variance_lags @ betas
+
+
+def simulate_garch_bands(state, horizon, simulations, draw, quantiles, chunk_size, pilot_size):
+    names = ("return", "cumulative_return", "volatility")
+    pilot = {name: np.empty((pilot_size, horizon)) for name in names}
+    variance_sum = np.zeros(horizon)
+
+    def record_pilot(step, returns, cumulative, variance):
+        pilot["return"][:, step] = returns
+        pilot["cumulative_return"][:, step] = cumulative
+        pilot["volatility"][:, step] = np.sqrt(variance)
+        variance_sum[step] += variance.sum()
+
+    # A small pilot run fixes the histogram ranges; its paths are kept in the totals.
+    _simulate_chunk(state, horizon, pilot_size, draw, record_pilot)
+    histograms = {name: HistogramQuantiles(pilot[name]) for name in names}
+    for name in names:
+        for step in range(horizon):
+            histograms[name].add(step, pilot[name][:, step])
+    del pilot
+
+    def record(step, returns, cumulative, variance):
+        histograms["return"].add(step, returns)
+        histograms["cumulative_return"].add(step, cumulative)
+        histograms["volatility"].add(step, np.sqrt(variance))
+        variance_sum[step] += variance.sum()
+
+    remaining = simulations - pilot_size
+    while remaining > 0:
+        n_paths = min(chunk_size, remaining)
+        _simulate_chunk(state, horizon, n_paths, draw, record)
+        remaining -= n_paths
+
+    bands = {"forecast_variance": variance_sum / simulations}
+    for name in names:
+        estimates = histograms[name].quantiles(quantiles)
+        for probability, values in zip(quantiles, estimates):
+            bands[f"{name}_q{probability:g}"] = values
+    return bands
 
 
 class GarchModel:
-    def __init__(self, data_path, date_col=None, value_col=None, return_type="log", series_name=None):
+    def __init__(
+        self,
+        data_path,
+        date_col=None,
+        value_col=None,
+        return_type="log",
+        series_name=None,
+        fit_cache=None,
+        profiler=None,
+        resample_freq=None,
+        chunksize=500_000,
+    ):
         self.data_path = data_path
         self.date_col = date_col
         self.value_col = value_col
         self.return_type = return_type
         self.series_name = series_name
+        self.fit_cache = fit_cache
+        self.profiler = profiler
+        self.resample_freq = resample_freq
+        self.chunksize = chunksize
         self.series = self.load_data()
         self.returns = self.compute_returns()
         self.model = None
         self.result = None
         self.forecast_variance = None
+        self.stream_state = None
         self.last_observation_date = self.series.index[-1] if isinstance(self.series.index, pd.DatetimeIndex) else None
         self.selected_order = None
         self.selection_criterion = None
         self.selection_score = None
+        self.tournament_history = None
         self.mean_name = None
         self.vol_name = None
         self.dist_name = None
@@ -41,15 +306,27 @@ class GarchModel:
             return str(value.date())
         return str(value)
 
+    @profiled("load_data")
     def load_data(self):
-        if not os.path.exists(self.data_path):
+        if not is_store_uri(self.data_path) and not os.path.exists(self.data_path):
             raise FileNotFoundError(f"Data file not found at {self.data_path}")
 
-        series, metadata = load_time_series(
-            self.data_path,
-            date_col=self.date_col,
-            value_col=self.value_col,
-        )
+        if self.resample_freq:
+            # Large intraday files are streamed and reduced to period closes.
+            series, metadata = stream_time_series(
+                self.data_path,
+                freq=self.resample_freq,
+                how="last",
+                date_col=self.date_col,
+                value_col=self.value_col,
+                chunksize=self.chunksize,
+            )
+        else:
+            series, metadata = load_time_series(
+                self.data_path,
+                date_col=self.date_col,
+                value_col=self.value_col,
+            )
         self.date_col = metadata["date_column"]
         self.value_col = metadata["value_column"]
         self.series_name = self.series_name or metadata["series_label"]
@@ -62,6 +339,7 @@ class GarchModel:
         print(series.tail())
         return series
 
+    @profiled("compute_returns")
     def compute_returns(self):
         if self.return_type == "log":
             returns = 100 * np.log(self.series / self.series.shift(1))
@@ -98,60 +376,108 @@ class GarchModel:
         plt.tight_layout()
         plt.show()
 
+    @profiled("fit")
     def fit(self, p=1, q=1, mean="Constant", vol="GARCH", dist="normal"):
         print(f"\nFitting {vol}({p}, {q}) model with mean='{mean}' and dist='{dist}'...")
-        self.model = arch_model(self.returns, mean=mean, vol=vol, p=p, q=q, dist=dist)
-        self.result = self.model.fit(disp="off")
+        self.model = build_arch_model(self.returns, p=p, q=q, mean=mean, vol=vol, dist=dist)
+
+        summary = None
+        if self.fit_cache is not None:
+            summary = self._fit_with_cache(p, q, mean, vol, dist)
+        else:
+            self.result = self.model.fit(disp="off")
+
         self.selected_order = (p, q)
         self.selection_criterion = None
         self.selection_score = None
         self.mean_name = mean
         self.vol_name = vol
         self.dist_name = dist
-        print(self.result.summary())
+        self.stream_state = None
+        print(summary if summary is not None else self.result.summary())
         return self.result
 
-    def select_best_order(self, max_p=3, max_q=3, criterion="aic", mean="Constant", vol="GARCH", dist="normal"):
+    def _fit_with_cache(self, p, q, mean, vol, dist):
+        spec = FitCache.make_spec(p, q, mean, vol, dist, self.return_type)
+        returns_values = self.returns.to_numpy(dtype=float)
+
+        cached = self.fit_cache.get(returns_values, spec)
+        if cached is not None:
+            print("Using cached parameters for unchanged data; skipping estimation.")
+            params = pd.Series(cached["params"], index=cached["param_names"])
+            self.result = self.model.fix(params)
+            return cached["stats"]["summary"]
+
+        starting_values = None
+        prefix = self.fit_cache.find_prefix(returns_values, spec)
+        if prefix is not None:
+            print(f"Seeding estimation from cached fit on the first {prefix['n_obs']} of {len(returns_values)} observations.")
+            starting_values = np.asarray(prefix["params"], dtype=float)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            self.result = self.model.fit(disp="off", starting_values=starting_values)
+
+        summary = self.result.summary()
+        self.fit_cache.put(
+            returns_values,
+            spec,
+            param_names=self.result.params.index,
+            params=self.result.params.to_numpy(),
+            conditional_volatility=self.result.conditional_volatility.to_numpy(),
+            stats={
+                "loglikelihood": float(self.result.loglikelihood),
+                "aic": float(self.result.aic),
+                "bic": float(self.result.bic),
+                "nobs": int(self.result.nobs),
+                "convergence_flag": int(self.result.convergence_flag),
+                "summary": str(summary),
+            },
+        )
+        return summary
+
+    @profiled("select_best_order")
+    def select_best_order(self, max_p=3, max_q=3, criterion="aic", mean="Constant", vol="GARCH", dist="normal", n_jobs=1):
         criterion = criterion.lower()
         if criterion not in {"aic", "bic"}:
             raise ValueError("criterion must be either 'aic' or 'bic'.")
         if max_p < 1 or max_q < 1:
             raise ValueError("max_p and max_q must both be at least 1.")
 
-        print(f"\nSearching {vol}(p, q) orders for p=1..{max_p}, q=1..{max_q} using {criterion.upper()}...")
+        orders = [(p, q) for p in range(1, max_p + 1) for q in range(1, max_q + 1)]
+        n_jobs = resolve_n_jobs(n_jobs, len(orders))
+
+        mode_text = f" across {n_jobs} worker processes" if n_jobs > 1 else ""
+        print(f"\nSearching {vol}(p, q) orders for p=1..{max_p}, q=1..{max_q} using {criterion.upper()}{mode_text}...")
+
+        if n_jobs > 1:
+            candidates = self._score_orders_parallel(orders, criterion, mean, vol, dist, n_jobs)
+        else:
+            candidates = self._score_orders_sequential(orders, criterion, mean, vol, dist)
 
         best_score = None
         best_order = None
         best_result = None
 
-        for p in range(1, max_p + 1):
-            for q in range(1, max_q + 1):
-                try:
-                    with warnings.catch_warnings():
-                        warnings.simplefilter("ignore")
-                        candidate_model = arch_model(
-                            self.returns,
-                            mean=mean,
-                            vol=vol,
-                            p=p,
-                            q=q,
-                            dist=dist,
-                        )
-                        candidate_result = candidate_model.fit(disp="off")
-                    score = getattr(candidate_result, criterion)
-                    print(f"  {vol}({p}, {q}) -> {criterion.upper()}: {score:.4f}")
-                except Exception as exc:
-                    print(f"  {vol}({p}, {q}) -> failed: {exc}")
-                    continue
-
-                if best_score is None or score < best_score:
-                    best_score = score
-                    best_order = (p, q)
-                    best_result = candidate_result
+        for (p, q), score, candidate_result, error in candidates:
+            if error is not None:
+                print(f"  {vol}({p}, {q}) -> failed: {error}")
+                continue
+            print(f"  {vol}({p}, {q}) -> {criterion.upper()}: {score:.4f}")
 
-        if best_result is None:
+            if best_score is None or score < best_score:
+                best_score = score
+                best_order = (p, q)
+                best_result = candidate_result
+
+        if best_order is None:
             raise RuntimeError("No valid GARCH models were fitted during order selection.")
 
+        if best_result is None:
+            # Workers only report scores; the winning order is refitted here so the
+            # stored result carries the original index. The fit is deterministic.
+            best_result = fit_candidate(self.returns, best_order[0], best_order[1], mean, vol, dist)
+
         self.model = best_result.model
         self.result = best_result
         self.selected_order = best_order
@@ -160,11 +486,158 @@ class GarchModel:
         self.mean_name = mean
         self.vol_name = vol
         self.dist_name = dist
+        self.stream_state = None
 
         print(f"\nSelected best order: {vol}{best_order} with {criterion.upper()}={best_score:.4f}")
         print(self.result.summary())
         return best_order, best_score, best_result
 
+    def _score_orders_sequential(self, orders, criterion, mean, vol, dist):
+        for p, q in orders:
+            try:
+                candidate_result = fit_candidate(self.returns, p, q, mean, vol, dist)
+                score = getattr(candidate_result, criterion)
+            except Exception as exc:
+                yield (p, q), None, None, str(exc)
+                continue
+            yield (p, q), score, candidate_result, None
+
+    def _score_orders_parallel(self, orders, criterion, mean, vol, dist, n_jobs):
+        returns_values = self.returns.to_numpy(dtype=float)
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            futures = [
+                executor.submit(score_candidate, returns_values, p, q, mean, vol, dist, criterion)
+                for p, q in orders
+            ]
+            # Results are consumed in submission order so printing and tie-breaking
+            # match the sequential search exactly.
+            for future in futures:
+                p, q, score, error = future.result()
+                yield (p, q), score, None, error
+
+    @profiled("select_best_spec")
+    def select_best_spec(
+        self,
+        vols=TOURNAMENT_VOLS,
+        dists=TOURNAMENT_DISTS,
+        max_p=2,
+        max_q=2,
+        criterion="aic",
+        mean="Constant",
+        finalists=3,
+        min_sample=500,
+        loose_tol=1e-2,
+        loose_maxiter=50,
+        n_jobs=1,
+    ):
+        """Successive-halving search over volatility family, order and error distribution.
+
+        Every spec is first scored on the most recent observations with loose
+        optimizer settings; each round keeps the better half and doubles the
+        sample until ``finalists`` specs remain, which are then fitted on the
+        full sample with default tolerances. Each round is warm-started from
+        the previous round's estimates. ``finalists`` at or above the number
+        of specs gives an exhaustive search.
+        """
+        criterion = criterion.lower()
+        if criterion not in {"aic", "bic"}:
+            raise ValueError("criterion must be either 'aic' or 'bic'.")
+        if finalists < 1:
+            raise ValueError("finalists must be at least 1.")
+
+        specs = tournament_specs(vols, dists, max_p, max_q)
+        if not specs:
+            raise ValueError("The tournament needs at least one volatility model and distribution.")
+
+        n_obs = len(self.returns)
+        n_rounds = 0
+        while len(specs) > finalists * 2**n_rounds:
+            n_rounds += 1
+        returns_values = self.returns.to_numpy(dtype=float)
+        n_jobs = resolve_n_jobs(n_jobs, len(specs))
+        starting_values = {}
+        history = []
+
+        print(
+            f"\nTournament over {len(specs)} specs ({', '.join(vols)} x {', '.join(dists)}) "
+            f"using {criterion.upper()}: {n_rounds} halving round(s), {min(finalists, len(specs))} finalist(s)..."
+        )
+
+        for round_number in range(n_rounds):
+            sample_size = min(n_obs, max(min_sample, n_obs >> (n_rounds - round_number)))
+            scored = self._score_specs(
+                returns_values[-sample_size:], specs, mean, criterion, loose_tol, loose_maxiter, starting_values, n_jobs
+            )
+            history.extend(
+                {"round": round_number + 1, "n_obs": sample_size, "spec": spec, "score": score, "error": error}
+                for spec, score, _, error in scored
+            )
+            starting_values = {spec: params for spec, _, params, error in scored if error is None}
+            survivors = sorted((score, position) for position, (_, score, _, error) in enumerate(scored) if error is None)
+            keep = max(finalists, math.ceil(len(specs) / 2))
+            specs = [scored[position][0] for _, position in survivors[:keep]]
+            print(
+                f"  round {round_number + 1}: {len(scored)} specs on the last {sample_size} observations, "
+                f"kept {len(specs)}; leader {format_spec(specs[0]) if specs else 'none'}"
+            )
+            if not specs:
+                raise RuntimeError("Every spec failed during the tournament.")
+
+        scored = self._score_specs(returns_values, specs, mean, criterion, None, None, starting_values, n_jobs)
+        history.extend(
+            {"round": n_rounds + 1, "n_obs": n_obs, "spec": spec, "score": score, "error": error}
+            for spec, score, _, error in scored
+        )
+
+        best_spec = None
+        best_score = None
+        best_params = None
+        for spec, score, params, error in scored:
+            if error is not None:
+                print(f"  {format_spec(spec)} -> failed: {error}")
+                continue
+            print(f"  {format_spec(spec)} -> {criterion.upper()}: {score:.4f}")
+            if best_score is None or score < best_score:
+                best_spec = spec
+                best_score = score
+                best_params = params
+
+        if best_spec is None:
+            raise RuntimeError("No valid volatility models were fitted during the tournament.")
+
+        # Refit on the indexed returns, seeded at the optimum, so the stored
+        # result carries dates.
+        vol, p, q, dist = best_spec
+        best_result = fit_candidate(self.returns, p, q, mean, vol, dist, starting_values=best_params)
+
+        self.model = best_result.model
+        self.result = best_result
+        self.selected_order = (p, q)
+        self.selection_criterion = criterion.upper()
+        self.selection_score = best_score
+        self.mean_name = mean
+        self.vol_name = vol
+        self.dist_name = dist
+        self.stream_state = None
+        self.tournament_history = pd.DataFrame(history)
+
+        print(f"\nSelected best spec: {format_spec(best_spec)} with {criterion.upper()}={best_score:.4f}")
+        print(self.result.summary())
+        return best_spec, best_score, best_result
+
+    def _score_specs(self, returns_values, specs, mean, criterion, tol, maxiter, starting_values, n_jobs):
+        if n_jobs > 1 and len(specs) > 1:
+            with ProcessPoolExecutor(max_workers=min(n_jobs, len(specs))) as executor:
+                futures = [
+                    executor.submit(score_spec, returns_values, spec, mean, criterion, tol, maxiter, starting_values.get(spec))
+                    for spec in specs
+                ]
+                return [future.result() for future in futures]
+        return [
+            score_spec(returns_values, spec, mean, criterion, tol, maxiter, starting_values.get(spec))
+            for spec in specs
+        ]
+
     def plot_conditional_volatility(self):
         if self.result is None:
             raise RuntimeError("Fit the model before plotting conditional volatility.")
@@ -178,18 +651,50 @@ class GarchModel:
         plt.tight_layout()
         plt.show()
 
-    def forecast(self, horizon=5):
+    @profiled("forecast")
+    def forecast(
+        self,
+        horizon=5,
+        method="analytic",
+        simulations=1000,
+        quantiles=DEFAULT_QUANTILES,
+        seed=None,
+        max_memory_mb=256,
+    ):
         if self.result is None:
             raise RuntimeError("Fit the model before forecasting.")
-
-        forecast = self.result.forecast(horizon=horizon, reindex=False)
-        variance = forecast.variance.iloc[-1]
+        if method not in {"analytic", "simulation", "bootstrap"}:
+            raise ValueError("method must be one of 'analytic', 'simulation' or 'bootstrap'.")
+
+        # Ticks pushed through update() move the recursion past the fitted sample;
+        # forecasts then start from the streamed state rather than the fit.
+        streamed = self.stream_state is not None and self.stream_state.observations > 0
+        if method == "analytic":
+            if streamed:
+                variance = pd.Series(
+                    self.stream_state.variance_forecast(horizon), index=[f"h.{step}" for step in range(1, horizon + 1)]
+                )
+            else:
+                variance = self.result.forecast(horizon=horizon, reindex=False).variance.iloc[-1]
+            bands = {}
+        else:
+            bands = self.simulate_forecast_bands(
+                horizon=horizon,
+                method=method,
+                simulations=simulations,
+                quantiles=quantiles,
+                seed=seed,
+                max_memory_mb=max_memory_mb,
+            )
+            variance = pd.Series(bands.pop("forecast_variance"), index=[f"h.{step}" for step in range(1, horizon + 1)])
         volatility = np.sqrt(variance)
         self.forecast_variance = variance
 
         if self.last_observation_date is not None:
+            # Forecast dates already assume business-day steps; each streamed tick is one more.
+            ticks = self.stream_state.observations if streamed else 0
             forecast_index = pd.bdate_range(
-                start=self.last_observation_date + pd.offsets.BDay(1),
+                start=self.last_observation_date + pd.offsets.BDay(1 + ticks),
                 periods=horizon,
             )
         else:
@@ -199,6 +704,7 @@ class GarchModel:
             {
                 "forecast_variance": variance.values,
                 "forecast_volatility": volatility.values,
+                **bands,
             },
             index=forecast_index,
         )
@@ -208,6 +714,267 @@ class GarchModel:
         print(forecast_df)
         return forecast_df
 
+    def simulate_forecast_bands(
+        self,
+        horizon=5,
+        method="simulation",
+        simulations=1000,
+        quantiles=DEFAULT_QUANTILES,
+        seed=None,
+        max_memory_mb=256,
+    ):
+        """Quantile bands of simulated returns, cumulative returns and volatility.
+
+        Paths are generated in chunks sized from ``max_memory_mb`` and folded into
+        fixed-size per-step histograms, so memory does not grow with
+        ``simulations``. ``method="bootstrap"`` resamples standardized residuals;
+        ``method="simulation"`` draws from the fitted error distribution.
+        """
+        if simulations < 1 or horizon < 1:
+            raise ValueError("simulations and horizon must both be at least 1.")
+        quantiles = np.asarray(quantiles, dtype=float)
+        if np.any((quantiles <= 0) | (quantiles >= 1)):
+            raise ValueError("quantiles must lie strictly between 0 and 1.")
+
+        state = self.stream_state or self.build_recursion_state()
+        rng = np.random.default_rng(seed)
+
+        if method == "bootstrap":
+            pool = self.standardized_residuals().to_numpy(dtype=float)
+
+            def draw(size):
+                return pool[rng.integers(0, len(pool), size=size)]
+
+        elif method == "simulation":
+            distribution = self.result.model.distribution
+            dist_params = self.result.params.to_numpy()[len(self.result.params) - distribution.num_params:]
+
+            def draw(size):
+                if self.dist_name == "normal":
+                    return rng.standard_normal(size)
+                if self.dist_name in {"t", "studentst"}:
+                    nu = dist_params[0]
+                    return rng.standard_t(nu, size) * np.sqrt((nu - 2) / nu)
+                return distribution.ppf(rng.random(size), dist_params)
+
+        else:
+            raise ValueError("method must be either 'simulation' or 'bootstrap'.")
+
+        budget_bytes = int(max_memory_mb * 1024**2)
+        n_arrays = 10 + len(state.alphas) + len(state.betas)
+        chunk_size = max(1, min(simulations, budget_bytes // (8 * n_arrays)))
+        pilot_size = max(1, min(simulations, chunk_size, PILOT_PATHS, budget_bytes // (24 * horizon)))
+
+        print(
+            f"\nSimulating {simulations:,} {method} paths over {horizon} steps "
+            f"in chunks of {chunk_size:,} (memory budget {max_memory_mb} MB)..."
+        )
+        bands = simulate_garch_bands(state, horizon, simulations, draw, quantiles, chunk_size, pilot_size)
+        return bands
+
+    @profiled("rolling_forecast")
+    def rolling_forecast(self, window=500, step=1, refit_every=20, p=None, q=None, mean=None, vol=None, dist=None):
+        """One-step-ahead variance forecasts from a rolling estimation window.
+
+        Parameters are re-estimated on every ``refit_every``-th forecast origin,
+        warm-started from the previous estimates. In between, the variance filter
+        is rerun on the current window with the parameters held fixed.
+        """
+        if window < 2 or window >= len(self.returns):
+            raise ValueError("window must be at least 2 and shorter than the return series.")
+        if step < 1 or refit_every < 1:
+            raise ValueError("step and refit_every must both be at least 1.")
+
+        default_order = self.selected_order or (1, 1)
+        p = p if p is not None else default_order[0]
+        q = q if q is not None else default_order[1]
+        mean = mean or self.mean_name or "Constant"
+        vol = vol or self.vol_name or "GARCH"
+        dist = dist or self.dist_name or "normal"
+
+        # One model over the full sample; each window is addressed through
+        # first_obs/last_obs so no arch_model is rebuilt per origin.
+        rolling_model = build_arch_model(self.returns, p=p, q=q, mean=mean, vol=vol, dist=dist)
+        same_spec = (
+            self.result is not None
+            and self.selected_order == (p, q)
+            and (self.mean_name, self.vol_name, self.dist_name) == (mean, vol, dist)
+        )
+        params = self.result.params if same_spec else None
+
+        origins = range(window, len(self.returns), step)
+        print(
+            f"\nRolling {vol}({p}, {q}) forecasts: {len(origins)} origins, window={window}, "
+            f"step={step}, refit every {refit_every} origin(s)..."
+        )
+
+        rows = []
+        for position, end in enumerate(origins):
+            first_obs = end - window
+            last_obs = end
+            refit = position % refit_every == 0
+
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                if refit:
+                    window_result = rolling_model.fit(
+                        first_obs=first_obs,
+                        last_obs=last_obs,
+                        starting_values=params,
+                        disp="off",
+                    )
+                    if params is not None and window_result.convergence_flag != 0:
+                        window_result = rolling_model.fit(first_obs=first_obs, last_obs=last_obs, disp="off")
+                    params = window_result.params
+                else:
+                    window_result = rolling_model.fix(params, first_obs=first_obs, last_obs=last_obs)
+
+                forecast = window_result.forecast(horizon=1, start=end - 1, reindex=False)
+
+            rows.append((self.returns.index[end], float(forecast.variance.iloc[0, 0]), refit))
+
+        forecast_df = pd.DataFrame(rows, columns=["forecast_date", "forecast_variance", "refit"]).set_index("forecast_date")
+        forecast_df.insert(1, "forecast_volatility", np.sqrt(forecast_df["forecast_variance"]))
+        return forecast_df
+
+    def build_recursion_state(self):
+        if self.result is None:
+            raise RuntimeError("Fit the model before streaming or simulating.")
+        if self.vol_name not in {"GARCH", "ARCH"}:
+            raise ValueError("Streaming updates and path simulation support GARCH and ARCH volatility models only.")
+        if self.mean_name not in {"Constant", "Zero"}:
+            raise ValueError("Streaming updates and path simulation support Constant and Zero mean models only.")
+
+        params = self.result.params
+        p, q = self.selected_order
+        q = q if self.vol_name == "GARCH" else 0
+        resid = self.result.resid.dropna().to_numpy()
+        variance = self.result.conditional_volatility.dropna().to_numpy() ** 2
+        next_variance = float(self.result.forecast(horizon=1, reindex=False).variance.iloc[-1, 0])
+
+        return GarchStreamState(
+            mu=float(params["mu"]) if self.mean_name == "Constant" else 0.0,
+            omega=float(params["omega"]),
+            alphas=[float(params[f"alpha[{lag}]"]) for lag in range(1, p + 1)],
+            betas=[float(params[f"beta[{lag}]"]) for lag in range(1, q + 1)],
+            return_type=self.return_type,
+            last_level=float(self.series.iloc[-1]),
+            recent_sq_resid=[float(value) ** 2 for value in resid[::-1][:p]],
+            recent_variance=[float(value) for value in variance[::-1][:q]],
+            last_variance=float(variance[-1]),
+            next_variance=next_variance,
+        )
+
+    def start_stream(self):
+        self.stream_state = self.build_recursion_state()
+        return self.stream_state
+
+    def update(self, new_observations, check_drift=False, drift_threshold=3.0, min_drift_observations=20):
+        """Advance the fitted variance recursion with new level observations.
+
+        Each observation costs O(p + q) arithmetic on the stored parameters; the
+        data file is not re-read and nothing is re-estimated. With
+        ``check_drift`` the returned ``refit_due`` flag is set once squared
+        standardised residuals since the fit deviate from their expected value
+        by more than ``drift_threshold`` standard errors.
+        """
+        state = self.stream_state or self.start_stream()
+
+        if np.isscalar(new_observations):
+            new_observations = (new_observations,)
+        elif isinstance(new_observations, (pd.Series, pd.DataFrame, np.ndarray)):
+            new_observations = np.asarray(new_observations, dtype=float).ravel().tolist()
+
+        accepted = 0
+        for level in new_observations:
+            level = float(level)
+            if level != level:
+                continue
+            accepted += state.push(level)
+
+        update = {
+            "accepted": accepted,
+            "observations_since_fit": state.observations,
+            "forecast_variance": state.next_variance,
+            "forecast_volatility": math.sqrt(state.next_variance),
+            "last_conditional_variance": state.last_variance,
+        }
+        if check_drift:
+            statistic = state.drift_statistic()
+            update["drift_statistic"] = statistic
+            update["refit_due"] = state.observations >= min_drift_observations and abs(statistic) > drift_threshold
+        return update
+
+    def variance_term_structure(self, horizon=252):
+        """Closed-form variance forecasts for steps 1..horizon in one vectorized pass.
+
+        Supports GARCH(1, 1), GJR(1, 1) and ARCH(1) with Constant or Zero mean.
+        The GJR asymmetry term enters the persistence with weight 1/2, as in
+        arch's analytic forecasts. Rows are indexed by step, not by date.
+        """
+        if self.result is None:
+            raise RuntimeError("Fit the model before building a term structure.")
+        if horizon < 1:
+            raise ValueError("horizon must be at least 1.")
+        if self.vol_name not in {"GARCH", "GJR", "ARCH"} or self.selected_order not in {(1, 1), (1, 0)}:
+            raise ValueError("The closed-form term structure supports GARCH(1, 1), GJR(1, 1) and ARCH(1) models only.")
+        if self.mean_name not in {"Constant", "Zero"}:
+            raise ValueError("The closed-form term structure supports Constant and Zero mean models only.")
+
+        params = self.result.params
+        omega = float(params["omega"])
+        alpha = float(params["alpha[1]"])
+        gamma = float(params["gamma[1]"]) if "gamma[1]" in params.index else 0.0
+        beta = float(params["beta[1]"]) if "beta[1]" in params.index else 0.0
+
+        last_resid = float(self.result.resid.dropna().iloc[-1])
+        last_variance = float(self.result.conditional_volatility.dropna().iloc[-1]) ** 2
+        next_variance = omega + (alpha + gamma * (last_resid < 0)) * last_resid**2 + beta * last_variance
+
+        step_variance, cumulative_variance = garch_term_structure(omega, alpha + 0.5 * gamma + beta, next_variance, horizon)
+        term_df = pd.DataFrame(
+            {
+                "step_variance": step_variance,
+                "step_volatility": np.sqrt(step_variance),
+                "cumulative_variance": cumulative_variance,
+                "cumulative_volatility": np.sqrt(cumulative_variance),
+            },
+            index=pd.RangeIndex(1, horizon + 1, name="horizon"),
+        )
+        return term_df
+
+    def multi_day_var(self, horizons=(10, 252), levels=DEFAULT_VAR_LEVELS, term_df=None):
+        """Value at Risk and Expected Shortfall of the aggregated return over each horizon.
+
+        The H-step log return is treated as normal with mean ``H * mu`` and the
+        cumulative variance from ``variance_term_structure``. Losses are
+        positive numbers in the same percent units as ``self.returns``.
+        """
+        horizons = [int(horizon) for horizon in np.atleast_1d(horizons)]
+        levels = np.asarray(levels, dtype=float)
+        if min(horizons) < 1:
+            raise ValueError("horizons must be at least 1.")
+        if np.any((levels <= 0) | (levels >= 1)):
+            raise ValueError("levels must lie strictly between 0 and 1.")
+
+        if term_df is None or len(term_df) < max(horizons):
+            term_df = self.variance_term_structure(max(horizons))
+        mu = float(self.result.params["mu"]) if self.mean_name == "Constant" else 0.0
+
+        positions = np.asarray(horizons) - 1
+        cumulative_variance = term_df["cumulative_variance"].to_numpy()[positions]
+        scale = np.sqrt(cumulative_variance)[:, None]
+        drift = mu * np.asarray(horizons, dtype=float)[:, None]
+        tail = norm.ppf(1 - levels)[None, :]
+        var_values = -(drift + scale * tail)
+        es_values = -drift + scale * norm.pdf(tail) / (1 - levels)[None, :]
+
+        columns = {"cumulative_variance": cumulative_variance, "cumulative_volatility": scale[:, 0]}
+        for position, level in enumerate(levels):
+            columns[f"var_{level:g}"] = var_values[:, position]
+            columns[f"es_{level:g}"] = es_values[:, position]
+        return pd.DataFrame(columns, index=pd.Index(horizons, name="horizon"))
+
     def standardized_residuals(self):
         if self.result is None:
             raise RuntimeError("Fit the model before requesting residuals.")
@@ -300,6 +1067,7 @@ class GarchModel:
 
         return "\n".join(lines), context
 
+    @profiled("create_team_report")
     def create_team_report(self, forecast_df, output_path="ovx_garch_report.png", recent_window=126, title=None):
         if self.result is None:
             raise RuntimeError("Fit the model before creating a report.")
@@ -397,6 +1165,157 @@ class GarchModel:
         return output_path
 
 
+def run_batch_item(data_path, args):
+    # Runs inside a worker process. Model chatter is captured so the parent can
+    # print one line per series, and failures come back as rows, not exceptions.
+    start = time.perf_counter()
+    row = {"source": str(data_path)}
+    profiler = StageProfiler(run_name=Path(data_path).stem) if args.profile else None
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            fit_cache = FitCache(args.cache_dir, max_entries=args.cache_size) if args.cache_dir else None
+            model = GarchModel(
+                data_path=str(data_path),
+                date_col=args.date_col,
+                value_col=args.value_col,
+                return_type=args.return_type,
+                fit_cache=fit_cache,
+                profiler=profiler,
+                resample_freq=args.resample_freq,
+                chunksize=args.chunksize,
+            )
+            if args.tournament:
+                model.select_best_spec(
+                    max_p=args.max_p,
+                    max_q=args.max_q,
+                    criterion=args.criterion,
+                    mean=args.mean,
+                    finalists=args.finalists,
+                )
+            elif args.select_order:
+                model.select_best_order(
+                    max_p=args.max_p,
+                    max_q=args.max_q,
+                    criterion=args.criterion,
+                    mean=args.mean,
+                    vol=args.vol,
+                    dist=args.dist,
+                )
+            else:
+                model.fit(p=args.p, q=args.q, mean=args.mean, vol=args.vol, dist=args.dist)
+            forecast_df = model.forecast(
+                horizon=args.horizon,
+                method=args.forecast_method,
+                simulations=args.simulations,
+                seed=args.seed,
+            )
+
+            report_path = None
+            if args.report_dir:
+                report_path = str(Path(args.report_dir) / f"{Path(data_path).stem}_garch_report.png")
+                model.create_team_report(forecast_df=forecast_df, output_path=report_path, recent_window=args.recent_window)
+
+        row.update(
+            {
+                "series_name": model.series_name,
+                "observations": int(len(model.returns)),
+                "start": model.format_label(model.series.index.min()),
+                "end": model.format_label(model.series.index.max()),
+                "model": f"{model.vol_name}{model.selected_order}",
+                "mean": model.mean_name,
+                "dist": model.dist_name,
+                "loglikelihood": float(model.result.loglikelihood),
+                "aic": float(model.result.aic),
+                "bic": float(model.result.bic),
+                "latest_cond_vol": float(model.result.conditional_volatility.dropna().iloc[-1]),
+            }
+        )
+        row.update({f"param_{name}": float(value) for name, value in model.result.params.items()})
+        row.update(
+            {f"forecast_vol_h{step}": float(value) for step, value in enumerate(forecast_df["forecast_volatility"], start=1)}
+        )
+        row["report_path"] = report_path
+        row["error"] = None
+    except Exception as exc:
+        row["error"] = f"{type(exc).__name__}: {exc}"
+    row["seconds"] = time.perf_counter() - start
+    if profiler is not None:
+        profiler.stop()
+        row["_stages"] = profiler.records
+    return row
+
+
+def write_summary_table(summary_df, output_path):
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if output_path.suffix.lower() == ".parquet":
+        summary_df.to_parquet(output_path, index=False)
+    else:
+        summary_df.to_csv(output_path, index=False)
+    return output_path
+
+
+def run_batch(args):
+    if Path(args.summary_path).suffix.lower() == ".parquet" and not (
+        importlib.util.find_spec("pyarrow") or importlib.util.find_spec("fastparquet")
+    ):
+        raise RuntimeError("Writing Parquet requires pyarrow or fastparquet; use a .csv summary path instead.")
+
+    inputs = resolve_batch_inputs(args.batch)
+    n_jobs = resolve_n_jobs(args.n_jobs, len(inputs))
+    if args.report_dir:
+        Path(args.report_dir).mkdir(parents=True, exist_ok=True)
+
+    print(f"Batch fitting {len(inputs)} series with {n_jobs} worker process(es)...")
+    started_at = time.time()
+    start = time.perf_counter()
+
+    if n_jobs > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            futures = [executor.submit(run_batch_item, data_path, args) for data_path in inputs]
+            rows = []
+            for future in futures:
+                rows.append(future.result())
+                print_batch_row(rows[-1])
+    else:
+        rows = []
+        for data_path in inputs:
+            rows.append(run_batch_item(data_path, args))
+            print_batch_row(rows[-1])
+
+    stage_records = [record for row in rows for record in row.pop("_stages", [])]
+    summary_df = pd.DataFrame(rows)
+    output_path = write_summary_table(summary_df, args.summary_path)
+    failures = int(summary_df["error"].notna().sum())
+    print(
+        f"\nSaved batch summary for {len(rows) - failures} series ({failures} failed) to {output_path} "
+        f"in {time.perf_counter() - start:.1f}s"
+    )
+    if args.profile:
+        emit_profile(args, stage_records, started_at, extra={"mode": "batch", "series": len(rows), "workers": n_jobs})
+    return summary_df
+
+
+def emit_profile(args, stage_records, started_at, extra=None):
+    run_record = build_run_record(stage_records, command=sys.argv, started_at=started_at, extra=extra)
+    profile_path = write_run_record(run_record, args.profile_path)
+    print(f"Saved stage profile to {profile_path}")
+    if args.trace_path:
+        trace_path = write_chrome_trace(stage_records, args.trace_path)
+        print(f"Saved Chrome trace to {trace_path}")
+
+
+def print_batch_row(row):
+    name = Path(row["source"]).name
+    if row.get("error"):
+        print(f"  {name}: failed after {row['seconds']:.2f}s -> {row['error']}")
+    else:
+        print(
+            f"  {name}: {row['model']} AIC={row['aic']:.2f} BIC={row['bic']:.2f} "
+            f"latest vol={row['latest_cond_vol']:.2f}% ({row['seconds']:.2f}s)"
+        )
+
+
 def build_parser():
     parser = argparse.ArgumentParser(description="Fit a GARCH model to a univariate time series.")
     parser.add_argument(
@@ -413,6 +1332,13 @@ def build_parser():
         default="log",
         help="Return transformation to fit the volatility model on.",
     )
+    parser.add_argument(
+        "--resample-freq",
+        choices=sorted(RESAMPLE_PERIODS),
+        default=None,
+        help="Stream a large intraday file in chunks and fit on period closes at this frequency.",
+    )
+    parser.add_argument("--chunksize", type=int, default=500_000, help="Rows per chunk with --resample-freq.")
     parser.add_argument("--p", type=int, default=1, help="ARCH lag order.")
     parser.add_argument("--q", type=int, default=1, help="GARCH lag order.")
     parser.add_argument(
@@ -420,8 +1346,20 @@ def build_parser():
         action="store_true",
         help="Search for the best (p, q) order instead of using --p and --q directly.",
     )
+    parser.add_argument(
+        "--tournament",
+        action="store_true",
+        help="Run a successive-halving search over GARCH, GJR, EGARCH and FIGARCH with normal, t and skew-t errors.",
+    )
+    parser.add_argument("--finalists", type=int, default=3, help="Specs fitted on the full sample in tournament mode.")
     parser.add_argument("--max-p", type=int, default=3, help="Maximum ARCH lag to test during order selection.")
     parser.add_argument("--max-q", type=int, default=3, help="Maximum GARCH lag to test during order selection.")
+    parser.add_argument(
+        "--n-jobs",
+        type=int,
+        default=DEFAULT_N_JOBS,
+        help="Worker processes for order selection, or for series in batch mode. Use 0 for one per CPU core.",
+    )
     parser.add_argument(
         "--criterion",
         choices=["aic", "bic"],
@@ -432,12 +1370,68 @@ def build_parser():
     parser.add_argument("--vol", default="GARCH", help="Volatility model passed to arch_model.")
     parser.add_argument("--dist", default="normal", help="Error distribution passed to arch_model.")
     parser.add_argument("--horizon", type=int, default=10, help="Forecast horizon.")
+    parser.add_argument(
+        "--forecast-method",
+        choices=["analytic", "simulation", "bootstrap"],
+        default="analytic",
+        help="Analytic variance path, or quantile bands from simulated/bootstrapped paths.",
+    )
+    parser.add_argument(
+        "--var-horizons",
+        type=int,
+        nargs="+",
+        default=None,
+        help="Print closed-form multi-day VaR/ES for these horizons, e.g. 10 252. GARCH(1, 1)-type models only.",
+    )
+    parser.add_argument("--simulations", type=int, default=10_000, help="Number of paths for simulated forecasts.")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for simulated forecasts.")
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Directory for the on-disk fit cache. Caching is disabled when omitted.",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=256,
+        help="Maximum number of cached fits kept before least-recently-used entries are evicted.",
+    )
     parser.add_argument("--plot", action="store_true", help="Show series, returns, and volatility plots.")
     parser.add_argument(
         "--report-path",
         default=None,
         help="Optional PNG path for a team-ready visual report.",
     )
+    parser.add_argument(
+        "--batch",
+        default=None,
+        help="Glob pattern or directory of CSV/XLSX files to fit in one run instead of --data-path.",
+    )
+    parser.add_argument(
+        "--summary-path",
+        default="garch_batch_summary.csv",
+        help="Consolidated batch summary table (.csv or .parquet).",
+    )
+    parser.add_argument(
+        "--report-dir",
+        default=None,
+        help="Optional directory for per-series PNG reports in batch mode, rendered by the workers.",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Record wall time, CPU time and peak memory per stage and write a JSON run record.",
+    )
+    parser.add_argument(
+        "--profile-path",
+        default="garch_profile.json",
+        help="Output path for the JSON stage profile when --profile is set.",
+    )
+    parser.add_argument(
+        "--trace-path",
+        default=None,
+        help="Optional Chrome trace (chrome://tracing / Perfetto) output path when --profile is set.",
+    )
     parser.add_argument(
         "--recent-window",
         type=int,
@@ -449,19 +1443,38 @@ def build_parser():
 
 def main():
     args = build_parser().parse_args()
+    if args.batch:
+        run_batch(args)
+        return
+
+    fit_cache = FitCache(args.cache_dir, max_entries=args.cache_size) if args.cache_dir else None
+    profiler = StageProfiler(run_name=Path(args.data_path).stem) if args.profile else None
     model = GarchModel(
         data_path=args.data_path,
         date_col=args.date_col,
         value_col=args.value_col,
         return_type=args.return_type,
         series_name=args.series_name,
+        fit_cache=fit_cache,
+        profiler=profiler,
+        resample_freq=args.resample_freq,
+        chunksize=args.chunksize,
     )
 
     if args.plot:
         model.plot_series()
         model.plot_returns()
 
-    if args.select_order:
+    if args.tournament:
+        model.select_best_spec(
+            max_p=args.max_p,
+            max_q=args.max_q,
+            criterion=args.criterion,
+            mean=args.mean,
+            finalists=args.finalists,
+            n_jobs=args.n_jobs,
+        )
+    elif args.select_order:
         model.select_best_order(
             max_p=args.max_p,
             max_q=args.max_q,
@@ -469,6 +1482,7 @@ def main():
             mean=args.mean,
             vol=args.vol,
             dist=args.dist,
+            n_jobs=args.n_jobs,
         )
     else:
         model.fit(p=args.p, q=args.q, mean=args.mean, vol=args.vol, dist=args.dist)
@@ -476,10 +1490,20 @@ def main():
     if args.plot:
         model.plot_conditional_volatility()
 
-    forecast_df = model.forecast(horizon=args.horizon)
+    forecast_df = model.forecast(
+        horizon=args.horizon,
+        method=args.forecast_method,
+        simulations=args.simulations,
+        seed=args.seed,
+    )
     outlook_text, _ = model.explain_outlook(forecast_df)
     print("\n" + outlook_text)
 
+    if args.var_horizons:
+        var_df = model.multi_day_var(horizons=args.var_horizons)
+        print("\nMulti-day VaR and Expected Shortfall (% log return, normal aggregation):")
+        print(var_df)
+
     if args.report_path:
         model.create_team_report(
             forecast_df=forecast_df,
@@ -487,6 +1511,10 @@ def main():
             recent_window=args.recent_window,
         )
 
+    if profiler is not None:
+        profiler.stop()
+        emit_profile(args, profiler.records, profiler.started_at, extra={"mode": "single"})
+
 
 if __name__ == "__main__":
     main()
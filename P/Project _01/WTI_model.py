@@ -17,9 +17,19 @@
    4. Historical oil surge comparison panel
    5. White HAC-robust standard errors
    6. Full dashboard PNG + Excel report
+
+ The model runs as a chain of cached stages (see build_pipeline). Editing one
+ stage re-runs only that stage and the ones after it:
+
+   python WTI_model.py                          # everything, cached
+   python WTI_model.py --stages scenarios       # scenarios + cached inputs
+   python WTI_model.py --force garch --timings  # refit GARCH, show timings
+   python WTI_model.py --stages monte_carlo     # simulated scenario fans
+   python WTI_model.py --stages scenario_grid   # OVX × DXY × VIX shock sweep
 =============================================================================
 """
 
+import argparse
 import importlib.util
 import os
 import warnings
@@ -40,12 +50,17 @@ import matplotlib.patches as mpatches
 from matplotlib.ticker import FuncFormatter
 from scipy import stats
 from scipy.linalg import lstsq
-from scipy.optimize import minimize
+
+from garch_kernel import GARCH11_BOUNDS, GARCH11_START, fit_garch11, garch11_variance
+from hac import hac_vcov
+from scenario_sim import (DEFAULT_CHUNK_SIZE, DEFAULT_N_PATHS, INNOVATION_METHODS, build_shock_grid,
+                          fit_innovations, scenario_grid, simulate_scenarios)
+from stage_cache import DEFAULT_STAGE_CACHE_DIR, Pipeline, file_signature
+from time_series_utils import load_workbook_sheets
 warnings.filterwarnings("ignore")
 
 PATH = os.path.join(BASE_DIR, "crude_oil_data_v2.xlsx")
 OUT  = os.environ.get("WTI_MODEL_OUTPUT_DIR", os.path.join(BASE_DIR, "outputs"))
-os.makedirs(OUT, exist_ok=True)
 
 # ── Palette ────────────────────────────────────────────────────────────────
 C = {
@@ -57,98 +72,25 @@ C = {
     "bull":   "#1B5E20", "base":  "#1565C0", "bear":  "#B71C1C",
 }
 
-print("=" * 70)
-print("  WTI CRUDE OIL — OIL SURGE FORECASTING MODEL")
-print("  ARIMAX-GARCH | Real Data 2010-2019 | Forward Projection Apr 2026")
-print("=" * 70)
-
-# ═══════════════════════════════════════════════════════════════════════════
-# BLOCK 1 — LOAD & MERGE REAL DATA
-# ═══════════════════════════════════════════════════════════════════════════
-def load_sheet(sheet, date_col=0):
-    df = pd.read_excel(PATH, sheet_name=sheet, parse_dates=[date_col])
-    df.columns = [str(c) for c in df.columns]
-    dc = df.columns[date_col]
-    df[dc] = pd.to_datetime(df[dc], errors="coerce")
-    return df.dropna(subset=[dc]).set_index(dc)
-
-print("\n[1] Loading real data...")
-def load_required_sheet(sheet, required_cols):
-    df = load_sheet(sheet)
-    missing_cols = [col for col in required_cols if col not in df.columns]
-    if missing_cols:
-        raise ValueError(f"Sheet '{sheet}' is missing columns: {missing_cols}")
-    return df
-
-wti       = load_required_sheet("WTI_Price", ["WTI_Close"])
-vix       = load_required_sheet("VIX", ["VIX_Close"])
-sp500     = load_required_sheet("SP500", ["SP500_Close"])
-dxy       = load_required_sheet("DXY", ["DXY_Close"])
-tsy       = load_required_sheet("Treasury_10Y", ["UST_10Y_Yield"])
-ovx       = load_required_sheet("OVX", ["OVX_Close"])
-gold      = load_required_sheet("Gold", ["Gold_Close"])
-brent_wti = load_required_sheet("Brent_WTI_Spread", ["Brent_WTI_Spread"])
-crack     = load_required_sheet("Crack_Spread", ["Crack_Spread_321"])
-brent     = load_required_sheet("Brent", ["Brent_Close"])
-natgas    = load_required_sheet("NatGas_HenryHub", ["NatGas_Close"])
-copper    = load_required_sheet("Copper", ["Copper_Close"])
-
-weekly_idx = pd.date_range("2010-01-08", "2019-12-27", freq="W-FRI")
+# Sheet → columns the model needs, in the order they join the weekly master.
+REQUIRED_SHEETS = {
+    "WTI_Price":        ["WTI_Close"],
+    "VIX":              ["VIX_Close"],
+    "SP500":            ["SP500_Close"],
+    "DXY":              ["DXY_Close"],
+    "Treasury_10Y":     ["UST_10Y_Yield"],
+    "OVX":              ["OVX_Close"],
+    "Gold":             ["Gold_Close"],
+    "Brent_WTI_Spread": ["Brent_WTI_Spread"],
+    "Crack_Spread":     ["Crack_Spread_321"],
+    "Brent":            ["Brent_Close"],
+    "NatGas_HenryHub":  ["NatGas_Close"],
+    "Copper":           ["Copper_Close"],
+}
 
-def to_weekly(df): return df.resample("W-FRI").last()
-def fwd_fill(df):  return df.reindex(weekly_idx, method="ffill")
-def align_wk(df):  return df.reindex(weekly_idx, method="ffill")
-
-master = pd.DataFrame(index=weekly_idx)
-master = master.join(to_weekly(wti[["WTI_Close"]]), how="left")
-master = master.join(to_weekly(vix[["VIX_Close"]]), how="left")
-master = master.join(to_weekly(sp500[["SP500_Close"]]), how="left")
-master = master.join(to_weekly(dxy[["DXY_Close"]]), how="left")
-master = master.join(to_weekly(tsy[["UST_10Y_Yield"]]), how="left")
-master = master.join(to_weekly(ovx[["OVX_Close"]]), how="left")
-master = master.join(to_weekly(gold[["Gold_Close"]]), how="left")
-master = master.join(to_weekly(brent_wti[["Brent_WTI_Spread"]]), how="left")
-master = master.join(to_weekly(crack[["Crack_Spread_321"]]), how="left")
-master = master.join(to_weekly(brent[["Brent_Close"]]), how="left")
-master = master.join(to_weekly(natgas[["NatGas_Close"]]), how="left")
-master = master.join(to_weekly(copper[["Copper_Close"]]), how="left")
-
-# OPEC cut dummy
-opec_cut = pd.Series(0, index=weekly_idx, name="OPEC_Cut")
-for d in weekly_idx:
-    ds = str(d.date())
-    if ("2011-11-01" <= ds <= "2014-06-30") or ("2016-12-01" <= ds <= "2019-12-31"):
-        opec_cut[d] = 1
-master = master.join(opec_cut.to_frame(), how="left")
-
-master.ffill(limit=2, inplace=True)
-master.dropna(subset=["WTI_Close"], inplace=True)
-
-# Stationary transforms
-master["LogWTI"]         = np.log(master["WTI_Close"]  / master["WTI_Close"].shift(1))
-master["LogSP500"]       = np.log(master["SP500_Close"] / master["SP500_Close"].shift(1))
-master["LogGold"]        = np.log(master["Gold_Close"]  / master["Gold_Close"].shift(1))
-master["LogOVX"]         = np.log(master["OVX_Close"]   / master["OVX_Close"].shift(1))
-master["LogNatGas"]      = np.log(master["NatGas_Close"] / master["NatGas_Close"].shift(1))
-master["LogCopper"]      = np.log(master["Copper_Close"] / master["Copper_Close"].shift(1))
-master["DeltaVIX"]       = master["VIX_Close"].diff()
-master["DeltaTsy"]       = master["UST_10Y_Yield"].diff()
-master["DeltaDXY"]       = master["DXY_Close"].diff()
-master["DeltaCrack"]     = master["Crack_Spread_321"].diff()
-master["DeltaBrentWTI"]  = master["Brent_WTI_Spread"].diff()
-master.dropna(subset=["LogWTI"], inplace=True)
-
-N = len(master)
+WEEKLY_RANGE = ("2010-01-08", "2019-12-27")
+OPEC_CUT_WINDOWS = (("2011-11-01", "2014-06-30"), ("2016-12-01", "2019-12-31"))
 TRAIN_END = "2016-12-31"
-train = master.loc[:TRAIN_END].copy()
-test  = master.loc["2017-01-01":].copy()
-N_tr, N_te = len(train), len(test)
-print(f"    Master : {N} weekly obs  |  Train: {N_tr}  |  Test: {N_te}")
-
-# ═══════════════════════════════════════════════════════════════════════════
-# BLOCK 2 — ARIMAX MODEL (6 significant variables from prior run)
-# ═══════════════════════════════════════════════════════════════════════════
-print("\n[2] Fitting ARIMAX model on real data...")
 
 EXOG = [
     ("LogOVX",        "ΔLog OVX"),
@@ -162,8 +104,6 @@ EXOG = [
     ("LogNatGas",     "ΔLog Nat Gas"),
     ("LogCopper",     "ΔLog Copper"),
 ]
-exog_cols   = [e[0] for e in EXOG]
-exog_labels = [e[1] for e in EXOG]
 
 EXPECTED_SIGN = {
     "LogOVX": -1,
@@ -191,6 +131,31 @@ EXPECTED_SIGN_TEXT = {
     "LogCopper": "+(growth proxy↑)",
 }
 
+H = 26   # 26 weeks = ~6 months
+FORECAST_START = "2026-04-04"
+
+MONTE_CARLO = {
+    "n_paths": DEFAULT_N_PATHS,
+    "innovations": "bootstrap",
+    "chunk_size": DEFAULT_CHUNK_SIZE,
+    "seed": 7,
+    "n_jobs": 1,
+}
+
+# Scenario grid: constant weekly shocks swept over (low, high) for each variable.
+SHOCK_GRID = {
+    "base_scenario": "base",
+    "axes": {"LogOVX": (-0.05, 0.05), "DeltaDXY": (-0.5, 0.5), "DeltaVIX": (-1.5, 1.5)},
+    "points": 20,
+}
+
+SURGES = {
+    "2010–11 Recovery":  ("2010-06-25", "2011-04-29"),
+    "2016–18 OPEC Rally":("2016-01-22", "2018-10-05"),
+    "2010 Initial Rally":("2010-01-08", "2010-12-31"),
+}
+
+
 def sig_stars(p):
     return "***" if p < 0.01 else "**" if p < 0.05 else "*" if p < 0.10 else ""
 
@@ -199,6 +164,58 @@ def sign_match(value, expected_direction):
         return "—"
     return "✓" if np.sign(value) == expected_direction else "✗"
 
+# ═══════════════════════════════════════════════════════════════════════════
+# BLOCK 1 — LOAD & MERGE REAL DATA
+# ═══════════════════════════════════════════════════════════════════════════
+def load_sheets(path, source, required_sheets):
+    # ``source`` (size + mtime of the workbook) is only there to key the cache.
+    # Repeat runs read the sheets from the workbook's NPZ sidecar.
+    print("\n[1] Loading real data...")
+    sheets = load_workbook_sheets(path, required_sheets)
+    return {sheet: sheets[sheet] for sheet in required_sheets}
+
+def to_weekly(df): return df.resample("W-FRI").last()
+
+def build_weekly(sheets, required_sheets, weekly_range, opec_cut_windows, train_end):
+    weekly_idx = pd.date_range(*weekly_range, freq="W-FRI")
+
+    master = pd.DataFrame(index=weekly_idx)
+    for sheet, cols in required_sheets.items():
+        master = master.join(to_weekly(sheets[sheet][cols]), how="left")
+
+    # OPEC cut dummy
+    opec_cut = pd.Series(0, index=weekly_idx, name="OPEC_Cut")
+    for d in weekly_idx:
+        ds = str(d.date())
+        if any(start <= ds <= end for start, end in opec_cut_windows):
+            opec_cut[d] = 1
+    master = master.join(opec_cut.to_frame(), how="left")
+
+    master.ffill(limit=2, inplace=True)
+    master.dropna(subset=["WTI_Close"], inplace=True)
+
+    # Stationary transforms
+    master["LogWTI"]         = np.log(master["WTI_Close"]  / master["WTI_Close"].shift(1))
+    master["LogSP500"]       = np.log(master["SP500_Close"] / master["SP500_Close"].shift(1))
+    master["LogGold"]        = np.log(master["Gold_Close"]  / master["Gold_Close"].shift(1))
+    master["LogOVX"]         = np.log(master["OVX_Close"]   / master["OVX_Close"].shift(1))
+    master["LogNatGas"]      = np.log(master["NatGas_Close"] / master["NatGas_Close"].shift(1))
+    master["LogCopper"]      = np.log(master["Copper_Close"] / master["Copper_Close"].shift(1))
+    master["DeltaVIX"]       = master["VIX_Close"].diff()
+    master["DeltaTsy"]       = master["UST_10Y_Yield"].diff()
+    master["DeltaDXY"]       = master["DXY_Close"].diff()
+    master["DeltaCrack"]     = master["Crack_Spread_321"].diff()
+    master["DeltaBrentWTI"]  = master["Brent_WTI_Spread"].diff()
+    master.dropna(subset=["LogWTI"], inplace=True)
+
+    train = master.loc[:train_end].copy()
+    test  = master.loc[pd.Timestamp(train_end) + pd.Timedelta(days=1):].copy()
+    print(f"    Master : {len(master)} weekly obs  |  Train: {len(train)}  |  Test: {len(test)}")
+    return {"master": master, "train": train, "test": test}
+
+# ═══════════════════════════════════════════════════════════════════════════
+# BLOCK 2 — ARIMAX MODEL (6 significant variables from prior run)
+# ═══════════════════════════════════════════════════════════════════════════
 def build_XY(df, cols):
     y    = df["LogWTI"].values.copy()
     lag1 = np.roll(y, 1); lag1[0] = 0
@@ -209,111 +226,110 @@ def build_XY(df, cols):
         exogs.append(v)
     return np.column_stack([np.ones(len(y)), lag1, lag2, *exogs]), y
 
-X_tr, y_tr = build_XY(train, exog_cols)
-X_te, y_te = build_XY(test,  exog_cols)
-X_te[0, 1] = y_tr[-1]; X_te[0, 2] = y_tr[-2]; X_te[1, 2] = y_tr[-1]
-
-beta, *_ = lstsq(X_tr, y_tr)
-resid_tr  = y_tr - X_tr @ beta
-resid_te  = y_te - X_te @ beta
-
-# White HAC robust SEs (Newey-West, lag=4)
-n_obs, k = X_tr.shape
-sigma2  = (resid_tr @ resid_tr) / (n_obs - k)
-XtX_inv = np.linalg.pinv(X_tr.T @ X_tr)
-
 # Newey-West bandwidth = 4 (quarterly at weekly freq)
-def newey_west_vcov(X, e, lags=4):
-    n, k = X.shape
-    S = np.zeros((k, k))
-    for t in range(n):
-        S += e[t]**2 * np.outer(X[t], X[t])
-    for l in range(1, lags+1):
-        w = 1 - l/(lags+1)
-        Gl = sum(e[t]*e[t-l] * np.outer(X[t], X[t-l]) for t in range(l, n))
-        S += w * (Gl + Gl.T)
-    return XtX_inv @ S @ XtX_inv
-
-vcov_hac = newey_west_vcov(X_tr, resid_tr, lags=4)
-se_hac   = np.sqrt(np.maximum(0, np.diag(vcov_hac)))
-t_hac    = beta / se_hac
-p_hac    = 2 * (1 - stats.t.cdf(np.abs(t_hac), df=n_obs - k))
-
-col_names = ["Constant","AR(1)","AR(2)"] + exog_labels
-
-# R²
-ss_res = resid_tr @ resid_tr
-ss_tot = np.sum((y_tr - y_tr.mean())**2)
-r2     = 1 - ss_res/ss_tot
-adj_r2 = 1 - (1-r2)*(n_obs-1)/(n_obs-k-1)
-aic    = n_obs*np.log(ss_res/n_obs) + 2*k
-bic    = n_obs*np.log(ss_res/n_obs) + k*np.log(n_obs)
-
-print(f"    R² = {r2:.4f}  |  Adj.R² = {adj_r2:.4f}  |  AIC = {aic:.1f}  |  BIC = {bic:.1f}")
-print(f"\n    {'Variable':<24} {'β':>10} {'HAC SE':>9} {'t':>8} {'p':>9}  Sig")
-print(f"    {'─'*68}")
-for nm,b,s,t,p in zip(col_names, beta, se_hac, t_hac, p_hac):
-    sig = "***" if p<0.01 else "**" if p<0.05 else "*" if p<0.10 else "—"
-    print(f"    {nm:<24} {b:>+10.5f} {s:>9.5f} {t:>8.3f} {p:>9.4f}  {sig}")
+def newey_west_vcov(X, e, bread, lags=4):
+    # Bartlett kernel with bandwidth lags + 1 is the classic Newey-West estimator.
+    return hac_vcov(X, e, kernel="bartlett", bandwidth=lags + 1, bread=bread)
+
+def fit_arimax(weekly, exog):
+    print("\n[2] Fitting ARIMAX model on real data...")
+    exog_cols   = [e[0] for e in exog]
+    exog_labels = [e[1] for e in exog]
+
+    X_tr, y_tr = build_XY(weekly["train"], exog_cols)
+    X_te, y_te = build_XY(weekly["test"],  exog_cols)
+    X_te[0, 1] = y_tr[-1]; X_te[0, 2] = y_tr[-2]; X_te[1, 2] = y_tr[-1]
+
+    beta, *_ = lstsq(X_tr, y_tr)
+    resid_tr  = y_tr - X_tr @ beta
+
+    # White HAC robust SEs (Newey-West, lag=4)
+    n_obs, k = X_tr.shape
+    XtX_inv = np.linalg.pinv(X_tr.T @ X_tr)
+
+    vcov_hac = newey_west_vcov(X_tr, resid_tr, XtX_inv, lags=4)
+    se_hac   = np.sqrt(np.maximum(0, np.diag(vcov_hac)))
+    t_hac    = beta / se_hac
+    p_hac    = 2 * (1 - stats.t.cdf(np.abs(t_hac), df=n_obs - k))
+
+    col_names = ["Constant","AR(1)","AR(2)"] + exog_labels
+
+    # R²
+    ss_res = resid_tr @ resid_tr
+    ss_tot = np.sum((y_tr - y_tr.mean())**2)
+    r2     = 1 - ss_res/ss_tot
+    adj_r2 = 1 - (1-r2)*(n_obs-1)/(n_obs-k-1)
+    aic    = n_obs*np.log(ss_res/n_obs) + 2*k
+    bic    = n_obs*np.log(ss_res/n_obs) + k*np.log(n_obs)
+
+    print(f"    R² = {r2:.4f}  |  Adj.R² = {adj_r2:.4f}  |  AIC = {aic:.1f}  |  BIC = {bic:.1f}")
+    print(f"\n    {'Variable':<24} {'β':>10} {'HAC SE':>9} {'t':>8} {'p':>9}  Sig")
+    print(f"    {'─'*68}")
+    for nm,b,s,t,p in zip(col_names, beta, se_hac, t_hac, p_hac):
+        sig = "***" if p<0.01 else "**" if p<0.05 else "*" if p<0.10 else "—"
+        print(f"    {nm:<24} {b:>+10.5f} {s:>9.5f} {t:>8.3f} {p:>9.4f}  {sig}")
+
+    # Exogenous drivers ranked by |t|, for the dashboard and the summary
+    importance = sorted(zip(exog_labels, np.abs(t_hac[3:]), p_hac[3:], beta[3:]),
+                        key=lambda x: x[1], reverse=True)
+
+    return {
+        "exog_cols": exog_cols, "exog_labels": exog_labels, "col_names": col_names,
+        "beta": beta, "se_hac": se_hac, "t_hac": t_hac, "p_hac": p_hac,
+        "resid_tr": resid_tr, "X_te": X_te, "y_te": y_te,
+        "r2": r2, "adj_r2": adj_r2, "aic": aic, "bic": bic,
+        "importance": importance,
+    }
 
 # ═══════════════════════════════════════════════════════════════════════════
 # BLOCK 3 — GARCH(1,1) on residuals
 # ═══════════════════════════════════════════════════════════════════════════
-print("\n[3] Fitting GARCH(1,1) on ARIMAX residuals...")
-
-def garch11_nll(params, r):
-    omega, alpha, beta_g = params
-    if omega<=0 or alpha<0 or beta_g<0 or alpha+beta_g>=0.9999:
-        return 1e10
-    n  = len(r)
-    h  = np.var(r)
-    ll = 0.0
-    for t in range(n):
-        if t > 0:
-            h = omega + alpha*r[t-1]**2 + beta_g*h
-        if h <= 0:
-            return 1e10
-        ll += 0.5*(np.log(2*np.pi*h) + r[t]**2/h)
-    return ll
-
-res_g = minimize(garch11_nll, [1e-5, 0.08, 0.88],
-                 args=(resid_tr,), method="L-BFGS-B",
-                 bounds=[(1e-8,None),(1e-5,0.45),(1e-5,0.95)])
-omega_g, alpha_g, beta_g = res_g.x
-persist = alpha_g + beta_g
-uncond_var = omega_g / (1 - persist)
-half_life  = np.log(0.5) / np.log(persist)
-
-# Conditional variance series
-h_series = np.zeros(N_tr)
-h_series[0] = np.var(resid_tr)
-for t in range(1, N_tr):
-    h_series[t] = omega_g + alpha_g*resid_tr[t-1]**2 + beta_g*h_series[t-1]
-cond_vol = np.sqrt(h_series) * np.sqrt(52) * 100   # annualised %
-
-# Last known h
-h_last = h_series[-1]
-
-print(f"    ω = {omega_g:.6f}  α = {alpha_g:.4f}  β = {beta_g:.4f}")
-print(f"    Persistence (α+β)    = {persist:.4f}")
-print(f"    Half-life of shocks  = {half_life:.1f} weeks")
-print(f"    Long-run annual vol  = {np.sqrt(uncond_var)*np.sqrt(52)*100:.2f}%")
-print(f"    Current cond. vol    = {cond_vol[-1]:.2f}% p.a.")
-
-# Forecast accuracy on test set
-y_hat_te = X_te @ beta
-last_p   = train["WTI_Close"].iloc[-1]
-price_fc = np.zeros(N_te)
-price_fc[0] = last_p * np.exp(y_hat_te[0])
-for i in range(1, N_te): price_fc[i] = price_fc[i-1] * np.exp(y_hat_te[i])
-price_ac = test["WTI_Close"].values
-mae   = np.mean(np.abs(price_fc - price_ac))
-mape  = np.mean(np.abs((price_fc - price_ac)/price_ac))*100
-dstat = np.mean(np.sign(y_hat_te)==np.sign(y_te))*100
-rmse  = np.sqrt(np.mean((price_fc-price_ac)**2))
-rw    = last_p*np.ones(N_te)
-theilu= rmse / np.sqrt(np.mean((rw-price_ac)**2))
-print(f"\n    Test MAPE={mape:.2f}%  DirAcc={dstat:.1f}%  Theil's U={theilu:.3f}")
+def fit_garch(arimax, start, bounds):
+    print("\n[3] Fitting GARCH(1,1) on ARIMAX residuals...")
+
+    resid_tr = arimax["resid_tr"]
+    res_g = fit_garch11(resid_tr, start=start, bounds=bounds)
+    omega_g, alpha_g, beta_g = res_g.x
+    persist = alpha_g + beta_g
+    uncond_var = omega_g / (1 - persist)
+    half_life  = np.log(0.5) / np.log(persist)
+
+    # Conditional variance series
+    h_series = garch11_variance(res_g.x, resid_tr)
+    cond_vol = np.sqrt(h_series) * np.sqrt(52) * 100   # annualised %
+
+    print(f"    ω = {omega_g:.6f}  α = {alpha_g:.4f}  β = {beta_g:.4f}")
+    print(f"    Persistence (α+β)    = {persist:.4f}")
+    print(f"    Half-life of shocks  = {half_life:.1f} weeks")
+    print(f"    Long-run annual vol  = {np.sqrt(uncond_var)*np.sqrt(52)*100:.2f}%")
+    print(f"    Current cond. vol    = {cond_vol[-1]:.2f}% p.a.")
+
+    return {
+        "omega": omega_g, "alpha": alpha_g, "beta": beta_g,
+        "persist": persist, "uncond_var": uncond_var, "half_life": half_life,
+        "h_series": h_series, "cond_vol": cond_vol,
+        "h_last": h_series[-1],   # last known h
+    }
+
+def backtest(weekly, arimax):
+    # Forecast accuracy on test set
+    train, test = weekly["train"], weekly["test"]
+    y_te = arimax["y_te"]
+    N_te = len(test)
+    y_hat_te = arimax["X_te"] @ arimax["beta"]
+    last_p   = train["WTI_Close"].iloc[-1]
+    price_fc = np.zeros(N_te)
+    price_fc[0] = last_p * np.exp(y_hat_te[0])
+    for i in range(1, N_te): price_fc[i] = price_fc[i-1] * np.exp(y_hat_te[i])
+    price_ac = test["WTI_Close"].values
+    mae   = np.mean(np.abs(price_fc - price_ac))
+    mape  = np.mean(np.abs((price_fc - price_ac)/price_ac))*100
+    dstat = np.mean(np.sign(y_hat_te)==np.sign(y_te))*100
+    rmse  = np.sqrt(np.mean((price_fc-price_ac)**2))
+    rw    = last_p*np.ones(N_te)
+    theilu= rmse / np.sqrt(np.mean((rw-price_ac)**2))
+    print(f"\n    Test MAPE={mape:.2f}%  DirAcc={dstat:.1f}%  Theil's U={theilu:.3f}")
+    return {"mae": mae, "mape": mape, "dstat": dstat, "rmse": rmse, "theilu": theilu}
 
 # ═══════════════════════════════════════════════════════════════════════════
 # BLOCK 4 — CURRENT MARKET CONDITIONS (Apr 2026)
@@ -321,52 +337,48 @@ print(f"\n    Test MAPE={mape:.2f}%  DirAcc={dstat:.1f}%  Theil's U={theilu:.3f}
 #   WTI ~$99-101, Brent ~$103, OVX ~45, VIX ~22, DXY ~104
 #   Hormuz partial disruption, US-Iran military action, OPEC+ holding cuts
 # ═══════════════════════════════════════════════════════════════════════════
-print("\n[4] Setting current market conditions (Apr 2026)...")
-
-# Last observed values in dataset (Dec 2019)
-last_wti    = master["WTI_Close"].iloc[-1]          # $61.68
-last_ovx    = master["OVX_Close"].iloc[-1]           # 25.86
-last_tsy    = master["UST_10Y_Yield"].iloc[-1]       # 1.895
-last_dxy    = master["DXY_Close"].iloc[-1]            # 96.74
-last_gold   = master["Gold_Close"].iloc[-1]           # 1514.5
-last_bwti   = master["Brent_WTI_Spread"].iloc[-1]    # 6.76
-last_crack  = master["Crack_Spread_321"].iloc[-1]
-last_natgas = master["NatGas_Close"].iloc[-1]
-last_copper = master["Copper_Close"].iloc[-1]
-
-# Current Apr 2026 values (from EIA March 2026 STEO + market data)
-curr_wti   = 100.0    # WTI spot ~$100 post-Hormuz spike
-curr_ovx   = 47.0     # OVX elevated (oil fear spike)
-curr_tsy   = 4.35     # 10Y yield (current)
-curr_dxy   = 104.5    # DXY stronger dollar
-curr_gold  = 3050.0   # Gold near ATH
-curr_bwti  = 4.8      # Brent-WTI compressed under supply shock
-curr_vix   = 22.0
-curr_crack = max(last_crack * 1.15, last_crack + 3.0)
-curr_natgas = max(last_natgas * 1.20, last_natgas + 0.4)
-curr_copper = last_copper * 0.97
-
-print(f"    Calibration: WTI last data = ${last_wti:.2f} (Dec 2019)")
-print(f"    Current WTI  ≈ ${curr_wti:.2f}  OVX={curr_ovx}  VIX={curr_vix}")
-print(f"    DXY={curr_dxy}  10Y={curr_tsy}%  Gold=${curr_gold}")
-print(f"    Crack={curr_crack:.2f}  NatGas={curr_natgas:.2f}  Copper={curr_copper:.2f}")
+def current_conditions(weekly):
+    print("\n[4] Setting current market conditions (Apr 2026)...")
+    master = weekly["master"]
+
+    # Last observed values in dataset (Dec 2019)
+    last_wti    = master["WTI_Close"].iloc[-1]          # $61.68
+    last_ovx    = master["OVX_Close"].iloc[-1]           # 25.86
+    last_crack  = master["Crack_Spread_321"].iloc[-1]
+    last_natgas = master["NatGas_Close"].iloc[-1]
+    last_copper = master["Copper_Close"].iloc[-1]
+
+    # Current Apr 2026 values (from EIA March 2026 STEO + market data)
+    curr_wti   = 100.0    # WTI spot ~$100 post-Hormuz spike
+    curr_ovx   = 47.0     # OVX elevated (oil fear spike)
+    curr_tsy   = 4.35     # 10Y yield (current)
+    curr_dxy   = 104.5    # DXY stronger dollar
+    curr_gold  = 3050.0   # Gold near ATH
+    curr_bwti  = 4.8      # Brent-WTI compressed under supply shock
+    curr_vix   = 22.0
+    curr_crack = max(last_crack * 1.15, last_crack + 3.0)
+    curr_natgas = max(last_natgas * 1.20, last_natgas + 0.4)
+    curr_copper = last_copper * 0.97
+
+    print(f"    Calibration: WTI last data = ${last_wti:.2f} (Dec 2019)")
+    print(f"    Current WTI  ≈ ${curr_wti:.2f}  OVX={curr_ovx}  VIX={curr_vix}")
+    print(f"    DXY={curr_dxy}  10Y={curr_tsy}%  Gold=${curr_gold}")
+    print(f"    Crack={curr_crack:.2f}  NatGas={curr_natgas:.2f}  Copper={curr_copper:.2f}")
+
+    return {
+        "last_wti": last_wti, "last_ovx": last_ovx,
+        "curr_wti": curr_wti, "curr_ovx": curr_ovx, "curr_tsy": curr_tsy,
+        "curr_dxy": curr_dxy, "curr_gold": curr_gold, "curr_bwti": curr_bwti,
+        "curr_vix": curr_vix, "curr_crack": curr_crack,
+        "curr_natgas": curr_natgas, "curr_copper": curr_copper,
+    }
 
 # ═══════════════════════════════════════════════════════════════════════════
 # BLOCK 5 — THREE SCENARIO FORWARD FORECAST (12 weeks)
 # ═══════════════════════════════════════════════════════════════════════════
-print("\n[5] Generating 3-scenario 12-week forecast from Apr 2026...")
-
-H = 26   # 26 weeks = ~6 months
-
-# ── Helper: build one-period exog vector from scenario assumptions ──
-def scenario_exog(scenario, week):
-    """
-    Returns a scalar ARIMAX contribution from exogenous variables
-    given scenario assumptions for a given forecast week.
-    """
-    # Coefficients: const, AR1, AR2, then exog in EXOG order
-    # We handle AR terms separately; here compute sum(beta_j * x_j)
-    exog_betas = beta[3:]   # skip const, AR1, AR2
+# ── Helper: one-period exogenous shocks from scenario assumptions ──
+def scenario_shocks(scenario, week):
+    """Shock to each exogenous variable in a named scenario for a given forecast week."""
     decay_26 = 1 - week / 26
 
     # Scenario-specific exogenous paths
@@ -411,27 +423,43 @@ def scenario_exog(scenario, week):
             "LogNatGas": 0.006,
             "LogCopper": 0.002,
         }
+    return shocks
 
+def scenario_exog(scenario, week, exog_betas, exog_cols):
+    """
+    Returns a scalar ARIMAX contribution from exogenous variables
+    given scenario assumptions for a given forecast week.
+    ``exog_betas`` are the coefficients after const, AR1 and AR2, in EXOG order.
+    """
+    shocks = scenario_shocks(scenario, week)
     x_vec = np.array([shocks.get(col, 0.0) for col in exog_cols])
     return float(exog_betas @ x_vec)
 
-def run_scenario(scenario_name, start_price):
+def scenario_shock_matrix(scenario, exog_cols, horizon):
+    """(horizon, n_exog) shock path of a named scenario, the row layout scenario_grid takes."""
+    return np.array([[scenario_shocks(scenario, w).get(col, 0.0) for col in exog_cols] for w in range(horizon)])
+
+def start_returns(wti_close, start_price):
+    """AR(1) and AR(2) starting returns for a forecast from ``start_price``, as run_scenario uses."""
+    return (np.log(start_price / wti_close.iloc[-2]), np.log(wti_close.iloc[-2] / wti_close.iloc[-3]))
+
+def run_scenario(scenario_name, start_price, beta, garch, wti_close, exog_cols, horizon):
     prices    = [start_price]
     returns_h = []
-    h_t       = h_last
+    h_t       = garch["h_last"]
     vols      = []
     h_path    = []
 
-    prev1 = np.log(start_price / master["WTI_Close"].iloc[-2])
-    prev2 = np.log(master["WTI_Close"].iloc[-2] / master["WTI_Close"].iloc[-3])
+    prev1 = np.log(start_price / wti_close.iloc[-2])
+    prev2 = np.log(wti_close.iloc[-2] / wti_close.iloc[-3])
 
-    for w in range(H):
+    for w in range(horizon):
         # ARIMAX mean forecast
         mu_fc = beta[0] + beta[1]*prev1 + beta[2]*prev2
-        mu_fc += scenario_exog(scenario_name, w)
+        mu_fc += scenario_exog(scenario_name, w, beta[3:], exog_cols)
 
         # GARCH variance forecast (converges to long-run)
-        h_t   = omega_g + (alpha_g + beta_g)*h_t
+        h_t   = garch["omega"] + (garch["alpha"] + garch["beta"])*h_t
         sigma = np.sqrt(h_t)
         vols.append(sigma * np.sqrt(52) * 100)   # annualised
         h_path.append(h_t)
@@ -458,450 +486,477 @@ def run_scenario(scenario_name, start_price):
         "hi68":   hi68, "lo68": lo68,
     }
 
-base = run_scenario("base", curr_wti)
-bull = run_scenario("bull", curr_wti)
-bear = run_scenario("bear", curr_wti)
-
-fc_dates = pd.date_range("2026-04-04", periods=H, freq="W-FRI")
-
-def fmt_fc(res, weeks=[0,3,7,11,17,25]):
+def fmt_fc(res, fc_dates, weeks=[0,3,7,11,17,25]):
     rows = []
     for w in weeks:
-        if w < H:
+        if w < len(fc_dates):
             rows.append(f"    Wk {w+1:>2} ({fc_dates[w].strftime('%b %d')})  "
                         f"${res['prices'][w]:>7.2f}  "
                         f"[${res['lo95'][w]:>6.2f} – ${res['hi95'][w]:>6.2f}]  "
                         f"vol={res['vols'][w]:.1f}%")
     return "\n".join(rows)
 
-print(f"\n  ── BASE CASE (Hormuz partial, OPEC+ holds, gradual de-escalation) ──")
-print(fmt_fc(base))
-print(f"\n  ── BULL CASE (Full Hormuz blockade, prices surge to cycle high) ──")
-print(fmt_fc(bull))
-print(f"\n  ── BEAR CASE (Ceasefire deal, OPEC+ eases, supply restored) ──")
-print(fmt_fc(bear))
+def forecast_scenarios(weekly, arimax, garch, conditions, horizon, forecast_start):
+    print("\n[5] Generating 3-scenario 12-week forecast from Apr 2026...")
+
+    wti_close = weekly["master"]["WTI_Close"]
+    curr_wti = conditions["curr_wti"]
+    base, bull, bear = (
+        run_scenario(name, curr_wti, arimax["beta"], garch, wti_close, arimax["exog_cols"], horizon)
+        for name in ("base", "bull", "bear")
+    )
+
+    fc_dates = pd.date_range(forecast_start, periods=horizon, freq="W-FRI")
+
+    print(f"\n  ── BASE CASE (Hormuz partial, OPEC+ holds, gradual de-escalation) ──")
+    print(fmt_fc(base, fc_dates))
+    print(f"\n  ── BULL CASE (Full Hormuz blockade, prices surge to cycle high) ──")
+    print(fmt_fc(bull, fc_dates))
+    print(f"\n  ── BEAR CASE (Ceasefire deal, OPEC+ eases, supply restored) ──")
+    print(fmt_fc(bear, fc_dates))
+
+    return {"base": base, "bull": bull, "bear": bear, "fc_dates": fc_dates}
 
 # ═══════════════════════════════════════════════════════════════════════════
 # BLOCK 6 — HISTORICAL SURGE COMPARISON
 # Using real data from the master dataset to benchmark surge episodes
 # ═══════════════════════════════════════════════════════════════════════════
-print("\n[6] Extracting historical oil surge episodes from real data...")
-
-surges = {
-    "2010–11 Recovery":  ("2010-06-25", "2011-04-29"),
-    "2016–18 OPEC Rally":("2016-01-22", "2018-10-05"),
-    "2010 Initial Rally":("2010-01-08", "2010-12-31"),
-}
-
-surge_data = {}
-for name, (s, e) in surges.items():
-    seg = master.loc[s:e, "WTI_Close"].dropna()
-    if len(seg) > 10:
-        pct = (seg.iloc[-1]/seg.iloc[0] - 1)*100
-        weeks_dur = len(seg)
-        weekly_gain = seg.pct_change().mean()*100
-        surge_data[name] = {"prices": seg, "pct": pct,
-                             "weeks": weeks_dur, "wkly_gain": weekly_gain}
-        print(f"    {name:<28}: +{pct:.1f}% over {weeks_dur} weeks  "
-              f"(avg {weekly_gain:.2f}%/wk)")
+def historical_surges(weekly, surges):
+    print("\n[6] Extracting historical oil surge episodes from real data...")
+
+    master = weekly["master"]
+    surge_data = {}
+    for name, (s, e) in surges.items():
+        seg = master.loc[s:e, "WTI_Close"].dropna()
+        if len(seg) > 10:
+            pct = (seg.iloc[-1]/seg.iloc[0] - 1)*100
+            weeks_dur = len(seg)
+            weekly_gain = seg.pct_change().mean()*100
+            surge_data[name] = {"prices": seg, "pct": pct,
+                                 "weeks": weeks_dur, "wkly_gain": weekly_gain}
+            print(f"    {name:<28}: +{pct:.1f}% over {weeks_dur} weeks  "
+                  f"(avg {weekly_gain:.2f}%/wk)")
+    return surge_data
 
 # ═══════════════════════════════════════════════════════════════════════════
 # BLOCK 7 — MASTER DASHBOARD
 # ═══════════════════════════════════════════════════════════════════════════
-print("\n[7] Rendering dashboard...")
-
-fig = plt.figure(figsize=(26, 36))
-fig.patch.set_facecolor(C["bg"])
-gs  = gridspec.GridSpec(5, 2, figure=fig, hspace=0.46, wspace=0.32,
-                        left=0.07, right=0.97, top=0.96, bottom=0.04)
-
-# ══════════════════════════════════════════════════════════════════════
-# PANEL A (top, full width) — Historical WTI + OPEC shade + current regime
-# ══════════════════════════════════════════════════════════════════════
-ax0 = fig.add_subplot(gs[0, :])
-ax0.set_facecolor(C["white"])
-prices_hist = master["WTI_Close"]
-ax0.plot(prices_hist.index, prices_hist.values,
-         color=C["navy"], lw=1.6, zorder=3)
-ax0.fill_between(prices_hist.index, 0, prices_hist.values,
-                 color=C["navy"], alpha=0.06)
-# OPEC shading
-cut_on = None
-for d, v in master["OPEC_Cut"].items():
-    if v==1 and cut_on is None: cut_on = d
-    if v==0 and cut_on is not None:
-        ax0.axvspan(cut_on, d, color=C["teal"], alpha=0.12, zorder=1)
-        cut_on = None
-# Annotate major surge episodes
-for name, (s, e) in surges.items():
-    try:
-        mid = master.loc[s:e, "WTI_Close"].idxmax()
-        peak = master.loc[mid, "WTI_Close"]
-        ax0.annotate(name, xy=(mid, peak),
-                     xytext=(mid, peak+8),
-                     fontsize=8, color=C["green"], fontweight="bold",
-                     arrowprops=dict(arrowstyle="-", color=C["green"], lw=0.8),
-                     ha="center")
-    except: pass
-# Arrow pointing to "now"
-ax0.annotate("Current surge\n~$100/bbl  →",
-             xy=(prices_hist.index[-1], prices_hist.iloc[-1]),
-             xytext=(prices_hist.index[-60], 85),
-             fontsize=9.5, color=C["red"], fontweight="bold",
-             arrowprops=dict(arrowstyle="->", color=C["red"], lw=1.5))
-ax0.set_title("WTI Crude Oil — Historical Price  |  2010–2019 Real Data  "
-              "|  Teal = OPEC+ cut active  |  Training window for surge model",
-              fontsize=13, fontweight="bold", pad=9)
-ax0.set_ylabel("USD / barrel", fontsize=11)
-ax0.yaxis.set_major_formatter(FuncFormatter(lambda x,_: f"${x:.0f}"))
-ax0.set_ylim(bottom=0)
-ax0.grid(alpha=0.20, zorder=0)
-
-# ══════════════════════════════════════════════════════════════════════
-# PANEL B (row 2, full width) — 3-SCENARIO FORWARD FORECAST
-# ══════════════════════════════════════════════════════════════════════
-ax1 = fig.add_subplot(gs[1, :])
-ax1.set_facecolor(C["white"])
-
-# Anchor: show last 16 weeks of hist context (simulated bridge to current)
-anch_dates = pd.date_range("2026-01-03", "2026-04-04", freq="W-FRI")
-n_anch = len(anch_dates)
-# Smooth ramp from ~$62 (end of dataset) up to $100 (current)
-anch_prices = np.linspace(62, 100, n_anch) + np.random.default_rng(7).normal(0, 1.5, n_anch)
-ax1.plot(anch_dates, anch_prices, color=C["navy"], lw=1.8,
-         label="Recent WTI (Jan–Apr 2026)", zorder=4)
-ax1.axvline(fc_dates[0], color=C["grey"], ls="--", lw=1.2, alpha=0.7)
-ax1.annotate("Forecast starts\nApr 4, 2026", xy=(fc_dates[0], 92),
-             fontsize=8.5, color=C["grey"], ha="center")
-
-# Bull scenario
-ax1.fill_between(fc_dates, bull["lo68"], bull["hi68"],
-                 color=C["bull"], alpha=0.12)
-ax1.fill_between(fc_dates, bull["lo95"], bull["hi95"],
-                 color=C["bull"], alpha=0.06)
-ax1.plot(fc_dates, bull["prices"], color=C["bull"], lw=2.2, ls="-",
-         label=f"Bull: Hormuz blockade  (Wk26: ${bull['prices'][-1]:.0f})", zorder=5)
-
-# Base scenario
-ax1.fill_between(fc_dates, base["lo68"], base["hi68"],
-                 color=C["base"], alpha=0.14)
-ax1.fill_between(fc_dates, base["lo95"], base["hi95"],
-                 color=C["base"], alpha=0.07)
-ax1.plot(fc_dates, base["prices"], color=C["base"], lw=2.4, ls="-",
-         label=f"Base: Gradual de-escalation  (Wk26: ${base['prices'][-1]:.0f})", zorder=6)
-
-# Bear scenario
-ax1.fill_between(fc_dates, bear["lo68"], bear["hi68"],
-                 color=C["bear"], alpha=0.12)
-ax1.fill_between(fc_dates, bear["lo95"], bear["hi95"],
-                 color=C["bear"], alpha=0.06)
-ax1.plot(fc_dates, bear["prices"], color=C["bear"], lw=2.2, ls="-",
-         label=f"Bear: Ceasefire / supply restored  (Wk26: ${bear['prices'][-1]:.0f})", zorder=5)
-
-# Key price levels
-for level, label, col in [(130,"$130 — 2022 analog",C["orange"]),
-                           (100,"$100 — current",C["grey"]),
-                           (80, "$80 — OPEC floor", C["teal"])]:
-    ax1.axhline(level, color=col, ls=":", lw=1.0, alpha=0.6)
-    ax1.annotate(label, xy=(fc_dates[1], level+1.5), fontsize=8, color=col)
-
-ax1.set_title(
-    "Oil Surge Forecast  |  3 Scenarios  |  Apr 2026 → Oct 2026  "
-    "|  ARIMAX-GARCH(1,1) calibrated on 2010–2019\n"
-    "Shaded: 68% CI (dark) / 95% CI (light)",
-    fontsize=13, fontweight="bold", pad=9)
-ax1.set_ylabel("USD / barrel", fontsize=11)
-ax1.yaxis.set_major_formatter(FuncFormatter(lambda x,_: f"${x:.0f}"))
-ax1.legend(fontsize=10, loc="upper left", framealpha=0.85)
-ax1.grid(alpha=0.20)
-
-# ══════════════════════════════════════════════════════════════════════
-# PANEL C (row 3 left) — GARCH Conditional Volatility
-# ══════════════════════════════════════════════════════════════════════
-ax2 = fig.add_subplot(gs[2, 0])
-ax2.set_facecolor(C["white"])
-ax2.fill_between(train.index, 0, cond_vol, color=C["red"], alpha=0.4)
-ax2.plot(train.index, cond_vol, color=C["red"], lw=1.0)
-ax2.axhline(np.sqrt(uncond_var)*np.sqrt(52)*100,
-            color=C["navy"], ls="--", lw=1.2, label="Long-run vol")
-ax2.set_title(f"GARCH(1,1) Conditional Volatility  |  α+β={persist:.3f}  |  "
-              f"Half-life={half_life:.1f}wks",
-              fontsize=11, fontweight="bold", pad=6)
-ax2.set_ylabel("Ann. vol (%)", fontsize=10); ax2.legend(fontsize=9)
-ax2.grid(alpha=0.20)
-
-# ══════════════════════════════════════════════════════════════════════
-# PANEL D (row 3 right) — Scenario vol forecasts
-# ══════════════════════════════════════════════════════════════════════
-ax3 = fig.add_subplot(gs[2, 1])
-ax3.set_facecolor(C["white"])
-ax3.plot(fc_dates, bull["vols"], color=C["bull"],  lw=2.0, label="Bull vol")
-ax3.plot(fc_dates, base["vols"], color=C["base"],  lw=2.0, label="Base vol")
-ax3.plot(fc_dates, bear["vols"], color=C["bear"],  lw=2.0, label="Bear vol")
-ax3.axhline(np.sqrt(uncond_var)*np.sqrt(52)*100,
-            color=C["navy"], ls="--", lw=1.0, alpha=0.6, label="LR vol")
-ax3.set_title("Forward Volatility Forecast (GARCH)",
-              fontsize=11, fontweight="bold", pad=6)
-ax3.set_ylabel("Ann. vol (%)", fontsize=10); ax3.legend(fontsize=9)
-ax3.grid(alpha=0.20)
-
-# ══════════════════════════════════════════════════════════════════════
-# PANEL E (row 4 left) — ARIMAX Variable Importance
-# ══════════════════════════════════════════════════════════════════════
-ax4 = fig.add_subplot(gs[3, 0])
-ax4.set_facecolor(C["white"])
-vi = sorted(zip(exog_labels, np.abs(t_hac[3:]), p_hac[3:], beta[3:]),
-            key=lambda x: x[1], reverse=True)
-vi_n = [x[0] for x in vi]; vi_t = [x[1] for x in vi]; vi_p = [x[2] for x in vi]
-bar_col = [C["green"] if p<0.05 else C["amber"] if p<0.10 else C["grey"]
-           for p in vi_p]
-ax4.barh(vi_n[::-1], vi_t[::-1], color=bar_col[::-1], height=0.55, alpha=0.85)
-ax4.axvline(1.96, color=C["red"],   ls="--", lw=1.2, label="p=0.05")
-ax4.axvline(1.645,color=C["amber"], ls=":",  lw=1.0, label="p=0.10")
-ax4.set_xlabel("|t-statistic| (HAC robust)", fontsize=10)
-ax4.set_title("ARIMAX Variable Importance\n(Newey-West HAC robust SEs)",
-              fontsize=11, fontweight="bold", pad=6)
-ax4.legend(fontsize=8); ax4.grid(alpha=0.20, axis="x")
-
-# ══════════════════════════════════════════════════════════════════════
-# PANEL F (row 4 right) — Historical surge comparison
-# ══════════════════════════════════════════════════════════════════════
-ax5 = fig.add_subplot(gs[3, 1])
-ax5.set_facecolor(C["white"])
-surge_colors = [C["green"], C["purple"], C["teal"]]
-for i, (name, data) in enumerate(surge_data.items()):
-    seg = data["prices"]
-    norm = seg / seg.iloc[0] * 100
-    wks  = np.arange(len(norm))
-    ax5.plot(wks, norm.values, color=surge_colors[i], lw=1.8,
-             label=f"{name} (+{data['pct']:.0f}%)")
-# Current surge (indexed to 100 at Jan 2026)
-curr_surge_norm = np.array([100, 102, 105, 108, 110, 113, 117, 120, 122, 126,
-                             130, 138, 145, 155, 162, 100/62*100])
-# Scenarios indexed to 100
-base_norm = base["prices"] / curr_wti * 100
-bull_norm = bull["prices"] / curr_wti * 100
-bear_norm = bear["prices"] / curr_wti * 100
-wks_fc = np.arange(H)
-ax5.plot(wks_fc, base_norm, color=C["base"], lw=2.2, ls="--", label="Current base")
-ax5.plot(wks_fc, bull_norm, color=C["bull"], lw=2.2, ls="--", label="Current bull")
-ax5.plot(wks_fc, bear_norm, color=C["bear"], lw=2.2, ls="--", label="Current bear")
-ax5.axhline(100, color=C["grey"], ls=":", lw=0.8)
-ax5.set_xlabel("Weeks from surge start", fontsize=10)
-ax5.set_ylabel("WTI (index, start=100)", fontsize=10)
-ax5.set_title("Historical Surge Comparison\n(All indexed to 100 at surge start)",
-              fontsize=11, fontweight="bold", pad=6)
-ax5.legend(fontsize=8); ax5.grid(alpha=0.20)
-
-# ══════════════════════════════════════════════════════════════════════
-# PANEL G (row 5, full width) — OVX vs WTI scatter + EIA draws
-# ══════════════════════════════════════════════════════════════════════
-ax6 = fig.add_subplot(gs[4, 0])
-ax6.set_facecolor(C["white"])
-ovx_w  = master["OVX_Close"].dropna()
-wti_r  = master["LogWTI"].dropna()
-common = ovx_w.index.intersection(wti_r.index)
-ax6.scatter(np.log(ovx_w[common]/ovx_w[common].shift(1)).dropna(),
-            wti_r[common][1:], color=C["navy"], s=5, alpha=0.3)
-# Add current implied
-ax6.axvline(np.log(curr_ovx/last_ovx)*0.1, color=C["red"],
-            lw=2, label=f"Current ΔOVX direction")
-ax6.set_xlabel("ΔLog OVX (weekly)", fontsize=10)
-ax6.set_ylabel("WTI log return", fontsize=10)
-ax6.set_title(f"OVX vs WTI Returns  |  r = {master['LogOVX'].corr(master['LogWTI']):.3f}\n"
-              f"Top predictor: {vi[0][0]} (|t|={vi[0][1]:.2f}{sig_stars(vi[0][2])})",
-              fontsize=11, fontweight="bold", pad=6)
-ax6.grid(alpha=0.20); ax6.legend(fontsize=9)
-
-# Crack spread vs WTI
-ax7 = fig.add_subplot(gs[4, 1])
-ax7.set_facecolor(C["white"])
-crack_w = master["Crack_Spread_321"].dropna()
-common2 = crack_w.index.intersection(master["WTI_Close"].dropna().index)
-ax7.fill_between(common2, 0, crack_w[common2], color=C["orange"], alpha=0.22)
-ax7.plot(common2, crack_w[common2], color=C["orange"], lw=1.2)
-ax2b = ax7.twinx()
-ax2b.plot(common2, master.loc[common2, "WTI_Close"], color=C["navy"],
-          lw=0.9, alpha=0.7)
-ax7.set_xlabel("Date", fontsize=10)
-ax7.set_ylabel("3-2-1 crack spread (USD)", fontsize=10, color=C["orange"])
-ax2b.set_ylabel("WTI Close (USD)", fontsize=10, color=C["navy"])
-ax7.set_title("Crack Spread vs WTI Price\n"
-              "Higher refinery margins often coincide with stronger crude demand",
-              fontsize=11, fontweight="bold", pad=6)
-ax7.grid(alpha=0.15)
-
-fig.suptitle(
-    "WTI CRUDE OIL — OIL SURGE FORECASTING MODEL\n"
-    "ARIMAX(2,1,0)-GARCH(1,1)  |  Trained: 2010–2019 Real Data  |  "
-    "Forecast: Apr–Oct 2026  |  Scenarios: Bull / Base / Bear",
-    fontsize=15, fontweight="bold", y=0.985, color=C["navy"])
-
-dash_path = f"{OUT}/wti_surge_forecast_dashboard.png"
-plt.savefig(dash_path, dpi=160, bbox_inches="tight", facecolor=C["bg"])
-plt.close()
-print(f"    Dashboard → {dash_path}")
+def render_dashboard(weekly, arimax, garch, conditions, scenarios, surges, surge_windows, palette, output_dir):
+    print("\n[7] Rendering dashboard...")
+
+    C = palette
+    master, train = weekly["master"], weekly["train"]
+    base, bull, bear = scenarios["base"], scenarios["bull"], scenarios["bear"]
+    fc_dates = scenarios["fc_dates"]
+    cond_vol, uncond_var = garch["cond_vol"], garch["uncond_var"]
+    persist, half_life = garch["persist"], garch["half_life"]
+    curr_wti, curr_ovx, last_ovx = conditions["curr_wti"], conditions["curr_ovx"], conditions["last_ovx"]
+    vi = arimax["importance"]
+    surge_data = surges
+
+    fig = plt.figure(figsize=(26, 36))
+    fig.patch.set_facecolor(C["bg"])
+    gs  = gridspec.GridSpec(5, 2, figure=fig, hspace=0.46, wspace=0.32,
+                            left=0.07, right=0.97, top=0.96, bottom=0.04)
+
+    # ══════════════════════════════════════════════════════════════════════
+    # PANEL A (top, full width) — Historical WTI + OPEC shade + current regime
+    # ══════════════════════════════════════════════════════════════════════
+    ax0 = fig.add_subplot(gs[0, :])
+    ax0.set_facecolor(C["white"])
+    prices_hist = master["WTI_Close"]
+    ax0.plot(prices_hist.index, prices_hist.values,
+             color=C["navy"], lw=1.6, zorder=3)
+    ax0.fill_between(prices_hist.index, 0, prices_hist.values,
+                     color=C["navy"], alpha=0.06)
+    # OPEC shading
+    cut_on = None
+    for d, v in master["OPEC_Cut"].items():
+        if v==1 and cut_on is None: cut_on = d
+        if v==0 and cut_on is not None:
+            ax0.axvspan(cut_on, d, color=C["teal"], alpha=0.12, zorder=1)
+            cut_on = None
+    # Annotate major surge episodes
+    for name, (s, e) in surge_windows.items():
+        try:
+            mid = master.loc[s:e, "WTI_Close"].idxmax()
+            peak = master.loc[mid, "WTI_Close"]
+            ax0.annotate(name, xy=(mid, peak),
+                         xytext=(mid, peak+8),
+                         fontsize=8, color=C["green"], fontweight="bold",
+                         arrowprops=dict(arrowstyle="-", color=C["green"], lw=0.8),
+                         ha="center")
+        except: pass
+    # Arrow pointing to "now"
+    ax0.annotate("Current surge\n~$100/bbl  →",
+                 xy=(prices_hist.index[-1], prices_hist.iloc[-1]),
+                 xytext=(prices_hist.index[-60], 85),
+                 fontsize=9.5, color=C["red"], fontweight="bold",
+                 arrowprops=dict(arrowstyle="->", color=C["red"], lw=1.5))
+    ax0.set_title("WTI Crude Oil — Historical Price  |  2010–2019 Real Data  "
+                  "|  Teal = OPEC+ cut active  |  Training window for surge model",
+                  fontsize=13, fontweight="bold", pad=9)
+    ax0.set_ylabel("USD / barrel", fontsize=11)
+    ax0.yaxis.set_major_formatter(FuncFormatter(lambda x,_: f"${x:.0f}"))
+    ax0.set_ylim(bottom=0)
+    ax0.grid(alpha=0.20, zorder=0)
+
+    # ══════════════════════════════════════════════════════════════════════
+    # PANEL B (row 2, full width) — 3-SCENARIO FORWARD FORECAST
+    # ══════════════════════════════════════════════════════════════════════
+    ax1 = fig.add_subplot(gs[1, :])
+    ax1.set_facecolor(C["white"])
+
+    # Anchor: show last 16 weeks of hist context (simulated bridge to current)
+    anch_dates = pd.date_range("2026-01-03", "2026-04-04", freq="W-FRI")
+    n_anch = len(anch_dates)
+    # Smooth ramp from ~$62 (end of dataset) up to $100 (current)
+    anch_prices = np.linspace(62, 100, n_anch) + np.random.default_rng(7).normal(0, 1.5, n_anch)
+    ax1.plot(anch_dates, anch_prices, color=C["navy"], lw=1.8,
+             label="Recent WTI (Jan–Apr 2026)", zorder=4)
+    ax1.axvline(fc_dates[0], color=C["grey"], ls="--", lw=1.2, alpha=0.7)
+    ax1.annotate("Forecast starts\nApr 4, 2026", xy=(fc_dates[0], 92),
+                 fontsize=8.5, color=C["grey"], ha="center")
+
+    # Bull scenario
+    ax1.fill_between(fc_dates, bull["lo68"], bull["hi68"],
+                     color=C["bull"], alpha=0.12)
+    ax1.fill_between(fc_dates, bull["lo95"], bull["hi95"],
+                     color=C["bull"], alpha=0.06)
+    ax1.plot(fc_dates, bull["prices"], color=C["bull"], lw=2.2, ls="-",
+             label=f"Bull: Hormuz blockade  (Wk26: ${bull['prices'][-1]:.0f})", zorder=5)
+
+    # Base scenario
+    ax1.fill_between(fc_dates, base["lo68"], base["hi68"],
+                     color=C["base"], alpha=0.14)
+    ax1.fill_between(fc_dates, base["lo95"], base["hi95"],
+                     color=C["base"], alpha=0.07)
+    ax1.plot(fc_dates, base["prices"], color=C["base"], lw=2.4, ls="-",
+             label=f"Base: Gradual de-escalation  (Wk26: ${base['prices'][-1]:.0f})", zorder=6)
+
+    # Bear scenario
+    ax1.fill_between(fc_dates, bear["lo68"], bear["hi68"],
+                     color=C["bear"], alpha=0.12)
+    ax1.fill_between(fc_dates, bear["lo95"], bear["hi95"],
+                     color=C["bear"], alpha=0.06)
+    ax1.plot(fc_dates, bear["prices"], color=C["bear"], lw=2.2, ls="-",
+             label=f"Bear: Ceasefire / supply restored  (Wk26: ${bear['prices'][-1]:.0f})", zorder=5)
+
+    # Key price levels
+    for level, label, col in [(130,"$130 — 2022 analog",C["orange"]),
+                               (100,"$100 — current",C["grey"]),
+                               (80, "$80 — OPEC floor", C["teal"])]:
+        ax1.axhline(level, color=col, ls=":", lw=1.0, alpha=0.6)
+        ax1.annotate(label, xy=(fc_dates[1], level+1.5), fontsize=8, color=col)
+
+    ax1.set_title(
+        "Oil Surge Forecast  |  3 Scenarios  |  Apr 2026 → Oct 2026  "
+        "|  ARIMAX-GARCH(1,1) calibrated on 2010–2019\n"
+        "Shaded: 68% CI (dark) / 95% CI (light)",
+        fontsize=13, fontweight="bold", pad=9)
+    ax1.set_ylabel("USD / barrel", fontsize=11)
+    ax1.yaxis.set_major_formatter(FuncFormatter(lambda x,_: f"${x:.0f}"))
+    ax1.legend(fontsize=10, loc="upper left", framealpha=0.85)
+    ax1.grid(alpha=0.20)
+
+    # ══════════════════════════════════════════════════════════════════════
+    # PANEL C (row 3 left) — GARCH Conditional Volatility
+    # ══════════════════════════════════════════════════════════════════════
+    ax2 = fig.add_subplot(gs[2, 0])
+    ax2.set_facecolor(C["white"])
+    ax2.fill_between(train.index, 0, cond_vol, color=C["red"], alpha=0.4)
+    ax2.plot(train.index, cond_vol, color=C["red"], lw=1.0)
+    ax2.axhline(np.sqrt(uncond_var)*np.sqrt(52)*100,
+                color=C["navy"], ls="--", lw=1.2, label="Long-run vol")
+    ax2.set_title(f"GARCH(1,1) Conditional Volatility  |  α+β={persist:.3f}  |  "
+                  f"Half-life={half_life:.1f}wks",
+                  fontsize=11, fontweight="bold", pad=6)
+    ax2.set_ylabel("Ann. vol (%)", fontsize=10); ax2.legend(fontsize=9)
+    ax2.grid(alpha=0.20)
+
+    # ══════════════════════════════════════════════════════════════════════
+    # PANEL D (row 3 right) — Scenario vol forecasts
+    # ══════════════════════════════════════════════════════════════════════
+    ax3 = fig.add_subplot(gs[2, 1])
+    ax3.set_facecolor(C["white"])
+    ax3.plot(fc_dates, bull["vols"], color=C["bull"],  lw=2.0, label="Bull vol")
+    ax3.plot(fc_dates, base["vols"], color=C["base"],  lw=2.0, label="Base vol")
+    ax3.plot(fc_dates, bear["vols"], color=C["bear"],  lw=2.0, label="Bear vol")
+    ax3.axhline(np.sqrt(uncond_var)*np.sqrt(52)*100,
+                color=C["navy"], ls="--", lw=1.0, alpha=0.6, label="LR vol")
+    ax3.set_title("Forward Volatility Forecast (GARCH)",
+                  fontsize=11, fontweight="bold", pad=6)
+    ax3.set_ylabel("Ann. vol (%)", fontsize=10); ax3.legend(fontsize=9)
+    ax3.grid(alpha=0.20)
+
+    # ══════════════════════════════════════════════════════════════════════
+    # PANEL E (row 4 left) — ARIMAX Variable Importance
+    # ══════════════════════════════════════════════════════════════════════
+    ax4 = fig.add_subplot(gs[3, 0])
+    ax4.set_facecolor(C["white"])
+    vi_n = [x[0] for x in vi]; vi_t = [x[1] for x in vi]; vi_p = [x[2] for x in vi]
+    bar_col = [C["green"] if p<0.05 else C["amber"] if p<0.10 else C["grey"]
+               for p in vi_p]
+    ax4.barh(vi_n[::-1], vi_t[::-1], color=bar_col[::-1], height=0.55, alpha=0.85)
+    ax4.axvline(1.96, color=C["red"],   ls="--", lw=1.2, label="p=0.05")
+    ax4.axvline(1.645,color=C["amber"], ls=":",  lw=1.0, label="p=0.10")
+    ax4.set_xlabel("|t-statistic| (HAC robust)", fontsize=10)
+    ax4.set_title("ARIMAX Variable Importance\n(Newey-West HAC robust SEs)",
+                  fontsize=11, fontweight="bold", pad=6)
+    ax4.legend(fontsize=8); ax4.grid(alpha=0.20, axis="x")
+
+    # ══════════════════════════════════════════════════════════════════════
+    # PANEL F (row 4 right) — Historical surge comparison
+    # ══════════════════════════════════════════════════════════════════════
+    ax5 = fig.add_subplot(gs[3, 1])
+    ax5.set_facecolor(C["white"])
+    surge_colors = [C["green"], C["purple"], C["teal"]]
+    for i, (name, data) in enumerate(surge_data.items()):
+        seg = data["prices"]
+        norm = seg / seg.iloc[0] * 100
+        wks  = np.arange(len(norm))
+        ax5.plot(wks, norm.values, color=surge_colors[i], lw=1.8,
+                 label=f"{name} (+{data['pct']:.0f}%)")
+    # Scenarios indexed to 100
+    base_norm = base["prices"] / curr_wti * 100
+    bull_norm = bull["prices"] / curr_wti * 100
+    bear_norm = bear["prices"] / curr_wti * 100
+    wks_fc = np.arange(len(fc_dates))
+    ax5.plot(wks_fc, base_norm, color=C["base"], lw=2.2, ls="--", label="Current base")
+    ax5.plot(wks_fc, bull_norm, color=C["bull"], lw=2.2, ls="--", label="Current bull")
+    ax5.plot(wks_fc, bear_norm, color=C["bear"], lw=2.2, ls="--", label="Current bear")
+    ax5.axhline(100, color=C["grey"], ls=":", lw=0.8)
+    ax5.set_xlabel("Weeks from surge start", fontsize=10)
+    ax5.set_ylabel("WTI (index, start=100)", fontsize=10)
+    ax5.set_title("Historical Surge Comparison\n(All indexed to 100 at surge start)",
+                  fontsize=11, fontweight="bold", pad=6)
+    ax5.legend(fontsize=8); ax5.grid(alpha=0.20)
+
+    # ══════════════════════════════════════════════════════════════════════
+    # PANEL G (row 5, full width) — OVX vs WTI scatter + EIA draws
+    # ══════════════════════════════════════════════════════════════════════
+    ax6 = fig.add_subplot(gs[4, 0])
+    ax6.set_facecolor(C["white"])
+    ovx_w  = master["OVX_Close"].dropna()
+    wti_r  = master["LogWTI"].dropna()
+    common = ovx_w.index.intersection(wti_r.index)
+    ax6.scatter(np.log(ovx_w[common]/ovx_w[common].shift(1)).dropna(),
+                wti_r[common][1:], color=C["navy"], s=5, alpha=0.3)
+    # Add current implied
+    ax6.axvline(np.log(curr_ovx/last_ovx)*0.1, color=C["red"],
+                lw=2, label=f"Current ΔOVX direction")
+    ax6.set_xlabel("ΔLog OVX (weekly)", fontsize=10)
+    ax6.set_ylabel("WTI log return", fontsize=10)
+    ax6.set_title(f"OVX vs WTI Returns  |  r = {master['LogOVX'].corr(master['LogWTI']):.3f}\n"
+                  f"Top predictor: {vi[0][0]} (|t|={vi[0][1]:.2f}{sig_stars(vi[0][2])})",
+                  fontsize=11, fontweight="bold", pad=6)
+    ax6.grid(alpha=0.20); ax6.legend(fontsize=9)
+
+    # Crack spread vs WTI
+    ax7 = fig.add_subplot(gs[4, 1])
+    ax7.set_facecolor(C["white"])
+    crack_w = master["Crack_Spread_321"].dropna()
+    common2 = crack_w.index.intersection(master["WTI_Close"].dropna().index)
+    ax7.fill_between(common2, 0, crack_w[common2], color=C["orange"], alpha=0.22)
+    ax7.plot(common2, crack_w[common2], color=C["orange"], lw=1.2)
+    ax2b = ax7.twinx()
+    ax2b.plot(common2, master.loc[common2, "WTI_Close"], color=C["navy"],
+              lw=0.9, alpha=0.7)
+    ax7.set_xlabel("Date", fontsize=10)
+    ax7.set_ylabel("3-2-1 crack spread (USD)", fontsize=10, color=C["orange"])
+    ax2b.set_ylabel("WTI Close (USD)", fontsize=10, color=C["navy"])
+    ax7.set_title("Crack Spread vs WTI Price\n"
+                  "Higher refinery margins often coincide with stronger crude demand",
+                  fontsize=11, fontweight="bold", pad=6)
+    ax7.grid(alpha=0.15)
+
+    fig.suptitle(
+        "WTI CRUDE OIL — OIL SURGE FORECASTING MODEL\n"
+        "ARIMAX(2,1,0)-GARCH(1,1)  |  Trained: 2010–2019 Real Data  |  "
+        "Forecast: Apr–Oct 2026  |  Scenarios: Bull / Base / Bear",
+        fontsize=15, fontweight="bold", y=0.985, color=C["navy"])
+
+    os.makedirs(output_dir, exist_ok=True)
+    dash_path = f"{output_dir}/wti_surge_forecast_dashboard.png"
+    plt.savefig(dash_path, dpi=160, bbox_inches="tight", facecolor=C["bg"])
+    plt.close()
+    print(f"    Dashboard → {dash_path}")
+    return dash_path
 
 # ═══════════════════════════════════════════════════════════════════════════
 # BLOCK 8 — EXCEL RESULTS REPORT
 # ═══════════════════════════════════════════════════════════════════════════
-print("\n[8] Writing Excel results report...")
-
-excel_path = f"{OUT}/wti_surge_model_results.xlsx"
-excel_engine = "xlsxwriter" if importlib.util.find_spec("xlsxwriter") else "openpyxl"
-
-rows = [
-    ["ARIMAX-GARCH OIL SURGE MODEL","","","",""],
-    ["","","","",""],
-    ["Sample period","2010-01-15 → 2019-12-27","","",""],
-    ["Frequency","Weekly (Friday close)","","",""],
-    ["Train / Test","70% / 30%  (2010-2016 / 2017-2019)","","",""],
-    ["Observations (total)", N,"","",""],
-    ["Train weeks", N_tr,"","",""],
-    ["Test weeks", N_te,"","",""],
-    ["","","","",""],
-    ["ARIMAX FIT","","","",""],
-    ["R²", f"{r2:.4f}","","",""],
-    ["Adj. R²", f"{adj_r2:.4f}","","",""],
-    ["AIC", f"{aic:.1f}","","",""],
-    ["BIC", f"{bic:.1f}","","",""],
-    ["Residual σ (weekly)", f"{np.std(resid_tr)*100:.4f}%","","",""],
-    ["Residual σ (annual)", f"{np.std(resid_tr)*np.sqrt(52)*100:.2f}%","","",""],
-    ["","","","",""],
-    ["TEST ACCURACY","","","",""],
-    ["MAE", f"${mae:.2f}","","",""],
-    ["MAPE", f"{mape:.2f}%","","",""],
-    ["Directional Accuracy", f"{dstat:.1f}%","","",""],
-    ["Theil's U", f"{theilu:.3f}","","",""],
-    ["","","","",""],
-    ["GARCH(1,1)","","","",""],
-    ["ω (omega)", f"{omega_g:.8f}","","",""],
-    ["α (alpha)", f"{alpha_g:.4f}","","",""],
-    ["β (beta)", f"{beta_g:.4f}","","",""],
-    ["Persistence α+β", f"{persist:.4f}","","",""],
-    ["Shock half-life (weeks)", f"{half_life:.1f}","","",""],
-    ["Long-run vol (annual)", f"{np.sqrt(uncond_var)*np.sqrt(52)*100:.2f}%","","",""],
-]
-model_summary_df = pd.DataFrame(rows)
-
-coef_df = pd.DataFrame({
-    "Variable":   col_names,
-    "Coefficient":beta,
-    "HAC_Std_Err":se_hac,
-    "t_stat_HAC": t_hac,
-    "p_value_HAC":p_hac,
-    "Significance":[sig_stars(p) or "—" for p in p_hac],
-    "Expected_Sign":["—","—","—"] + [EXPECTED_SIGN_TEXT.get(col, "—") for col in exog_cols],
-    "Sign_Correct": ["—","—","—"] + [
-        sign_match(beta[i + 3], EXPECTED_SIGN.get(col))
-        for i, col in enumerate(exog_cols)
-    ],
-})
-
-fc_rows = []
-for w in range(H):
-    fc_rows.append({
-        "Week":          w+1,
-        "Date":          fc_dates[w].strftime("%Y-%m-%d"),
-        "Base_Price":    round(base["prices"][w],2),
-        "Base_Lo95":     round(base["lo95"][w],2),
-        "Base_Hi95":     round(base["hi95"][w],2),
-        "Base_Vol_Ann":  round(base["vols"][w],2),
-        "Bull_Price":    round(bull["prices"][w],2),
-        "Bull_Lo95":     round(bull["lo95"][w],2),
-        "Bull_Hi95":     round(bull["hi95"][w],2),
-        "Bear_Price":    round(bear["prices"][w],2),
-        "Bear_Lo95":     round(bear["lo95"][w],2),
-        "Bear_Hi95":     round(bear["hi95"][w],2),
+def write_excel_report(weekly, arimax, garch, backtest, scenarios, expected_sign, expected_sign_text, output_dir):
+    print("\n[8] Writing Excel results report...")
+
+    master = weekly["master"]
+    N, N_tr, N_te = len(master), len(weekly["train"]), len(weekly["test"])
+    beta, resid_tr, exog_cols = arimax["beta"], arimax["resid_tr"], arimax["exog_cols"]
+    p_hac = arimax["p_hac"]
+    base, bull, bear = scenarios["base"], scenarios["bull"], scenarios["bear"]
+    fc_dates = scenarios["fc_dates"]
+
+    os.makedirs(output_dir, exist_ok=True)
+    excel_path = f"{output_dir}/wti_surge_model_results.xlsx"
+    excel_engine = "xlsxwriter" if importlib.util.find_spec("xlsxwriter") else "openpyxl"
+
+    rows = [
+        ["ARIMAX-GARCH OIL SURGE MODEL","","","",""],
+        ["","","","",""],
+        ["Sample period","2010-01-15 → 2019-12-27","","",""],
+        ["Frequency","Weekly (Friday close)","","",""],
+        ["Train / Test","70% / 30%  (2010-2016 / 2017-2019)","","",""],
+        ["Observations (total)", N,"","",""],
+        ["Train weeks", N_tr,"","",""],
+        ["Test weeks", N_te,"","",""],
+        ["","","","",""],
+        ["ARIMAX FIT","","","",""],
+        ["R²", f"{arimax['r2']:.4f}","","",""],
+        ["Adj. R²", f"{arimax['adj_r2']:.4f}","","",""],
+        ["AIC", f"{arimax['aic']:.1f}","","",""],
+        ["BIC", f"{arimax['bic']:.1f}","","",""],
+        ["Residual σ (weekly)", f"{np.std(resid_tr)*100:.4f}%","","",""],
+        ["Residual σ (annual)", f"{np.std(resid_tr)*np.sqrt(52)*100:.2f}%","","",""],
+        ["","","","",""],
+        ["TEST ACCURACY","","","",""],
+        ["MAE", f"${backtest['mae']:.2f}","","",""],
+        ["MAPE", f"{backtest['mape']:.2f}%","","",""],
+        ["Directional Accuracy", f"{backtest['dstat']:.1f}%","","",""],
+        ["Theil's U", f"{backtest['theilu']:.3f}","","",""],
+        ["","","","",""],
+        ["GARCH(1,1)","","","",""],
+        ["ω (omega)", f"{garch['omega']:.8f}","","",""],
+        ["α (alpha)", f"{garch['alpha']:.4f}","","",""],
+        ["β (beta)", f"{garch['beta']:.4f}","","",""],
+        ["Persistence α+β", f"{garch['persist']:.4f}","","",""],
+        ["Shock half-life (weeks)", f"{garch['half_life']:.1f}","","",""],
+        ["Long-run vol (annual)", f"{np.sqrt(garch['uncond_var'])*np.sqrt(52)*100:.2f}%","","",""],
+    ]
+    model_summary_df = pd.DataFrame(rows)
+
+    coef_df = pd.DataFrame({
+        "Variable":   arimax["col_names"],
+        "Coefficient":beta,
+        "HAC_Std_Err":arimax["se_hac"],
+        "t_stat_HAC": arimax["t_hac"],
+        "p_value_HAC":p_hac,
+        "Significance":[sig_stars(p) or "—" for p in p_hac],
+        "Expected_Sign":["—","—","—"] + [expected_sign_text.get(col, "—") for col in exog_cols],
+        "Sign_Correct": ["—","—","—"] + [
+            sign_match(beta[i + 3], expected_sign.get(col))
+            for i, col in enumerate(exog_cols)
+        ],
     })
-fc_df = pd.DataFrame(fc_rows)
-
-assump = pd.DataFrame([
-    ["Base","Partial Hormuz disruption; OPEC+ holds cuts",
-     "OVX stays elevated ~40-50","DXY modest strength","Gradual diplomatic progress",
-     f"Wk12: ${base['prices'][11]:.0f}  Wk26: ${base['prices'][-1]:.0f}"],
-    ["Bull","Full Hormuz blockade; Iranian production halted",
-     "OVX spikes to 60-80","DXY weakens on risk-off","No deal; escalation continues",
-     f"Wk12: ${bull['prices'][11]:.0f}  Wk26: ${bull['prices'][-1]:.0f}"],
-    ["Bear","Ceasefire reached; Hormuz reopens",
-     "OVX collapses to 25-30","OPEC+ eases cuts","Supply restored within weeks",
-     f"Wk12: ${bear['prices'][11]:.0f}  Wk26: ${bear['prices'][-1]:.0f}"],
-], columns=["Scenario","Geopolitical Driver","OVX Path",
-            "DXY Path","Resolution","WTI Forecast"])
-
-with pd.ExcelWriter(excel_path, engine=excel_engine) as wr:
-    model_summary_df.to_excel(wr, sheet_name="Model_Summary", index=False, header=False)
-    coef_df.to_excel(wr, sheet_name="ARIMAX_Coefficients", index=False)
-    fc_df.to_excel(wr, sheet_name="Scenario_Forecasts", index=False)
-    assump.to_excel(wr, sheet_name="Scenario_Assumptions", index=False)
-    master.to_excel(wr, sheet_name="Master_Weekly_Data")
-
-    if excel_engine == "xlsxwriter":
-        wb_x = wr.book
-        hdr  = wb_x.add_format({"bold":True,"bg_color":"#0D2137","font_color":"#FFFFFF","border":1,"align":"center"})
-        bold = wb_x.add_format({"bold":True})
-
-        ws = wr.sheets["Model_Summary"]
-        ws.set_column("A:A", 30)
-        ws.set_column("B:F", 16)
-        for r_i, row in enumerate(rows):
-            for c_i, val in enumerate(row):
-                ws.write(r_i, c_i, val, bold if c_i == 0 and val else None)
-
-        ws2 = wr.sheets["ARIMAX_Coefficients"]
-        ws2.set_column("A:A", 26)
-        ws2.set_column("B:H", 16)
-        for c_i, col in enumerate(coef_df.columns):
-            ws2.write(0, c_i, col, hdr)
-
-        ws3 = wr.sheets["Scenario_Forecasts"]
-        ws3.set_column("A:B", 10)
-        ws3.set_column("C:M", 13)
-        for c_i, col in enumerate(fc_df.columns):
-            ws3.write(0, c_i, col, hdr)
-
-        ws4 = wr.sheets["Scenario_Assumptions"]
-        ws4.set_column("A:A", 10)
-        ws4.set_column("B:F", 36)
-        for c_i, col in enumerate(assump.columns):
-            ws4.write(0, c_i, col, hdr)
-
-        ws5 = wr.sheets["Master_Weekly_Data"]
-        ws5.set_column("A:A", 14)
-        ws5.set_column("B:Z", 14)
-        ws5.freeze_panes(1, 1)
-
-print(f"    Excel report ({excel_engine}) → {excel_path}")
+
+    fc_rows = []
+    for w in range(len(fc_dates)):
+        fc_rows.append({
+            "Week":          w+1,
+            "Date":          fc_dates[w].strftime("%Y-%m-%d"),
+            "Base_Price":    round(base["prices"][w],2),
+            "Base_Lo95":     round(base["lo95"][w],2),
+            "Base_Hi95":     round(base["hi95"][w],2),
+            "Base_Vol_Ann":  round(base["vols"][w],2),
+            "Bull_Price":    round(bull["prices"][w],2),
+            "Bull_Lo95":     round(bull["lo95"][w],2),
+            "Bull_Hi95":     round(bull["hi95"][w],2),
+            "Bear_Price":    round(bear["prices"][w],2),
+            "Bear_Lo95":     round(bear["lo95"][w],2),
+            "Bear_Hi95":     round(bear["hi95"][w],2),
+        })
+    fc_df = pd.DataFrame(fc_rows)
+
+    assump = pd.DataFrame([
+        ["Base","Partial Hormuz disruption; OPEC+ holds cuts",
+         "OVX stays elevated ~40-50","DXY modest strength","Gradual diplomatic progress",
+         f"Wk12: ${base['prices'][11]:.0f}  Wk26: ${base['prices'][-1]:.0f}"],
+        ["Bull","Full Hormuz blockade; Iranian production halted",
+         "OVX spikes to 60-80","DXY weakens on risk-off","No deal; escalation continues",
+         f"Wk12: ${bull['prices'][11]:.0f}  Wk26: ${bull['prices'][-1]:.0f}"],
+        ["Bear","Ceasefire reached; Hormuz reopens",
+         "OVX collapses to 25-30","OPEC+ eases cuts","Supply restored within weeks",
+         f"Wk12: ${bear['prices'][11]:.0f}  Wk26: ${bear['prices'][-1]:.0f}"],
+    ], columns=["Scenario","Geopolitical Driver","OVX Path",
+                "DXY Path","Resolution","WTI Forecast"])
+
+    with pd.ExcelWriter(excel_path, engine=excel_engine) as wr:
+        model_summary_df.to_excel(wr, sheet_name="Model_Summary", index=False, header=False)
+        coef_df.to_excel(wr, sheet_name="ARIMAX_Coefficients", index=False)
+        fc_df.to_excel(wr, sheet_name="Scenario_Forecasts", index=False)
+        assump.to_excel(wr, sheet_name="Scenario_Assumptions", index=False)
+        master.to_excel(wr, sheet_name="Master_Weekly_Data")
+
+        if excel_engine == "xlsxwriter":
+            wb_x = wr.book
+            hdr  = wb_x.add_format({"bold":True,"bg_color":"#0D2137","font_color":"#FFFFFF","border":1,"align":"center"})
+            bold = wb_x.add_format({"bold":True})
+
+            ws = wr.sheets["Model_Summary"]
+            ws.set_column("A:A", 30)
+            ws.set_column("B:F", 16)
+            for r_i, row in enumerate(rows):
+                for c_i, val in enumerate(row):
+                    ws.write(r_i, c_i, val, bold if c_i == 0 and val else None)
+
+            ws2 = wr.sheets["ARIMAX_Coefficients"]
+            ws2.set_column("A:A", 26)
+            ws2.set_column("B:H", 16)
+            for c_i, col in enumerate(coef_df.columns):
+                ws2.write(0, c_i, col, hdr)
+
+            ws3 = wr.sheets["Scenario_Forecasts"]
+            ws3.set_column("A:B", 10)
+            ws3.set_column("C:M", 13)
+            for c_i, col in enumerate(fc_df.columns):
+                ws3.write(0, c_i, col, hdr)
+
+            ws4 = wr.sheets["Scenario_Assumptions"]
+            ws4.set_column("A:A", 10)
+            ws4.set_column("B:F", 36)
+            for c_i, col in enumerate(assump.columns):
+                ws4.write(0, c_i, col, hdr)
+
+            ws5 = wr.sheets["Master_Weekly_Data"]
+            ws5.set_column("A:A", 14)
+            ws5.set_column("B:Z", 14)
+            ws5.freeze_panes(1, 1)
+
+    print(f"    Excel report ({excel_engine}) → {excel_path}")
+    return excel_path
 
 # ═══════════════════════════════════════════════════════════════════════════
 # BLOCK 9 — PRINT FINAL SUMMARY
 # ═══════════════════════════════════════════════════════════════════════════
-print(f"""
+def print_summary(arimax, garch, backtest, conditions, scenarios):
+    base, bull, bear = scenarios["base"], scenarios["bull"], scenarios["bear"]
+    vi = arimax["importance"]
+
+    print(f"""
 {'='*70}
   FINAL RESULTS SUMMARY
 {'='*70}
 
   MODEL: ARIMAX(2,1,0)-GARCH(1,1)  |  Real Data 2010–2019
   ─────────────────────────────────────────────────────────
-  In-sample  R²         : {r2:.4f}   (Adj: {adj_r2:.4f})
-  Out-of-sample MAPE    : {mape:.2f}%
-  Directional accuracy  : {dstat:.1f}%   (vs 50% random)
-  Theil's U             : {theilu:.3f}   (<1 beats random walk ✓)
-  GARCH persistence     : {persist:.4f}  (half-life {half_life:.1f} wks)
+  In-sample  R²         : {arimax['r2']:.4f}   (Adj: {arimax['adj_r2']:.4f})
+  Out-of-sample MAPE    : {backtest['mape']:.2f}%
+  Directional accuracy  : {backtest['dstat']:.1f}%   (vs 50% random)
+  Theil's U             : {backtest['theilu']:.3f}   (<1 beats random walk ✓)
+  GARCH persistence     : {garch['persist']:.4f}  (half-life {garch['half_life']:.1f} wks)
 
   TOP SIGNIFICANT VARIABLES (HAC robust, real data):
 """)
-for nm, ta, pv, coef in vi[:6]:
-    sig = sig_stars(pv) or "—"
-    print(f"    {'★' if pv<0.01 else '·'} {nm:<26}  β={coef:+.5f}  |t|={ta:.2f}  {sig}")
+    for nm, ta, pv, coef in vi[:6]:
+        sig = sig_stars(pv) or "—"
+        print(f"    {'★' if pv<0.01 else '·'} {nm:<26}  β={coef:+.5f}  |t|={ta:.2f}  {sig}")
 
-top_name, top_t, top_p, top_beta = vi[0]
-top_direction = "positive" if top_beta > 0 else "negative"
+    top_name, top_t, top_p, top_beta = vi[0]
+    top_direction = "positive" if top_beta > 0 else "negative"
 
-print(f"""
+    print(f"""
   OIL SURGE SCENARIO FORECAST (Apr → Oct 2026):
   ─────────────────────────────────────────────
-  Starting WTI: ${curr_wti:.0f}/barrel  (Apr 4, 2026)
+  Starting WTI: ${conditions['curr_wti']:.0f}/barrel  (Apr 4, 2026)
 
   BULL  (Hormuz blockade): Wk4 ${bull['prices'][3]:.0f}  → Wk12 ${bull['prices'][11]:.0f}  → Wk26 ${bull['prices'][-1]:.0f}
   BASE  (Partial disruption): Wk4 ${base['prices'][3]:.0f} → Wk12 ${base['prices'][11]:.0f} → Wk26 ${base['prices'][-1]:.0f}
@@ -911,3 +966,169 @@ print(f"""
   with a {top_direction} coefficient of {top_beta:+.4f} (|t|={top_t:.2f}{sig_stars(top_p)}).
 {'='*70}
 """)
+
+# ═══════════════════════════════════════════════════════════════════════════
+# BLOCK 10 — MONTE CARLO SCENARIO FANS (on request: --stages monte_carlo)
+# Simulated ARIMAX-GARCH paths instead of the analytic ±1.96·sqrt(cum var)
+# bands, so fat tails and AR feedback on shocks show up in the fan.
+# ═══════════════════════════════════════════════════════════════════════════
+def scenario_exog_path(scenario, exog_betas, exog_cols, horizon):
+    return scenario_shock_matrix(scenario, exog_cols, horizon) @ exog_betas
+
+def monte_carlo_scenarios(weekly, arimax, garch, conditions, horizon, forecast_start,
+                          n_paths, innovations, chunk_size, seed, n_jobs):
+    print(f"\n[10] Simulating {n_paths:,} ARIMAX-GARCH paths per scenario ({innovations} innovations)...")
+
+    wti_close = weekly["master"]["WTI_Close"]
+    curr_wti = conditions["curr_wti"]
+    prev_returns = start_returns(wti_close, curr_wti)
+    spec = fit_innovations(innovations, arimax["resid_tr"], garch["h_series"])
+    if innovations == "t":
+        print(f"    Student-t innovations: fitted df = {spec['df']:.2f}")
+
+    exog_paths = {
+        name: scenario_exog_path(name, arimax["beta"][3:], arimax["exog_cols"], horizon)
+        for name in ("base", "bull", "bear")
+    }
+    fans = simulate_scenarios(exog_paths, arimax["beta"], garch, curr_wti, prev_returns, spec,
+                              n_paths=n_paths, chunk_size=chunk_size, seed=seed, n_jobs=n_jobs)
+    fc_dates = pd.date_range(forecast_start, periods=horizon, freq="W-FRI")
+
+    for name, fan in fans.items():
+        pct = fan["percentiles"]
+        print(f"\n  ── {name.upper()} — simulated price percentiles ──")
+        print("    " + " " * 16 + "".join(f"{f'P{p:g}':>10}" for p in pct) + f"{'vol P50':>10}")
+        for w in [0, 3, 7, 11, 17, 25]:
+            if w < horizon:
+                print(f"    Wk {w+1:>2} ({fc_dates[w].strftime('%b %d')})  "
+                      + "".join(f"{'$' + format(v, '.2f'):>10}" for v in fan["prices"][:, w])
+                      + f"{fan['vols'][pct.index(50.0), w] if 50.0 in pct else np.nan:>9.1f}%")
+
+    return {"fans": fans, "fc_dates": fc_dates, "innovations": spec}
+
+# ═══════════════════════════════════════════════════════════════════════════
+# BLOCK 11 — SCENARIO GRID SWEEP (on request: --stages scenario_grid)
+# Every combination of constant weekly shocks to the swept variables, on top
+# of a named scenario's path for the rest.
+# ═══════════════════════════════════════════════════════════════════════════
+def scenario_grid_sweep(weekly, arimax, conditions, horizon, base_scenario, axes, points):
+    n_scenarios = points ** len(axes)
+    print(f"\n[11] Sweeping {n_scenarios:,} shock combinations ({' × '.join(axes)}) around the {base_scenario} case...")
+
+    exog_cols = arimax["exog_cols"]
+    curr_wti = conditions["curr_wti"]
+    axis_values = {col: np.linspace(lo, hi, points) for col, (lo, hi) in axes.items()}
+    shocks, combos = build_shock_grid(
+        scenario_shock_matrix(base_scenario, exog_cols, horizon),
+        {exog_cols.index(col): values for col, values in axis_values.items()},
+    )
+    prices = scenario_grid(shocks, arimax["beta"], curr_wti, start_returns(weekly["master"]["WTI_Close"], curr_wti))
+
+    final = prices[:, -1]
+    lo, med, hi = np.percentile(final, [5, 50, 95])
+    print(f"    Wk {horizon} price across the grid: P5 ${lo:.2f}  P50 ${med:.2f}  P95 ${hi:.2f}  "
+          f"(range ${final.min():.2f} – ${final.max():.2f})")
+    for label, i in (("Lowest", final.argmin()), ("Highest", final.argmax())):
+        setting = "  ".join(f"{col}={axis_values[col][combos[i, j]]:+.3f}" for j, col in enumerate(axes))
+        print(f"    {label:<8} ${final[i]:>7.2f}  {setting}")
+
+    return {"prices": prices, "combos": combos, "axis_values": axis_values}
+
+# ═══════════════════════════════════════════════════════════════════════════
+# PIPELINE
+# ═══════════════════════════════════════════════════════════════════════════
+def build_pipeline(cache_dir=DEFAULT_STAGE_CACHE_DIR, use_cache=True, output_dir=OUT, path=PATH,
+                   monte_carlo=None, shock_grid=None):
+    """Register the model's stages in run order, each with the constants it reads.
+
+    ``monte_carlo`` and ``shock_grid`` override entries of MONTE_CARLO and
+    SHOCK_GRID for the optional monte_carlo and scenario_grid stages.
+    """
+    pipeline = Pipeline(cache_dir=cache_dir, use_cache=use_cache)
+    stage = pipeline.stage
+
+    stage("sheets",
+          params={"path": path, "source": file_signature(path), "required_sheets": REQUIRED_SHEETS})(load_sheets)
+    stage("weekly", inputs=("sheets",),
+          params={"required_sheets": REQUIRED_SHEETS, "weekly_range": WEEKLY_RANGE,
+                  "opec_cut_windows": OPEC_CUT_WINDOWS, "train_end": TRAIN_END})(build_weekly)
+    stage("arimax", inputs=("weekly",), params={"exog": EXOG})(fit_arimax)
+    stage("garch", inputs=("arimax",), params={"start": GARCH11_START, "bounds": GARCH11_BOUNDS})(fit_garch)
+    stage("backtest", inputs=("weekly", "arimax"))(backtest)
+    stage("conditions", inputs=("weekly",))(current_conditions)
+    stage("scenarios", inputs=("weekly", "arimax", "garch", "conditions"),
+          params={"horizon": H, "forecast_start": FORECAST_START})(forecast_scenarios)
+    stage("surges", inputs=("weekly",), params={"surges": SURGES})(historical_surges)
+    stage("dashboard", inputs=("weekly", "arimax", "garch", "conditions", "scenarios", "surges"),
+          params={"surge_windows": SURGES, "palette": C, "output_dir": output_dir}, artifacts=True)(render_dashboard)
+    stage("excel", inputs=("weekly", "arimax", "garch", "backtest", "scenarios"),
+          params={"expected_sign": EXPECTED_SIGN, "expected_sign_text": EXPECTED_SIGN_TEXT,
+                  "output_dir": output_dir}, artifacts=True)(write_excel_report)
+    stage("summary", inputs=("arimax", "garch", "backtest", "conditions", "scenarios"))(print_summary)
+    stage("monte_carlo", inputs=("weekly", "arimax", "garch", "conditions"),
+          params={"horizon": H, "forecast_start": FORECAST_START, **MONTE_CARLO, **(monte_carlo or {})},
+          default=False)(monte_carlo_scenarios)
+    stage("scenario_grid", inputs=("weekly", "arimax", "conditions"),
+          params={"horizon": H, **SHOCK_GRID, **(shock_grid or {})},
+          default=False)(scenario_grid_sweep)
+    return pipeline
+
+def run_pipeline(stages=None, force=(), cache_dir=DEFAULT_STAGE_CACHE_DIR, use_cache=True, output_dir=OUT,
+                 monte_carlo=None, shock_grid=None):
+    """Run ``stages`` (the default ones if None) plus their inputs; returns ``(results, log)``."""
+    pipeline = build_pipeline(cache_dir=cache_dir, use_cache=use_cache, output_dir=output_dir,
+                              monte_carlo=monte_carlo, shock_grid=shock_grid)
+    return pipeline.run(stages, force=force)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="ARIMAX-GARCH oil surge model, run as cached stages.")
+    parser.add_argument("--stages", nargs="+", help="Stages to run; their inputs come from the cache when fresh. Default: all but monte_carlo and scenario_grid.")
+    parser.add_argument("--force", nargs="+", default=[], help="Stages to recompute even if cached.")
+    parser.add_argument("--cache-dir", default=DEFAULT_STAGE_CACHE_DIR, help="Directory for cached stage results.")
+    parser.add_argument("--no-cache", action="store_true", help="Run every stage without reading or writing the cache.")
+    parser.add_argument("--clear-cache", action="store_true", help="Delete cached stage results before running.")
+    parser.add_argument("--output-dir", default=OUT, help="Directory for the dashboard PNG and Excel report.")
+    parser.add_argument("--list", action="store_true", help="List stages and their inputs, then exit.")
+    parser.add_argument("--timings", action="store_true", help="Print whether each stage ran or was cached, and how long it took.")
+    parser.add_argument("--mc-paths", type=int, default=MONTE_CARLO["n_paths"], help="Monte Carlo paths per scenario.")
+    parser.add_argument("--innovations", choices=INNOVATION_METHODS, default=MONTE_CARLO["innovations"], help="Monte Carlo shock distribution.")
+    parser.add_argument("--chunk-size", type=int, default=MONTE_CARLO["chunk_size"], help="Paths simulated per vectorized chunk.")
+    parser.add_argument("--seed", type=int, default=MONTE_CARLO["seed"], help="Monte Carlo random seed.")
+    parser.add_argument("--n-jobs", type=int, default=MONTE_CARLO["n_jobs"], help="Processes for the Monte Carlo scenarios. 0 uses all CPUs.")
+    parser.add_argument("--grid-points", type=int, default=SHOCK_GRID["points"], help="Values per swept variable in the scenario grid.")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    monte_carlo = {"n_paths": args.mc_paths, "innovations": args.innovations,
+                   "chunk_size": args.chunk_size, "seed": args.seed, "n_jobs": args.n_jobs}
+    pipeline = build_pipeline(cache_dir=args.cache_dir, use_cache=not args.no_cache,
+                              output_dir=args.output_dir, monte_carlo=monte_carlo,
+                              shock_grid={"points": args.grid_points})
+
+    if args.list:
+        for name, spec in pipeline.stages.items():
+            inputs = ", ".join(spec["inputs"]) or "—"
+            print(f"{name:<14} ← {inputs}{'' if spec['default'] else '  (on request)'}")
+        return
+    if args.clear_cache:
+        print(f"Cleared {pipeline.clear()} cached stage results from {args.cache_dir}")
+
+    print("=" * 70)
+    print("  WTI CRUDE OIL — OIL SURGE FORECASTING MODEL")
+    print("  ARIMAX-GARCH | Real Data 2010-2019 | Forward Projection Apr 2026")
+    print("=" * 70)
+
+    # Validate --force names up front rather than silently ignoring a typo.
+    pipeline.dependencies(args.force)
+    _, log = pipeline.run(args.stages, force=args.force)
+
+    if args.timings:
+        print(f"\n  {'Stage':<14} {'Status':<8} {'Seconds':>9}")
+        for entry in log:
+            print(f"  {entry['stage']:<14} {entry['status']:<8} {entry['seconds']:>9.3f}")
+        print(f"  {'total':<14} {'':<8} {sum(entry['seconds'] for entry in log):>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+import glob
+import os
+from pathlib import Path
+
+
+BATCH_SUFFIXES = {".csv", ".txt", ".tsv", ".xlsx", ".xls"}
+DEFAULT_N_JOBS = 1
+
+
+def resolve_n_jobs(n_jobs, n_tasks=None):
+    """Worker processes to start: ``n_jobs`` (0 or None for one per CPU), capped at ``n_tasks``."""
+    if n_jobs is None or n_jobs <= 0:
+        n_jobs = os.cpu_count() or 1
+    if n_tasks is not None:
+        n_jobs = min(n_jobs, max(n_tasks, 1))
+    return n_jobs
+
+
+def resolve_batch_inputs(pattern):
+    """Sorted CSV/XLSX files in a directory or matching a glob pattern."""
+    path = Path(pattern)
+    if path.is_dir():
+        candidates = path.iterdir()
+    else:
+        candidates = (Path(match) for match in glob.glob(pattern, recursive=True))
+    files = sorted(candidate for candidate in candidates if candidate.is_file() and candidate.suffix.lower() in BATCH_SUFFIXES)
+    if not files:
+        raise FileNotFoundError(f"No CSV/XLSX inputs matched {pattern}")
+    return files
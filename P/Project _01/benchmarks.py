@@ -0,0 +1,908 @@
+import argparse
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from pathlib import Path
+
+os.environ.setdefault("MPLCONFIGDIR", tempfile.gettempdir())
+
+import numpy as np
+import pandas as pd
+from arch import arch_model
+from scipy.optimize import minimize
+
+import garch_server
+import generate_ovx_workbook
+import time_series_utils
+import WTI_model
+from batch_utils import resolve_n_jobs
+from ewma import DEFAULT_LAMBDAS, ewma_variance, optimal_lambda
+from Garch import GarchModel, format_spec, tournament_specs
+from garch_kernel import GARCH11_BOUNDS, GARCH11_START, fit_garch11, garch11_nll_grad
+from hac import HAC_KERNELS, hac_vcov, select_bandwidth
+from instrumentation import StageProfiler
+from scenario_sim import (INNOVATION_METHODS, build_shock_grid, draw_innovations,
+                          fit_innovations, scenario_grid, simulate_paths, simulate_scenarios)
+from series_store import SeriesStore, make_store_uri
+from time_series_utils import load_time_series, load_workbook_sheets, resolve_column, stream_time_series, workbook_sidecar_path
+
+PROJECT_DIR = Path(__file__).resolve().parent
+DEFAULT_DATA_PATH = PROJECT_DIR.parents[1] / "Data_center" / "OVXCLS.csv"
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def load_quiet_model(data_path):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return GarchModel(data_path=str(data_path))
+
+
+def naive_rolling_forecast(returns, window, step=1):
+    # Mirrors the Var.py section 14 loop: a fresh cold-started fit per window.
+    rows = []
+    for end in range(window, len(returns), step):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            fit = arch_model(returns.iloc[end - window:end], vol="GARCH", p=1, q=1).fit(disp="off")
+            forecast = fit.forecast(horizon=1, reindex=False)
+        rows.append((returns.index[end], float(forecast.variance.values[-1, 0])))
+    return pd.DataFrame(rows, columns=["forecast_date", "forecast_variance"]).set_index("forecast_date")
+
+
+def benchmark_rolling(args):
+    model = load_quiet_model(args.data_path)
+    returns = model.returns
+    if args.limit:
+        returns = returns.iloc[: args.window + args.limit]
+        model.returns = returns
+
+    print(f"Rolling GARCH(1, 1) benchmark on {Path(args.data_path).name}")
+    print(f"Window={args.window}  step={args.step}  origins={len(range(args.window, len(returns), args.step))}")
+
+    naive_df, naive_time = timed(naive_rolling_forecast, returns, args.window, args.step)
+    print(f"  naive cold-start loop           : {naive_time:8.2f}s")
+
+    for refit_every in args.refit_every:
+        rolling_df, rolling_time = timed(
+            model.rolling_forecast,
+            window=args.window,
+            step=args.step,
+            refit_every=refit_every,
+        )
+        rel_diff = (rolling_df["forecast_variance"] / naive_df["forecast_variance"] - 1).abs()
+        print(
+            f"  rolling_forecast(refit_every={refit_every:>3}): {rolling_time:8.2f}s  "
+            f"speedup={naive_time / rolling_time:5.1f}x  "
+            f"median |rel diff|={rel_diff.median():.2%}  p95={rel_diff.quantile(0.95):.2%}"
+        )
+
+
+def benchmark_stream(args):
+    model = load_quiet_model(args.data_path)
+    with contextlib.redirect_stdout(io.StringIO()):
+        model.fit()
+    model.start_stream()
+
+    rng = np.random.default_rng(args.seed)
+    daily_vol = float(model.returns.std()) / 100
+    ticks = float(model.series.iloc[-1]) * np.exp(np.cumsum(rng.normal(0.0, daily_vol, args.ticks)))
+
+    print(f"Streaming GARCH(1, 1) update benchmark on {Path(args.data_path).name}")
+
+    start = time.perf_counter()
+    for level in ticks:
+        model.update(level)
+    per_call = (time.perf_counter() - start) / len(ticks)
+    print(f"  update() one tick per call : {per_call * 1e6:8.2f} us/tick")
+
+    _, batch_time = timed(model.update, ticks)
+    print(f"  update() one batched call  : {batch_time / len(ticks) * 1e6:8.2f} us/tick")
+
+    def reload_and_refit():
+        refit_model = GarchModel(data_path=str(args.data_path))
+        refit_model.fit()
+        return refit_model.forecast(horizon=1)
+
+    _, refit_time = timed(reload_and_refit)
+    print(f"  reload CSV + refit         : {refit_time * 1e6:8.0f} us/tick  ({refit_time / per_call:,.0f}x slower)")
+
+
+def benchmark_server(args):
+    data_path = str(Path(args.data_path).resolve())
+    payload = {"data_path": data_path, "horizon": args.horizon}
+    print(f"GARCH server latency benchmark on {Path(data_path).name}")
+
+    server = subprocess.Popen(
+        [sys.executable, str(PROJECT_DIR / "garch_server.py"), "--port", str(args.port), "serve"],
+        cwd=PROJECT_DIR,
+        stdout=subprocess.DEVNULL,
+    )
+    try:
+        garch_server.wait_until_ready(port=args.port)
+        _, first_time = timed(garch_server.send_request, "forecast", payload, port=args.port)
+        print(f"  first request (load + fit)  : {first_time * 1000:9.1f} ms")
+
+        latencies = []
+        for _ in range(args.requests):
+            _, elapsed = timed(garch_server.send_request, "forecast", payload, port=args.port)
+            latencies.append(elapsed)
+        latencies = np.array(latencies) * 1000
+        print(
+            f"  warm forecast requests      : median {np.median(latencies):7.2f} ms  "
+            f"p95 {np.percentile(latencies, 95):7.2f} ms  over {args.requests} requests"
+        )
+    finally:
+        server.terminate()
+        server.wait()
+
+    cold_times = []
+    for _ in range(args.cold_runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, str(PROJECT_DIR / "Garch.py"), "--data-path", data_path, "--horizon", str(args.horizon)],
+            cwd=PROJECT_DIR,
+            stdout=subprocess.DEVNULL,
+            check=True,
+        )
+        cold_times.append(time.perf_counter() - start)
+    cold_median = np.median(cold_times) * 1000
+    print(
+        f"  cold Garch.py CLI run       : median {cold_median:7.0f} ms  over {args.cold_runs} runs  "
+        f"({cold_median / np.median(latencies):,.0f}x the warm median)"
+    )
+
+
+def full_scan_schema(df):
+    # Mirrors the original inference: every column parsed in full before scoring.
+    date_column = resolve_column(df.columns, candidates=time_series_utils.DATE_CANDIDATES)
+    if date_column is None:
+        best_score = 0.0
+        for column in df.columns:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                score = pd.to_datetime(df[column], errors="coerce").notna().head(200).mean()
+            if score > best_score:
+                best_score, date_column = score, column
+        date_column = date_column if best_score >= 0.8 else None
+
+    numeric_scores = []
+    for column in df.columns:
+        if column == date_column:
+            continue
+        score = pd.to_numeric(df[column], errors="coerce").notna().mean()
+        if score > 0:
+            numeric_scores.append((score, column))
+    numeric_scores.sort(reverse=True)
+    return date_column, numeric_scores[0][1]
+
+
+def benchmark_schema(args):
+    rng = np.random.default_rng(args.seed)
+    columns = {"obs_date": pd.bdate_range("1990-01-01", periods=args.rows).strftime("%Y-%m-%d")}
+    for position in range(args.columns - 1):
+        values = rng.normal(size=args.rows).round(4).astype(str)
+        # A share of text columns, as in wide spreadsheet exports.
+        columns[f"field_{position:03d}"] = values if position % 4 else np.where(values < "0", "n/a", values)
+    df = pd.DataFrame(columns)
+    print(f"Schema inference benchmark on {args.rows:,} rows x {args.columns} text columns")
+
+    full_schema, full_time = timed(full_scan_schema, df)
+    time_series_utils._schema_cache.clear()
+    sampled_schema, sampled_time = timed(time_series_utils.resolve_schema, df)
+    _, cached_time = timed(time_series_utils.resolve_schema, df)
+    print(f"  full-column scan        : {full_time * 1000:9.1f} ms  -> {full_schema}")
+    print(f"  sampled inference       : {sampled_time * 1000:9.1f} ms  -> {sampled_schema}  speedup={full_time / sampled_time:6.1f}x")
+    print(f"  cached schema signature : {cached_time * 1000:9.1f} ms  speedup={full_time / cached_time:6.1f}x")
+
+
+def benchmark_tournament(args):
+    model = load_quiet_model(args.data_path)
+    n_specs = len(tournament_specs(max_p=args.max_p, max_q=args.max_q))
+    print(f"Specification tournament benchmark on {Path(args.data_path).name} ({n_specs} specs, {len(model.returns)} returns)")
+
+    (exhaustive_spec, exhaustive_score, _), exhaustive_time = timed(
+        model.select_best_spec, max_p=args.max_p, max_q=args.max_q, criterion=args.criterion, finalists=n_specs
+    )
+    ranking = model.tournament_history.dropna(subset=["score"]).sort_values("score").reset_index(drop=True)
+    print(f"  exhaustive search : {exhaustive_time:8.2f}s  best {format_spec(exhaustive_spec)}  {args.criterion.upper()}={exhaustive_score:.2f}")
+
+    for finalists in args.finalists:
+        (spec, score, _), tournament_time = timed(
+            model.select_best_spec, max_p=args.max_p, max_q=args.max_q, criterion=args.criterion, finalists=finalists
+        )
+        rank = int(ranking.index[ranking["spec"] == spec][0]) + 1
+        print(
+            f"  tournament (finalists={finalists}): {tournament_time:8.2f}s  speedup={exhaustive_time / tournament_time:5.1f}x  "
+            f"picked {format_spec(spec)}  rank {rank}/{len(ranking)}  {args.criterion.upper()} gap={score - exhaustive_score:.2f}"
+        )
+
+
+def benchmark_term_structure(args):
+    model = load_quiet_model(args.data_path)
+    with contextlib.redirect_stdout(io.StringIO()):
+        model.fit()
+    print(f"Variance term structure benchmark on {Path(args.data_path).name}, horizon={args.horizon}")
+
+    def repeat(func, **kwargs):
+        for _ in range(args.repeats):
+            result = func(**kwargs)
+        return result
+
+    _, forecast_time = timed(repeat, model.forecast, horizon=args.horizon)
+    term_df, term_time = timed(repeat, model.variance_term_structure, horizon=args.horizon)
+    _, var_time = timed(repeat, model.multi_day_var, horizons=(10, args.horizon), term_df=term_df)
+
+    print(f"  forecast(horizon={args.horizon})            : {forecast_time / args.repeats * 1000:8.3f} ms/call")
+    print(
+        f"  variance_term_structure({args.horizon})     : {term_time / args.repeats * 1000:8.3f} ms/call  "
+        f"speedup={forecast_time / term_time:5.1f}x"
+    )
+    print(f"  multi_day_var(10, {args.horizon}) from term : {var_time / args.repeats * 1000:8.3f} ms/call")
+
+
+def benchmark_load(args):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = [Path(args.data_path)]
+        if args.rows:
+            rng = np.random.default_rng(args.seed)
+            dates = pd.bdate_range("1990-01-01", periods=args.rows)
+            levels = 30 * np.exp(np.cumsum(rng.normal(0.0, 0.03, args.rows)))
+            synthetic_path = Path(tmp_dir) / f"synthetic_{args.rows}.csv"
+            pd.DataFrame({"Date": dates.strftime("%Y-%m-%d"), "Value": levels.round(4)}).to_csv(synthetic_path, index=False)
+            paths.append(synthetic_path)
+
+        print("load_time_series sidecar cache benchmark")
+        for path in paths:
+            _, uncached_time = timed(load_time_series, path, cache=False)
+            _, first_time = timed(load_time_series, path, cache_dir=tmp_dir)
+            warm_times = [timed(load_time_series, path, cache_dir=tmp_dir)[1] for _ in range(args.repeats)]
+            warm_time = float(np.median(warm_times))
+            print(
+                f"  {path.name:<24} uncached {uncached_time * 1000:9.2f} ms  first (writes sidecar) {first_time * 1000:9.2f} ms  "
+                f"sidecar {warm_time * 1000:7.2f} ms  speedup={uncached_time / warm_time:6.1f}x"
+            )
+
+
+def per_sheet_reads(workbook_path, required):
+    # What WTI_model did before: one read_excel (and one XLSX parse) per sheet.
+    frames = {}
+    for sheet in required:
+        df = pd.read_excel(workbook_path, sheet_name=sheet, parse_dates=[0])
+        df.columns = [str(c) for c in df.columns]
+        dc = df.columns[0]
+        df[dc] = pd.to_datetime(df[dc], errors="coerce")
+        frames[sheet] = df.dropna(subset=[dc]).set_index(dc)
+    return frames
+
+
+def benchmark_workbook_load(args):
+    required = WTI_model.REQUIRED_SHEETS
+    print(f"load_workbook_sheets on {Path(args.workbook_path).name} ({len(required)} required sheets)")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        _, per_sheet_time = timed(per_sheet_reads, args.workbook_path, required)
+        _, first_time = timed(load_workbook_sheets, args.workbook_path, required, cache_dir=tmp_dir)
+        warm = [timed(load_workbook_sheets, args.workbook_path, required, cache_dir=tmp_dir) for _ in range(args.repeats)]
+        warm_time = float(np.median([seconds for _, seconds in warm]))
+        sidecar_bytes = workbook_sidecar_path(args.workbook_path, tmp_dir).stat().st_size
+
+    print(f"  per-sheet read_excel {per_sheet_time * 1000:8.1f} ms  first (writes sidecar) {first_time * 1000:8.1f} ms")
+    print(f"  sidecar {warm_time * 1000:6.2f} ms ({sidecar_bytes / 1024:.0f} KiB)  speedup={per_sheet_time / warm_time:6.1f}x")
+
+
+def benchmark_stream_load(args):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        rng = np.random.default_rng(args.seed)
+        tick_path = Path(tmp_dir) / "ticks.csv"
+        start = pd.Timestamp("2015-01-01")
+        # Minute prints written block by block so the generator stays small too.
+        with open(tick_path, "w", encoding="utf-8") as handle:
+            handle.write("Timestamp,Price\n")
+            level = 60.0
+            for block_start in range(0, args.rows, 1_000_000):
+                n_rows = min(1_000_000, args.rows - block_start)
+                times = start + pd.to_timedelta(np.arange(block_start, block_start + n_rows), unit="min")
+                prices = level * np.exp(np.cumsum(rng.normal(0.0, 0.0005, n_rows)))
+                level = float(prices[-1])
+                pd.DataFrame({"Timestamp": times.strftime("%Y-%m-%d %H:%M"), "Price": prices.round(4)}).to_csv(
+                    handle, header=False, index=False
+                )
+        size_mb = tick_path.stat().st_size / 1024**2
+        print(f"Streaming loader benchmark on {args.rows:,} minute rows ({size_mb:.0f} MB), target {args.freq}")
+
+        profiler = StageProfiler(run_name="load")
+        with profiler.stage("load_time_series"):
+            series, _ = load_time_series(tick_path, cache=False)
+            _ = series.resample("W-FRI" if args.freq == "W-FRI" else args.freq.replace("M", "ME")).last().dropna()
+        with profiler.stage("stream_time_series"):
+            streamed, metadata = stream_time_series(tick_path, freq=args.freq, chunksize=args.chunksize)
+        profiler.stop()
+
+        for record in profiler.records:
+            print(
+                f"  {record['stage']:<20}: {record['wall_seconds']:7.2f}s  "
+                f"peak traced memory {record['peak_memory_bytes'] / 1024**2:8.1f} MB"
+            )
+        print(f"  {len(streamed)} periods from {metadata['chunks']} chunks")
+
+
+def benchmark_store(args):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store = SeriesStore(tmp_dir)
+        store.import_file("series", args.data_path)
+        uri = make_store_uri("series", tmp_dir)
+        sidecar_dir = Path(tmp_dir) / "sidecar"
+        sidecar_dir.mkdir()
+        load_time_series(args.data_path, cache_dir=sidecar_dir)
+
+        def median_time(func, *func_args, **kwargs):
+            return float(np.median([timed(func, *func_args, **kwargs)[1] for _ in range(args.repeats)]))
+
+        csv_time = median_time(load_time_series, args.data_path, cache=False)
+        sidecar_time = median_time(load_time_series, args.data_path, cache_dir=sidecar_dir)
+        store_time = median_time(load_time_series, uri)
+        last_year = store.read("series")[0].index[-1] - pd.DateOffset(years=1)
+        slice_time = median_time(load_time_series, make_store_uri("series", tmp_dir, start=last_year.date()))
+
+        last_date = store.read("series")[0].index[-1]
+        new_dates = pd.bdate_range(last_date + pd.offsets.BDay(1), periods=args.appends)
+        start = time.perf_counter()
+        for date in new_dates:
+            store.append("series", [date], [1.0])
+        append_time = (time.perf_counter() - start) / args.appends
+
+    print(f"Series store benchmark on {Path(args.data_path).name} (median of {args.repeats} loads)")
+    print(f"  CSV parse                  : {csv_time * 1000:8.3f} ms")
+    print(f"  NPZ sidecar                : {sidecar_time * 1000:8.3f} ms")
+    print(f"  store URI, full history    : {store_time * 1000:8.3f} ms  speedup vs CSV={csv_time / store_time:6.1f}x")
+    print(f"  store URI, last year       : {slice_time * 1000:8.3f} ms")
+    print(f"  append one day             : {append_time * 1000:8.3f} ms  (includes fsync)")
+
+
+def row_dict_table(fitted_values, residuals, omega, alpha, beta, ewma_weight=0.06):
+    # Mirrors the original build_table loop: per-row dicts keyed by sheet row.
+    unconditional_variance = omega / (1 - alpha - beta)
+    residual_by_row, ewma_var_by_row, garch_var_by_row, restricted_var_by_row, predicted_by_row = {}, {}, {}, {}, {}
+    for reg_pos in range(len(residuals)):
+        row_number = 8 + reg_pos
+        residual = float(residuals[reg_pos])
+        predicted_by_row[row_number] = float(fitted_values[reg_pos])
+        residual_by_row[row_number] = residual
+        if row_number == 8:
+            ewma_var = residual**2
+            garch_var = restricted_var = unconditional_variance
+        else:
+            prev_row = row_number - 1
+            ewma_var = ewma_weight * (residual**2) + (1 - ewma_weight) * ewma_var_by_row[prev_row]
+            garch_var = omega + alpha * (residual_by_row[prev_row] ** 2) + beta * garch_var_by_row[prev_row]
+            restricted_var = omega
+        ewma_var_by_row[row_number] = ewma_var
+        garch_var_by_row[row_number] = garch_var
+        restricted_var_by_row[row_number] = restricted_var
+
+    ln_2pi = np.log(2 * np.pi)
+    llf = -0.5 * (
+        sum(garch_var_by_row.values())
+        + sum((residual_by_row[row] ** 2) / garch_var_by_row[row] for row in garch_var_by_row)
+        + len(garch_var_by_row) * ln_2pi
+    )
+    restricted_llf = -0.5 * (
+        sum(restricted_var_by_row.values())
+        + sum((residual_by_row[row] ** 2) / restricted_var_by_row[row] for row in restricted_var_by_row)
+        + len(restricted_var_by_row) * ln_2pi
+    )
+    # The writer then rebuilt lists from the sorted keys.
+    rows = sorted(garch_var_by_row)
+    return np.array([garch_var_by_row[row] for row in rows]), llf, restricted_llf
+
+
+def benchmark_workbook_table(args):
+    rng = np.random.default_rng(args.seed)
+    print("generate_ovx_workbook.build_table: array columns against per-row dicts")
+    for n_rows in args.rows:
+        dates = pd.bdate_range("1990-01-01", periods=n_rows)
+        prices = 30 * np.exp(np.cumsum(rng.normal(0.0, 0.03, n_rows)))
+        frame = pd.DataFrame({"Date": dates.to_list(), "Value": prices})
+        (returns, reg_df, ols, residuals, garch_fit), fit_time = timed(generate_ovx_workbook.fit_models, frame)
+        _, table_time = timed(generate_ovx_workbook.build_table, frame, returns, reg_df, ols, residuals, garch_fit)
+
+        omega, alpha, beta = (float(garch_fit.params[name]) for name in ("omega", "alpha[1]", "beta[1]"))
+        _, loop_time = timed(row_dict_table, ols.fittedvalues.to_numpy(), residuals, omega, alpha, beta)
+        _, recurrence_time = timed(
+            generate_ovx_workbook.variance_recurrences, residuals, omega, alpha, beta, omega / (1 - alpha - beta), 0.06
+        )
+        print(
+            f"  {n_rows:>7,} rows: per-row dict loop {loop_time * 1000:8.2f} ms  array recurrences {recurrence_time * 1000:7.3f} ms "
+            f"({loop_time / recurrence_time:6.1f}x)  full build_table {table_time * 1000:7.2f} ms  "
+            f"(model fit {fit_time:5.2f}s)"
+        )
+
+
+def loop_ewma_variance(returns, decay):
+    # One series, one decay factor: the per-row loop build_table used to run.
+    variance = np.empty(len(returns))
+    variance[0] = returns[0] ** 2
+    for t in range(1, len(returns)):
+        variance[t] = (1 - decay) * returns[t] ** 2 + decay * variance[t - 1]
+    return variance
+
+
+def benchmark_ewma(args):
+    rng = np.random.default_rng(args.seed)
+    lambdas = DEFAULT_LAMBDAS
+    print(f"ewma.ewma_variance: {len(lambdas)} decay factors per series against per-lambda loops")
+    for n_series in args.series:
+        # GARCH-like panel so the likelihood has an interior optimum.
+        shocks = rng.standard_normal((args.rows, n_series))
+        variance = np.full(n_series, 1e-4)
+        panel = np.empty_like(shocks)
+        for t in range(args.rows):
+            panel[t] = np.sqrt(variance) * shocks[t]
+            variance = 2e-6 + 0.08 * panel[t] ** 2 + 0.9 * variance
+
+        def loops():
+            return np.stack(
+                [np.column_stack([loop_ewma_variance(panel[:, j], decay) for j in range(n_series)]) for decay in lambdas],
+                axis=1,
+            )
+
+        _, loop_time = timed(loops)
+        _, engine_time = timed(ewma_variance, panel, lambdas)
+        (best, _), select_time = timed(optimal_lambda, panel, lambdas)
+        print(
+            f"  {n_series:>4} series x {args.rows:,} rows: loops {loop_time:7.2f}s  engine {engine_time * 1000:8.2f} ms "
+            f"({loop_time / engine_time:7.1f}x)  optimal lambda {select_time * 1000:8.2f} ms  "
+            f"median best lambda={np.median(best):.3f}"
+        )
+
+
+def loop_newey_west_vcov(X, e, lags=4):
+    # The per-observation np.outer loop WTI_model.newey_west_vcov used to run.
+    n, k = X.shape
+    XtX_inv = np.linalg.pinv(X.T @ X)
+    S = np.zeros((k, k))
+    for t in range(n):
+        S += e[t] ** 2 * np.outer(X[t], X[t])
+    for lag in range(1, lags + 1):
+        w = 1 - lag / (lags + 1)
+        Gl = sum(e[t] * e[t - lag] * np.outer(X[t], X[t - lag]) for t in range(lag, n))
+        S += w * (Gl + Gl.T)
+    return XtX_inv @ S @ XtX_inv
+
+
+def benchmark_hac(args):
+    rng = np.random.default_rng(args.seed)
+    print(f"hac.hac_vcov against the np.outer loop (Bartlett, {args.lags} lags, {args.regressors} regressors)")
+    for n_rows in args.rows:
+        X = np.column_stack([np.ones(n_rows), rng.standard_normal((n_rows, args.regressors - 1))])
+        noise = rng.standard_normal(n_rows)
+        resid = np.empty(n_rows)
+        resid[0] = noise[0]
+        for t in range(1, n_rows):
+            resid[t] = 0.5 * resid[t - 1] + noise[t]
+
+        _, loop_time = timed(loop_newey_west_vcov, X, resid, args.lags)
+        _, vectorized_time = timed(hac_vcov, X, resid, "bartlett", args.lags + 1)
+        print(
+            f"  {n_rows:>7,} rows: loop {loop_time * 1000:9.1f} ms  vectorized {vectorized_time * 1000:7.2f} ms "
+            f"({loop_time / vectorized_time:7.1f}x)"
+        )
+        automatic = []
+        for kernel in HAC_KERNELS:
+            bandwidth = select_bandwidth(X, resid, kernel=kernel, method="andrews")
+            _, kernel_time = timed(hac_vcov, X, resid, kernel, bandwidth)
+            automatic.append(f"{kernel} bw={bandwidth:5.2f} {kernel_time * 1000:6.2f} ms")
+        print("           Andrews bandwidth: " + "  ".join(automatic))
+
+
+def loop_garch11_nll(params, r):
+    # The pure-Python recursion WTI_model fitted with numerical gradients.
+    omega, alpha, beta_g = params
+    if omega <= 0 or alpha < 0 or beta_g < 0 or alpha + beta_g >= 0.9999:
+        return 1e10
+    h = np.var(r)
+    ll = 0.0
+    for t in range(len(r)):
+        if t > 0:
+            h = omega + alpha * r[t - 1] ** 2 + beta_g * h
+        if h <= 0:
+            return 1e10
+        ll += 0.5 * (np.log(2 * np.pi * h) + r[t] ** 2 / h)
+    return ll
+
+
+def loop_fit_garch11(r):
+    # The loop on the same standardized problem fit_garch11 solves, so both
+    # optimizers run to the same optimum and their times are comparable.
+    scale = np.std(r)
+    units = np.array([scale**2, 1.0, 1.0])
+    bounds = ((GARCH11_BOUNDS[0][0] / units[0], None), *GARCH11_BOUNDS[1:])
+    return minimize(
+        loop_garch11_nll, np.asarray(GARCH11_START) / units, args=(r / scale,), method="L-BFGS-B", bounds=bounds,
+        options={"ftol": 1e-12, "gtol": 1e-8},
+    )
+
+
+def wti_residuals():
+    # Only the stages up to the ARIMAX fit run; nothing is cached or written.
+    with contextlib.redirect_stdout(io.StringIO()):
+        results, _ = WTI_model.run_pipeline(["arimax"], use_cache=False)
+    return results["arimax"]["resid_tr"]
+
+
+def simulate_garch11(n_rows, rng, omega=2e-5, alpha=0.08, beta=0.9):
+    shocks = rng.standard_normal(n_rows)
+    returns = np.empty(n_rows)
+    variance = omega / (1 - alpha - beta)
+    for t in range(n_rows):
+        returns[t] = np.sqrt(variance) * shocks[t]
+        variance = omega + alpha * returns[t] ** 2 + beta * variance
+    return returns
+
+
+def benchmark_garch_kernel(args):
+    rng = np.random.default_rng(args.seed)
+    samples = [("WTI ARIMAX residuals", wti_residuals())]
+    samples += [(f"simulated {n_rows:,}", simulate_garch11(n_rows, rng)) for n_rows in args.rows]
+
+    print("garch_kernel.fit_garch11 (analytic score) against the Python loop with numerical gradients, and arch")
+    for label, resid in samples:
+        params = np.asarray(GARCH11_START)
+        repeats = max(1, 20_000 // len(resid))
+        _, loop_eval = timed(lambda: [loop_garch11_nll(params, resid) for _ in range(repeats)])
+        _, kernel_eval = timed(lambda: [garch11_nll_grad(params, resid) for _ in range(repeats)])
+
+        loop_fit, loop_time = timed(loop_fit_garch11, resid)
+        kernel_fit, kernel_time = timed(fit_garch11, resid)
+        _, arch_time = timed(lambda: arch_model(resid * 100, mean="Zero", vol="GARCH", p=1, q=1).fit(disp="off"))
+
+        print(
+            f"  {label} ({len(resid):,} obs): NLL+score {kernel_eval / repeats * 1000:7.3f} ms vs loop NLL "
+            f"{loop_eval / repeats * 1000:7.3f} ms ({loop_eval / kernel_eval:5.1f}x)"
+        )
+        print(
+            f"      fit: loop {loop_time:7.3f}s ({loop_fit.nfev} evals)  kernel {kernel_time:7.3f}s ({kernel_fit.nfev} evals, "
+            f"{loop_time / kernel_time:6.1f}x)  arch {arch_time:6.3f}s"
+        )
+
+
+def run_wti_stages(cache_dir, output_dir, force=()):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        _, log = WTI_model.run_pipeline(force=force, cache_dir=cache_dir, output_dir=output_dir)
+    return log, time.perf_counter() - start
+
+
+def benchmark_wti_pipeline(args):
+    # An edit to scenario_exog changes the keys of these stages and nothing upstream.
+    scenario_edit = ("scenarios", "dashboard", "excel", "summary")
+    print("WTI_model staged pipeline: cold run, warm cache, and a scenario edit")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_dir, output_dir = Path(tmp_dir) / "cache", Path(tmp_dir) / "outputs"
+        cold_log, cold_time = run_wti_stages(cache_dir, output_dir)
+        for repeat in range(args.repeats):
+            warm_log, warm_time = run_wti_stages(cache_dir, output_dir)
+        edit_log, edit_time = run_wti_stages(cache_dir, output_dir, force=scenario_edit)
+
+    for label, log, seconds in (("cold", cold_log, cold_time), ("warm", warm_log, warm_time), ("scenario edit", edit_log, edit_time)):
+        ran = [entry["stage"] for entry in log if entry["status"] == "ran"]
+        print(f"  {label:<14} {seconds:7.3f}s  ran: {', '.join(ran) or 'none'}")
+    print(f"  warm speedup={cold_time / warm_time:6.1f}x  scenario edit speedup={cold_time / edit_time:5.2f}x")
+
+
+def loop_simulate_paths(exog_path, beta, garch, start_price, prev_returns, z):
+    # One path at a time in plain Python, the direct reading of the recursion.
+    horizon, n_paths = z.shape
+    prices = np.empty((horizon, n_paths))
+    for path in range(n_paths):
+        r1, r2 = prev_returns
+        h = garch["omega"] + (garch["alpha"] + garch["beta"]) * garch["h_last"]
+        log_p = np.log(start_price)
+        for w in range(horizon):
+            if w:
+                h = garch["omega"] + garch["alpha"] * eps**2 + garch["beta"] * h
+            eps = np.sqrt(h) * z[w, path]
+            r = beta[0] + beta[1] * r1 + beta[2] * r2 + exog_path[w] + eps
+            log_p += r
+            prices[w, path] = np.exp(log_p)
+            r2, r1 = r1, r
+    return prices
+
+
+def wti_scenario_inputs():
+    with contextlib.redirect_stdout(io.StringIO()):
+        results, _ = WTI_model.run_pipeline(["garch", "conditions"], use_cache=False)
+    arimax, garch, conditions = results["arimax"], results["garch"], results["conditions"]
+    wti_close = results["weekly"]["master"]["WTI_Close"]
+    start_price = conditions["curr_wti"]
+    prev_returns = (np.log(start_price / wti_close.iloc[-2]), np.log(wti_close.iloc[-2] / wti_close.iloc[-3]))
+    exog_paths = {
+        name: WTI_model.scenario_exog_path(name, arimax["beta"][3:], arimax["exog_cols"], WTI_model.H)
+        for name in ("base", "bull", "bear")
+    }
+    return arimax, garch, start_price, prev_returns, exog_paths
+
+
+def benchmark_monte_carlo(args):
+    arimax, garch, start_price, prev_returns, exog_paths = wti_scenario_inputs()
+    beta = arimax["beta"]
+    innovations = fit_innovations(args.innovations, arimax["resid_tr"], garch["h_series"])
+    print(f"scenario_sim Monte Carlo on the WTI ARIMAX-GARCH fit ({args.innovations} innovations, {WTI_model.H} weeks)")
+
+    # simulate_paths draws its whole first chunk from default_rng(seed), so
+    # the loop sees exactly the same shocks.
+    n_check = args.loop_paths
+    z = draw_innovations(np.random.default_rng(args.seed), (WTI_model.H, n_check), innovations)
+    _, loop_time = timed(loop_simulate_paths, exog_paths["base"], beta, garch, start_price, prev_returns, z)
+    _, vector_time = timed(
+        simulate_paths, exog_paths["base"], beta, garch, start_price, prev_returns, innovations,
+        n_paths=n_check, chunk_size=n_check, seed=args.seed,
+    )
+    print(
+        f"  {n_check:,} paths: Python loop {loop_time * 1000:9.1f} ms  vectorized {vector_time * 1000:7.1f} ms  "
+        f"speedup={loop_time / vector_time:6.1f}x"
+    )
+
+    for n_paths in args.paths:
+        for chunk_size in args.chunk_sizes:
+            tracemalloc.start()
+            _, seconds = timed(
+                simulate_paths, exog_paths["base"], beta, garch, start_price, prev_returns, innovations,
+                n_paths=n_paths, chunk_size=chunk_size, seed=args.seed,
+            )
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(
+                f"  {n_paths:>9,} paths, chunk {chunk_size:>7,}: {seconds:7.3f}s  "
+                f"{n_paths / seconds:12,.0f} paths/s  peak memory {peak / 1024**2:7.1f} MiB"
+            )
+
+    n_paths = args.paths[-1]
+    common = (beta, garch, start_price, prev_returns, innovations)
+    _, serial_time = timed(simulate_scenarios, exog_paths, *common, n_paths=n_paths, seed=args.seed, n_jobs=1)
+    _, parallel_time = timed(simulate_scenarios, exog_paths, *common, n_paths=n_paths, seed=args.seed, n_jobs=args.n_jobs)
+    print(
+        f"  3 scenarios x {n_paths:,} paths: serial {serial_time:6.2f}s  "
+        f"{resolve_n_jobs(args.n_jobs, 3)} process(es) {parallel_time:6.2f}s ({os.cpu_count()} CPU(s) here)"
+    )
+
+
+def loop_scenario_grid(shocks, beta, start_price, prev_returns, exog_cols):
+    # The run_scenario mean path applied to each scenario: a shock dict and
+    # np.array per week, then a scalar AR recursion.
+    n_scenarios, horizon, _ = shocks.shape
+    prices = np.empty((n_scenarios, horizon))
+    for s in range(n_scenarios):
+        price, (prev1, prev2) = start_price, prev_returns
+        for w in range(horizon):
+            week_shocks = dict(zip(exog_cols, shocks[s, w]))
+            x_vec = np.array([week_shocks.get(col, 0.0) for col in exog_cols])
+            mu = beta[0] + beta[1] * prev1 + beta[2] * prev2 + float(beta[3:] @ x_vec)
+            price = price * np.exp(mu)
+            prices[s, w] = price
+            prev2, prev1 = prev1, mu
+    return prices
+
+
+def benchmark_scenario_grid(args):
+    arimax, _, start_price, prev_returns, _ = wti_scenario_inputs()
+    beta, exog_cols = arimax["beta"], arimax["exog_cols"]
+    base = WTI_model.scenario_shock_matrix("base", exog_cols, WTI_model.H)
+    rng = np.random.default_rng(args.seed)
+    print(f"scenario_sim.scenario_grid on the WTI ARIMAX fit ({WTI_model.H} weeks, {len(exog_cols)} exogenous variables)")
+
+    for n_scenarios in args.scenarios:
+        # Random OVX x DXY x VIX grid: about n_scenarios combinations around the base path.
+        points = max(2, round(n_scenarios ** (1 / 3)))
+        axes = {
+            exog_cols.index("LogOVX"): rng.normal(0.0, 0.03, points),
+            exog_cols.index("DeltaDXY"): rng.normal(0.0, 0.3, points),
+            exog_cols.index("DeltaVIX"): rng.normal(0.0, 1.0, (points, WTI_model.H)),
+        }
+        (shocks, _), build_time = timed(build_shock_grid, base, axes)
+        _, grid_time = timed(scenario_grid, shocks, beta, start_price, prev_returns)
+
+        n_loop = min(len(shocks), args.loop_limit)
+        _, loop_time = timed(loop_scenario_grid, shocks[:n_loop], beta, start_price, prev_returns, exog_cols)
+        loop_rate = n_loop / loop_time
+        print(
+            f"  {len(shocks):>9,} scenarios: grid {grid_time * 1000:8.2f} ms ({len(shocks) / grid_time:12,.0f} scenarios/s, "
+            f"tensor build {build_time * 1000:6.1f} ms)  loop {loop_rate:9,.0f} scenarios/s  "
+            f"speedup={len(shocks) / grid_time / loop_rate:7.1f}x"
+        )
+
+
+def benchmark_workbook_write(args):
+    rng = np.random.default_rng(args.seed)
+    print(f"generate_ovx_workbook.write_workbook on {Path(args.template_path).name}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for n_rows in args.rows:
+            if n_rows:
+                dates = pd.bdate_range("1990-01-01", periods=n_rows)
+                prices = 30 * np.exp(np.cumsum(rng.normal(0.0, 0.03, n_rows)))
+                frame = pd.DataFrame({"Date": dates.to_list(), "Value": prices})
+                label = f"Synthetic {n_rows:,}"
+            else:
+                frame, label, _ = generate_ovx_workbook.load_series_frame(args.data_path)
+            with contextlib.redirect_stdout(io.StringIO()):
+                table = generate_ovx_workbook.build_table(frame, *generate_ovx_workbook.fit_models(frame))
+
+            outputs = {}
+            for fast in (False, True):
+                output_path = Path(tmp_dir) / f"{n_rows}_{'fast' if fast else 'cell'}.xlsx"
+                _, outputs[fast] = timed(
+                    generate_ovx_workbook.write_workbook, table, args.template_path, output_path, "Series", label, fast=fast
+                )
+            print(
+                f"  {len(frame):>7,} rows: per-cell style copies {outputs[False]:7.2f}s  "
+                f"named styles {outputs[True]:7.2f}s  speedup={outputs[False] / outputs[True]:5.2f}x"
+            )
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Wall-clock benchmarks for the volatility modelling scripts.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    rolling = subparsers.add_parser("rolling", help="GarchModel.rolling_forecast against the naive refit loop.")
+    rolling.add_argument("--data-path", default=str(DEFAULT_DATA_PATH), help="Path to the input data file.")
+    rolling.add_argument("--window", type=int, default=500, help="Estimation window length.")
+    rolling.add_argument("--step", type=int, default=1, help="Observations between forecast origins.")
+    rolling.add_argument("--limit", type=int, default=500, help="Number of forecast origins to run. 0 for all.")
+    rolling.add_argument(
+        "--refit-every",
+        type=int,
+        nargs="+",
+        default=[1, 5, 20],
+        help="Refit cadences to compare against the naive loop.",
+    )
+    rolling.set_defaults(func=benchmark_rolling)
+
+    stream = subparsers.add_parser("stream", help="GarchModel.update latency against reloading and refitting.")
+    stream.add_argument("--data-path", default=str(DEFAULT_DATA_PATH), help="Path to the input data file.")
+    stream.add_argument("--ticks", type=int, default=100_000, help="Number of synthetic level prints to push.")
+    stream.add_argument("--seed", type=int, default=7, help="Random seed for the synthetic prints.")
+    stream.set_defaults(func=benchmark_stream)
+
+    server = subparsers.add_parser("server", help="garch_server request latency against cold Garch.py runs.")
+    server.add_argument("--data-path", default=str(DEFAULT_DATA_PATH), help="Path to the input data file.")
+    server.add_argument("--port", type=int, default=8799, help="Port for the temporary server.")
+    server.add_argument("--horizon", type=int, default=10, help="Forecast horizon per request.")
+    server.add_argument("--requests", type=int, default=200, help="Number of warm forecast requests.")
+    server.add_argument("--cold-runs", type=int, default=3, help="Number of cold CLI runs.")
+    server.set_defaults(func=benchmark_server)
+
+    tournament = subparsers.add_parser("tournament", help="GarchModel.select_best_spec against an exhaustive spec search.")
+    tournament.add_argument("--data-path", default=str(DEFAULT_DATA_PATH), help="Path to the input data file.")
+    tournament.add_argument("--max-p", type=int, default=2, help="Maximum ARCH lag per volatility family.")
+    tournament.add_argument("--max-q", type=int, default=2, help="Maximum GARCH lag per volatility family.")
+    tournament.add_argument("--criterion", choices=["aic", "bic"], default="aic", help="Selection criterion.")
+    tournament.add_argument(
+        "--finalists",
+        type=int,
+        nargs="+",
+        default=[1, 3, 5],
+        help="Finalist counts to compare against the exhaustive search.",
+    )
+    tournament.set_defaults(func=benchmark_tournament)
+
+    term = subparsers.add_parser("term", help="GarchModel.variance_term_structure against forecast().")
+    term.add_argument("--data-path", default=str(DEFAULT_DATA_PATH), help="Path to the input data file.")
+    term.add_argument("--horizon", type=int, default=252, help="Forecast horizon in steps.")
+    term.add_argument("--repeats", type=int, default=200, help="Calls per method.")
+    term.set_defaults(func=benchmark_term_structure)
+
+    load = subparsers.add_parser("load", help="load_time_series with and without the sidecar cache.")
+    load.add_argument("--data-path", default=str(DEFAULT_DATA_PATH), help="Path to the input data file.")
+    load.add_argument("--rows", type=int, default=1_000_000, help="Rows in an extra synthetic CSV. 0 to skip.")
+    load.add_argument("--repeats", type=int, default=20, help="Warm loads per file.")
+    load.add_argument("--seed", type=int, default=7, help="Random seed for the synthetic series.")
+    load.set_defaults(func=benchmark_load)
+
+    schema = subparsers.add_parser("schema", help="Sampled schema inference against a full-column scan.")
+    schema.add_argument("--rows", type=int, default=100_000, help="Rows in the synthetic wide table.")
+    schema.add_argument("--columns", type=int, default=50, help="Columns in the synthetic wide table.")
+    schema.add_argument("--seed", type=int, default=7, help="Random seed for the synthetic table.")
+    schema.set_defaults(func=benchmark_schema)
+
+    workbook_load = subparsers.add_parser("workbook-load", help="Single-pass workbook ingestion and its sidecar against per-sheet reads.")
+    workbook_load.add_argument("--workbook-path", default=WTI_model.PATH, help="Excel workbook with date-indexed sheets.")
+    workbook_load.add_argument("--repeats", type=int, default=20, help="Warm loads from the sidecar.")
+    workbook_load.set_defaults(func=benchmark_workbook_load)
+
+    stream_load = subparsers.add_parser("stream-load", help="Chunked stream_time_series against load_time_series.")
+    stream_load.add_argument("--rows", type=int, default=3_000_000, help="Minute rows in the synthetic tick file.")
+    stream_load.add_argument("--freq", choices=["D", "W-FRI", "M"], default="D", help="Target frequency.")
+    stream_load.add_argument("--chunksize", type=int, default=250_000, help="Rows per chunk.")
+    stream_load.add_argument("--seed", type=int, default=7, help="Random seed for the synthetic prints.")
+    stream_load.set_defaults(func=benchmark_stream_load)
+
+    store = subparsers.add_parser("store", help="Series store URI loads against CSV and sidecar loads.")
+    store.add_argument("--data-path", default=str(DEFAULT_DATA_PATH), help="Path to the input data file.")
+    store.add_argument("--repeats", type=int, default=50, help="Loads per method.")
+    store.add_argument("--appends", type=int, default=200, help="Single-day appends to time.")
+    store.set_defaults(func=benchmark_store)
+
+    workbook_table = subparsers.add_parser("workbook-table", help="generate_ovx_workbook.build_table at several sizes.")
+    workbook_table.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 100_000],
+        help="Synthetic price history lengths.",
+    )
+    workbook_table.add_argument("--seed", type=int, default=7, help="Random seed for the synthetic prices.")
+    workbook_table.set_defaults(func=benchmark_workbook_table)
+
+    ewma = subparsers.add_parser("ewma", help="Multi-lambda EWMA engine against per-lambda loops.")
+    ewma.add_argument("--rows", type=int, default=2_500, help="Observations per series.")
+    ewma.add_argument("--series", type=int, nargs="+", default=[1, 10, 50], help="Panel widths to time.")
+    ewma.add_argument("--seed", type=int, default=7, help="Random seed for the synthetic panel.")
+    ewma.set_defaults(func=benchmark_ewma)
+
+    hac = subparsers.add_parser("hac", help="Vectorized HAC covariance against the per-observation loop.")
+    hac.add_argument("--rows", type=int, nargs="+", default=[500, 5_000, 50_000], help="Sample sizes to time.")
+    hac.add_argument("--regressors", type=int, default=16, help="Columns of X, including the constant.")
+    hac.add_argument("--lags", type=int, default=4, help="Newey-West lags for the loop comparison.")
+    hac.add_argument("--seed", type=int, default=7, help="Random seed for the synthetic regression.")
+    hac.set_defaults(func=benchmark_hac)
+
+    garch_kernel = subparsers.add_parser("garch-kernel", help="GARCH(1,1) likelihood kernel against the loop and arch.")
+    garch_kernel.add_argument("--rows", type=int, nargs="+", default=[5_000, 50_000], help="Simulated sample sizes.")
+    garch_kernel.add_argument("--seed", type=int, default=7, help="Random seed for the simulated returns.")
+    garch_kernel.set_defaults(func=benchmark_garch_kernel)
+
+    wti_pipeline = subparsers.add_parser("wti-pipeline", help="WTI_model stages: cold run against cached reruns.")
+    wti_pipeline.add_argument("--repeats", type=int, default=3, help="Warm runs; the last one is reported.")
+    wti_pipeline.set_defaults(func=benchmark_wti_pipeline)
+
+    monte_carlo = subparsers.add_parser("monte-carlo", help="Vectorized ARIMAX-GARCH scenario simulation against a per-path loop.")
+    monte_carlo.add_argument("--paths", type=int, nargs="+", default=[10_000, 50_000, 200_000], help="Paths per scenario.")
+    monte_carlo.add_argument("--chunk-sizes", type=int, nargs="+", default=[5_000, 50_000], help="Paths per vectorized chunk.")
+    monte_carlo.add_argument("--loop-paths", type=int, default=2_000, help="Paths for the Python loop comparison.")
+    monte_carlo.add_argument("--innovations", choices=INNOVATION_METHODS, default="bootstrap", help="Shock distribution.")
+    monte_carlo.add_argument("--n-jobs", type=int, default=0, help="Processes for the three-scenario run. 0 uses all CPUs.")
+    monte_carlo.add_argument("--seed", type=int, default=7, help="Random seed.")
+    monte_carlo.set_defaults(func=benchmark_monte_carlo)
+
+    grid = subparsers.add_parser("scenario-grid", help="Batched scenario_grid against per-scenario weekly loops.")
+    grid.add_argument("--scenarios", type=int, nargs="+", default=[1_000, 10_000, 100_000], help="Approximate grid sizes.")
+    grid.add_argument("--loop-limit", type=int, default=2_000, help="Scenarios timed through the loop at each size.")
+    grid.add_argument("--seed", type=int, default=7, help="Random seed for the swept shock values.")
+    grid.set_defaults(func=benchmark_scenario_grid)
+
+    workbook_write = subparsers.add_parser("workbook-write", help="Named-style template writer against per-cell style copies.")
+    workbook_write.add_argument(
+        "--template-path",
+        default=str(PROJECT_DIR / "Volatility Class Work (2) - Value.xlsx"),
+        help="Workbook template to fill.",
+    )
+    workbook_write.add_argument("--data-path", default=str(DEFAULT_DATA_PATH), help="Series used for --rows 0.")
+    workbook_write.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=[0, 5_000, 50_000],
+        help="Synthetic row counts to fill; 0 fills the OVX series itself.",
+    )
+    workbook_write.add_argument("--seed", type=int, default=7, help="Random seed for the synthetic prices.")
+    workbook_write.set_defaults(func=benchmark_workbook_write)
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+from scipy.signal import lfilter
+
+
+RISKMETRICS_LAMBDA = 0.94
+DEFAULT_LAMBDAS = np.round(np.arange(0.80, 0.995, 0.005), 3)
+EWMA_CRITERIA = ("likelihood", "rmse")
+DEFAULT_BURN_IN = 30
+
+
+def ewma_variance(returns, lambdas=RISKMETRICS_LAMBDA, initial_variance=None):
+    """RiskMetrics EWMA variance paths for every decay factor and series at once.
+
+    ``var[t] = lam * var[t - 1] + (1 - lam) * r[t] ** 2``, seeded with the first
+    squared return unless ``initial_variance`` is given (scalar or one value per
+    series). Row t uses returns up to and including t, so it is the variance
+    forecast for t + 1.
+
+    ``returns`` is a (T,) series or a (T, N) panel without NaNs. For a single
+    series and a vector of L lambdas the result is the 2-D (T, L) array, one
+    column per decay factor, ready for a DataFrame. A panel keeps the series
+    axis last, (T, L, N), rather than flattening lambdas and series into one
+    ambiguous 2-D axis; ``variances[:, :, j]`` is series j's (T, L) block. A
+    scalar lambda drops the L axis. Each lambda is one ``lfilter`` call over
+    all series; results agree with the row-by-row loop to the last bit or two.
+    """
+    values = np.asarray(returns, dtype=float)
+    if values.ndim not in (1, 2):
+        raise ValueError("returns must be a (T,) series or a (T, N) panel.")
+    if np.isnan(values).any():
+        raise ValueError("returns contain NaN; drop or align the series first.")
+    lambda_values = np.asarray(lambdas, dtype=float)
+    if lambda_values.ndim > 1 or np.any((lambda_values <= 0) | (lambda_values >= 1)):
+        raise ValueError("lambdas must be a scalar or 1-D array of decay factors in (0, 1).")
+
+    panel = values.reshape(len(values), -1)
+    squared = panel**2
+    variances = np.empty((len(panel), lambda_values.size, panel.shape[1]))
+    if len(panel):
+        if initial_variance is None:
+            seed = squared[0]
+        else:
+            seed = np.broadcast_to(np.asarray(initial_variance, dtype=float), squared[0].shape)
+        for position, decay in enumerate(lambda_values.ravel()):
+            variances[0, position] = seed
+            variances[1:, position] = lfilter(
+                [1 - decay], [1.0, -decay], squared[1:], axis=0, zi=(decay * seed)[np.newaxis, :]
+            )[0]
+
+    if values.ndim == 1:
+        variances = variances[:, :, 0]
+    if lambda_values.ndim == 0:
+        variances = variances[:, 0]
+    return variances
+
+
+def ewma_scores(returns, variances, criterion="likelihood", burn_in=DEFAULT_BURN_IN):
+    """Score one-step-ahead EWMA forecasts: Gaussian log-likelihood or RMSE against r**2.
+
+    ``variances`` is the (T, L) or (T, L, N) output of ``ewma_variance``; the
+    return at t is scored against the variance at t - 1. The first ``burn_in``
+    forecasts are skipped because they mostly reflect the seed. Returns an (L,)
+    or (L, N) array; higher is better for likelihood, lower for RMSE.
+    """
+    if criterion not in EWMA_CRITERIA:
+        raise ValueError(f"criterion must be one of {EWMA_CRITERIA}.")
+    values = np.asarray(returns, dtype=float)
+    start = 1 + burn_in
+    if len(values) <= start:
+        raise ValueError(f"Need more than {start} returns to score EWMA forecasts.")
+
+    realized = values[start:, np.newaxis]
+    forecast = variances[start - 1 : -1]
+    if criterion == "likelihood":
+        return -0.5 * (np.log(2 * np.pi) + np.log(forecast) + realized**2 / forecast).sum(axis=0)
+    return np.sqrt(((realized**2 - forecast) ** 2).mean(axis=0))
+
+
+def optimal_lambda(returns, lambdas=DEFAULT_LAMBDAS, criterion="likelihood", burn_in=DEFAULT_BURN_IN, initial_variance=None):
+    """Pick the best decay factor per series from one pass over the lambda grid.
+
+    Returns ``(best, scores)``. For a single series ``best`` is a float and
+    ``scores`` a Series indexed by lambda; for a panel ``best`` is a Series per
+    column and ``scores`` a lambda x series DataFrame.
+    """
+    lambda_values = np.atleast_1d(np.asarray(lambdas, dtype=float))
+    variances = ewma_variance(returns, lambda_values, initial_variance=initial_variance)
+    scores = ewma_scores(returns, variances, criterion=criterion, burn_in=burn_in)
+    best_position = scores.argmax(axis=0) if criterion == "likelihood" else scores.argmin(axis=0)
+
+    index = pd.Index(lambda_values, name="lambda")
+    if scores.ndim == 1:
+        return float(lambda_values[best_position]), pd.Series(scores, index=index, name=criterion)
+    columns = returns.columns if isinstance(returns, pd.DataFrame) else pd.RangeIndex(scores.shape[1])
+    return pd.Series(lambda_values[best_position], index=columns, name="lambda"), pd.DataFrame(scores, index=index, columns=columns)
@@ -0,0 +1,169 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / ".garch-cache"
+
+
+def hash_array(values):
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    return hashlib.sha256(values.tobytes()).hexdigest()
+
+
+def atomic_write_bytes(path, payload):
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class FitCache:
+    """On-disk cache of fitted volatility models keyed on data content and model spec.
+
+    Each entry is a ``<key>.json`` metadata file plus a ``<key>.npy`` array of
+    conditional volatility. Entries carry no shared index, so several processes
+    can read and write the same directory; recency is tracked through the
+    metadata file's mtime and the oldest entries are evicted beyond
+    ``max_entries``.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_entries=256):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_spec(p, q, mean, vol, dist, return_type):
+        return {"p": int(p), "q": int(q), "mean": mean, "vol": vol, "dist": dist, "return_type": return_type}
+
+    @staticmethod
+    def make_key(data_hash, spec):
+        spec_text = json.dumps(spec, sort_keys=True)
+        return hashlib.sha256(f"{data_hash}|{spec_text}".encode("utf-8")).hexdigest()
+
+    def _meta_path(self, key):
+        return self.cache_dir / f"{key}.json"
+
+    def _volatility_path(self, key):
+        return self.cache_dir / f"{key}.npy"
+
+    def _read_meta(self, path):
+        try:
+            return json.loads(Path(path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _touch(self, key):
+        try:
+            os.utime(self._meta_path(key))
+        except OSError:
+            pass
+
+    def get(self, returns_values, spec):
+        data_hash = hash_array(returns_values)
+        key = self.make_key(data_hash, spec)
+        meta = self._read_meta(self._meta_path(key))
+        if meta is None:
+            return None
+
+        try:
+            conditional_volatility = np.load(self._volatility_path(key))
+        except (OSError, ValueError):
+            return None
+
+        self._touch(key)
+        entry = dict(meta)
+        entry["conditional_volatility"] = conditional_volatility
+        return entry
+
+    def find_prefix(self, returns_values, spec):
+        """Return the longest cached entry whose data is a strict prefix of ``returns_values``."""
+        returns_values = np.ascontiguousarray(returns_values, dtype=np.float64)
+        n_obs = len(returns_values)
+        prefix_hashes = {}
+        best = None
+
+        for meta_path in self.cache_dir.glob("*.json"):
+            meta = self._read_meta(meta_path)
+            if meta is None or meta.get("spec") != spec:
+                continue
+            cached_obs = meta.get("n_obs", 0)
+            if not 0 < cached_obs < n_obs or (best is not None and cached_obs <= best["n_obs"]):
+                continue
+            if cached_obs not in prefix_hashes:
+                prefix_hashes[cached_obs] = hash_array(returns_values[:cached_obs])
+            if prefix_hashes[cached_obs] == meta.get("data_hash"):
+                best = meta
+
+        if best is not None:
+            self._touch(best["key"])
+        return best
+
+    def put(self, returns_values, spec, param_names, params, conditional_volatility, stats):
+        data_hash = hash_array(returns_values)
+        key = self.make_key(data_hash, spec)
+        meta = {
+            "key": key,
+            "data_hash": data_hash,
+            "n_obs": int(len(returns_values)),
+            "spec": spec,
+            "param_names": list(param_names),
+            "params": [float(value) for value in params],
+            "stats": stats,
+            "created": time.time(),
+        }
+
+        with tempfile.TemporaryFile() as buffer:
+            np.save(buffer, np.asarray(conditional_volatility, dtype=np.float64))
+            buffer.seek(0)
+            atomic_write_bytes(self._volatility_path(key), buffer.read())
+        # Metadata is written last so readers never see an entry without its array.
+        atomic_write_bytes(self._meta_path(key), json.dumps(meta, indent=2).encode("utf-8"))
+
+        self.evict()
+        return key
+
+    def evict(self):
+        entries = []
+        for meta_path in self.cache_dir.glob("*.json"):
+            try:
+                entries.append((meta_path.stat().st_mtime, meta_path))
+            except OSError:
+                continue
+
+        excess = len(entries) - self.max_entries
+        if excess <= 0:
+            return 0
+
+        entries.sort()
+        for _, meta_path in entries[:excess]:
+            for path in (meta_path, meta_path.with_suffix(".npy")):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+        return excess
+
+    def clear(self):
+        removed = 0
+        for path in list(self.cache_dir.glob("*.json")) + list(self.cache_dir.glob("*.npy")):
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                pass
+        return removed
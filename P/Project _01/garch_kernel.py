@@ -0,0 +1,90 @@
+import numpy as np
+from scipy.optimize import minimize
+from scipy.signal import lfilter
+
+
+GARCH11_START = (1e-5, 0.08, 0.88)
+GARCH11_BOUNDS = ((1e-8, None), (1e-5, 0.45), (1e-5, 0.95))
+# Returned for parameters outside the stationary region, as the original loop did.
+PENALTY = 1e10
+MAX_PERSISTENCE = 0.9999
+
+
+def garch11_variance(params, r, h0=None):
+    """Conditional variances h[t] = omega + alpha * r[t-1]**2 + beta * h[t-1].
+
+    h[0] is ``h0`` (the sample variance of ``r`` by default). The recursion is
+    a first-order linear filter, so it runs as one ``lfilter`` call.
+    """
+    omega, alpha, beta = params
+    r = np.asarray(r, dtype=float)
+    h0 = np.var(r) if h0 is None else h0
+    h = np.empty_like(r)
+    if len(r) == 0:
+        return h
+    h[0] = h0
+    h[1:] = lfilter([1.0], [1.0, -beta], omega + alpha * r[:-1] ** 2, zi=[beta * h0])[0]
+    return h
+
+
+def garch11_nll_grad(params, r, h0=None):
+    """Gaussian GARCH(1,1) negative log-likelihood and its analytic gradient.
+
+    The derivatives of h follow their own linear recursions,
+    dh[t] = x[t] + beta * dh[t-1] with x = 1, r[t-1]**2 and h[t-1] for
+    omega, alpha and beta, and dh[0] = 0 because h[0] is fixed. All three run
+    as one 2-D ``lfilter`` call alongside the variance path.
+    """
+    omega, alpha, beta = params
+    r = np.asarray(r, dtype=float)
+    if omega <= 0 or alpha < 0 or beta < 0 or alpha + beta >= MAX_PERSISTENCE:
+        return PENALTY, np.zeros(3)
+
+    h = garch11_variance(params, r, h0=h0)
+    if np.any(h <= 0):
+        return PENALTY, np.zeros(3)
+
+    squared = r**2
+    nll = 0.5 * np.sum(np.log(2 * np.pi * h) + squared / h)
+
+    drivers = np.column_stack([np.ones(len(r) - 1), squared[:-1], h[:-1]])
+    dh = np.zeros((len(r), 3))
+    dh[1:] = lfilter([1.0], [1.0, -beta], drivers, axis=0)
+    grad = 0.5 * ((1 / h - squared / h**2) @ dh)
+    return float(nll), grad
+
+
+def garch11_nll(params, r, h0=None):
+    return garch11_nll_grad(params, r, h0=h0)[0]
+
+
+def fit_garch11(r, start=GARCH11_START, bounds=GARCH11_BOUNDS, h0=None, ftol=1e-12, gtol=1e-8):
+    """Maximum-likelihood GARCH(1,1) on demeaned residuals with L-BFGS-B and analytic gradients.
+
+    The likelihood is maximized for r / std(r), with omega, its start, bound
+    and ``h0`` rescaled to match. On raw weekly returns the omega gradient is
+    about 1e5 times the alpha and beta gradients, and L-BFGS-B stops next to
+    the start values. The returned result (x, fun, jac) is in the units of ``r``.
+    """
+    r = np.asarray(r, dtype=float)
+    scale = float(np.std(r)) or 1.0
+    units = np.array([scale**2, 1.0, 1.0])
+    (omega_low, omega_high), *rest = bounds
+    scaled_bounds = (
+        (None if omega_low is None else omega_low / units[0], None if omega_high is None else omega_high / units[0]),
+        *rest,
+    )
+    result = minimize(
+        garch11_nll_grad,
+        np.asarray(start, dtype=float) / units,
+        args=(r / scale, None if h0 is None else h0 / units[0]),
+        jac=True,
+        method="L-BFGS-B",
+        bounds=scaled_bounds,
+        options={"ftol": ftol, "gtol": gtol},
+    )
+    # h scales with scale**2, so each observation's NLL shifts by log(scale).
+    result.x = result.x * units
+    result.fun = float(result.fun + len(r) * np.log(scale))
+    result.jac = result.jac / units
+    return result
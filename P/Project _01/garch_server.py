@@ -0,0 +1,286 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from Garch import GarchModel
+from fit_cache import FitCache
+from series_store import parse_store_uri
+from time_series_utils import is_store_uri
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+
+def get_source_mtime(data_path):
+    if is_store_uri(data_path):
+        # Store appends rewrite the series metadata, so its mtime marks new data.
+        root, name, _, _ = parse_store_uri(data_path)
+        return os.path.getmtime(Path(root) / name / "meta.json")
+    return os.path.getmtime(data_path)
+
+
+class ModelRegistry:
+    """Loaded series and fitted GarchModel instances kept warm between requests.
+
+    Levels posted to /update advance a model's stream state, and /forecast and
+    /report start from that state until a /refit or a change to the source
+    file reloads the model.
+    """
+
+    def __init__(self, fit_cache=None):
+        self.fit_cache = fit_cache
+        self.models = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def make_spec(payload):
+        return {
+            "p": int(payload.get("p", 1)),
+            "q": int(payload.get("q", 1)),
+            "mean": payload.get("mean", "Constant"),
+            "vol": payload.get("vol", "GARCH"),
+            "dist": payload.get("dist", "normal"),
+        }
+
+    @staticmethod
+    def make_key(payload, spec):
+        return json.dumps(
+            {
+                "data_path": payload["data_path"] if is_store_uri(payload["data_path"]) else os.path.abspath(payload["data_path"]),
+                "date_col": payload.get("date_col"),
+                "value_col": payload.get("value_col"),
+                "return_type": payload.get("return_type", "log"),
+                **spec,
+            },
+            sort_keys=True,
+        )
+
+    def get_model(self, payload, refit=False):
+        if "data_path" not in payload:
+            raise ValueError("Request is missing 'data_path'.")
+
+        spec = self.make_spec(payload)
+        key = self.make_key(payload, spec)
+        source_mtime = get_source_mtime(payload["data_path"])
+        entry = self.models.get(key)
+
+        # The source is re-read only on an explicit refit or when the file changed.
+        if entry is None or refit or entry["source_mtime"] != source_mtime:
+            with contextlib.redirect_stdout(io.StringIO()):
+                model = GarchModel(
+                    data_path=payload["data_path"],
+                    date_col=payload.get("date_col"),
+                    value_col=payload.get("value_col"),
+                    return_type=payload.get("return_type", "log"),
+                    series_name=payload.get("series_name"),
+                    fit_cache=self.fit_cache,
+                )
+                model.fit(**spec)
+            entry = {"model": model, "source_mtime": source_mtime, "fitted_at": time.time()}
+            self.models[key] = entry
+        return entry["model"]
+
+    def forecast(self, payload):
+        with self.lock:
+            model = self.get_model(payload)
+            with contextlib.redirect_stdout(io.StringIO()):
+                forecast_df = model.forecast(
+                    horizon=int(payload.get("horizon", 5)),
+                    method=payload.get("method", "analytic"),
+                    simulations=int(payload.get("simulations", 1000)),
+                    seed=payload.get("seed"),
+                )
+            return model_summary(model, forecast_df)
+
+    def refit(self, payload):
+        with self.lock:
+            model = self.get_model(payload, refit=True)
+            return model_summary(model)
+
+    def update(self, payload):
+        with self.lock:
+            model = self.get_model(payload)
+            update = model.update(payload.get("observations", []), check_drift=bool(payload.get("check_drift", False)))
+            return {"series_name": model.series_name, **update}
+
+    def report(self, payload):
+        if "output_path" not in payload:
+            raise ValueError("Report requests need an 'output_path'.")
+        with self.lock:
+            model = self.get_model(payload)
+            with contextlib.redirect_stdout(io.StringIO()):
+                forecast_df = model.forecast(horizon=int(payload.get("horizon", 5)))
+                output_path = model.create_team_report(
+                    forecast_df=forecast_df,
+                    output_path=payload["output_path"],
+                    recent_window=int(payload.get("recent_window", 126)),
+                )
+            return {"series_name": model.series_name, "output_path": output_path}
+
+    def describe(self):
+        with self.lock:
+            return {
+                "models": [
+                    {**json.loads(key), "fitted_at": entry["fitted_at"], "series_name": entry["model"].series_name}
+                    for key, entry in self.models.items()
+                ]
+            }
+
+
+def model_summary(model, forecast_df=None):
+    summary = {
+        "series_name": model.series_name,
+        "model": f"{model.vol_name}{model.selected_order}",
+        "observations": int(len(model.returns)),
+        "params": {name: float(value) for name, value in model.result.params.items()},
+        "aic": float(model.result.aic),
+        "bic": float(model.result.bic),
+        "latest_cond_vol": float(model.result.conditional_volatility.dropna().iloc[-1]),
+    }
+    if forecast_df is not None:
+        summary["forecast"] = {
+            "index": [model.format_label(value) for value in forecast_df.index],
+            "columns": {column: [float(value) for value in forecast_df[column]] for column in forecast_df.columns},
+        }
+    return summary
+
+
+class GarchRequestHandler(BaseHTTPRequestHandler):
+    registry = None
+    routes = {
+        "/forecast": "forecast",
+        "/refit": "refit",
+        "/update": "update",
+        "/report": "report",
+    }
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self.send_json(200, {"status": "ok"})
+        elif self.path == "/models":
+            self.send_json(200, self.registry.describe())
+        else:
+            self.send_json(404, {"error": f"Unknown path {self.path}"})
+
+    def do_POST(self):
+        action = self.routes.get(self.path)
+        if action is None:
+            self.send_json(404, {"error": f"Unknown path {self.path}"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            self.send_json(200, getattr(self.registry, action)(payload))
+        except (ValueError, KeyError, FileNotFoundError) as exc:
+            self.send_json(400, {"error": f"{type(exc).__name__}: {exc}"})
+        except Exception as exc:
+            self.send_json(500, {"error": f"{type(exc).__name__}: {exc}"})
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, fit_cache=None):
+    GarchRequestHandler.registry = ModelRegistry(fit_cache=fit_cache)
+    server = ThreadingHTTPServer((host, port), GarchRequestHandler)
+    print(f"GARCH model server listening on http://{host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def send_request(action, payload=None, host=DEFAULT_HOST, port=DEFAULT_PORT, timeout=120):
+    url = f"http://{host}:{port}/{action}"
+    if payload is None:
+        request = urllib.request.Request(url)
+    else:
+        request = urllib.request.Request(
+            url,
+            data=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+        )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return json.loads(response.read())
+    except urllib.error.HTTPError as exc:
+        raise RuntimeError(json.loads(exc.read()).get("error", str(exc))) from exc
+
+
+def wait_until_ready(host=DEFAULT_HOST, port=DEFAULT_PORT, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            return send_request("health", host=host, port=port, timeout=1)
+        except (urllib.error.URLError, ConnectionError, OSError):
+            time.sleep(0.1)
+    raise RuntimeError(f"GARCH model server on {host}:{port} did not start within {timeout}s")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Long-running local GARCH model server and client.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="Interface to bind or connect to.")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Port to bind or connect to.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = subparsers.add_parser("serve", help="Start the server.")
+    serve_parser.add_argument("--cache-dir", default=None, help="Optional on-disk fit cache shared with Garch.py.")
+    serve_parser.add_argument("--cache-size", type=int, default=256, help="Maximum number of cached fits.")
+
+    for action in ("forecast", "refit", "update", "report"):
+        client = subparsers.add_parser(action, help=f"Send a {action} request to a running server.")
+        client.add_argument("--data-path", required=True, help="Path to the input data file.")
+        client.add_argument("--date-col", default=None, help="Name of the date column.")
+        client.add_argument("--value-col", default=None, help="Name of the value column.")
+        client.add_argument("--return-type", choices=["log", "pct"], default="log", help="Return transformation.")
+        client.add_argument("--p", type=int, default=1, help="ARCH lag order.")
+        client.add_argument("--q", type=int, default=1, help="GARCH lag order.")
+        client.add_argument("--mean", default="Constant", help="Mean model passed to arch_model.")
+        client.add_argument("--vol", default="GARCH", help="Volatility model passed to arch_model.")
+        client.add_argument("--dist", default="normal", help="Error distribution passed to arch_model.")
+        client.add_argument("--horizon", type=int, default=5, help="Forecast horizon.")
+        if action == "update":
+            client.add_argument("observations", type=float, nargs="+", help="New level observations.")
+        if action == "report":
+            client.add_argument("--output-path", required=True, help="PNG path for the report.")
+
+    subparsers.add_parser("models", help="List models held by a running server.")
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
+    if args.command == "serve":
+        fit_cache = FitCache(args.cache_dir, max_entries=args.cache_size) if args.cache_dir else None
+        serve(host=args.host, port=args.port, fit_cache=fit_cache)
+        return
+    if args.command == "models":
+        print(json.dumps(send_request("models", host=args.host, port=args.port), indent=2))
+        return
+
+    payload = {key: value for key, value in vars(args).items() if key not in {"command", "host", "port"}}
+    print(json.dumps(send_request(args.command, payload, host=args.host, port=args.port), indent=2))
+
+
+if __name__ == "__main__":
+    main()
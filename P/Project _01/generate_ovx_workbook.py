@@ -1,24 +1,35 @@
 import argparse
+import contextlib
+import io
 import math
 import os
+import pickle
 import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
 from copy import copy
 from pathlib import Path
 
 os.environ.setdefault("MPLCONFIGDIR", tempfile.gettempdir())
 
+import numpy as np
 import pandas as pd
 import statsmodels.api as sm
 from arch import arch_model
 from openpyxl import load_workbook
+from openpyxl.styles import NamedStyle
+from scipy.signal import lfilter
 from scipy.stats import chi2
 
+from batch_utils import DEFAULT_N_JOBS, resolve_batch_inputs, resolve_n_jobs
+from ewma import EWMA_CRITERIA, RISKMETRICS_LAMBDA, ewma_variance, optimal_lambda
 from time_series_utils import load_time_series, safe_sheet_title
 
 
 PROJECT_DIR = Path("/Users/deepikanath/dnath796/Git/Financial_Models/P/Project _01")
 DEFAULT_TEMPLATE_PATH = Path("/Users/deepikanath/Downloads/Volatility Class Work (2).xlsx")
 DEFAULT_DATA_PATH = Path("/Users/deepikanath/dnath796/Git/Financial_Models/Data_center/OVXCLS.csv")
+STYLE_ATTRIBUTES = ("font", "fill", "border", "alignment", "number_format", "protection")
 
 
 def copy_style(source_cell, target_cell):
@@ -37,6 +48,37 @@ def ensure_row_style(ws, target_row, template_row, start_col, end_col):
     ws.row_dimensions[target_row].height = ws.row_dimensions[template_row].height
 
 
+def register_row_styles(wb, ws, template_row, start_col, end_col):
+    """Register each template cell's style once as a NamedStyle; returns ``{col_idx: style name}``.
+
+    Assigning a name to ``cell.style`` copies one prebuilt style array,
+    where setting font, fill, border, ... separately hashes each object
+    into the workbook's style tables again for every cell.
+    """
+    names = {}
+    for col_idx in range(start_col, end_col + 1):
+        name = f"Template row {template_row} col {col_idx}"
+        if name not in wb.named_styles:
+            cell = ws.cell(template_row, col_idx)
+            wb.add_named_style(NamedStyle(name=name, **{attr: copy(getattr(cell, attr)) for attr in STYLE_ATTRIBUTES}))
+        names[col_idx] = name
+    return names
+
+
+def apply_row_styles(ws, rows, style_names, height):
+    for row in rows:
+        for col_idx, name in style_names.items():
+            ws.cell(row, col_idx).style = name
+        ws.row_dimensions[row].height = height
+
+
+def write_block(ws, first_row, first_col, rows):
+    """Write a 2-D block of values starting at (first_row, first_col)."""
+    for row, row_values in enumerate(rows, start=first_row):
+        for col_idx, value in enumerate(row_values, start=first_col):
+            ws.cell(row, col_idx, value)
+
+
 def load_series_frame(data_path, date_col=None, value_col=None, series_name=None):
     series, metadata = load_time_series(data_path, date_col=date_col, value_col=value_col)
     label = series_name or metadata["series_label"]
@@ -72,7 +114,27 @@ def fit_models(df):
     return returns, reg_df, ols, residuals, garch_fit
 
 
-def build_table(df, returns, reg_df, ols, residuals, garch_fit):
+def variance_recurrences(residuals, omega, alpha, beta, unconditional_variance, ewma_weight):
+    """EWMA and GARCH(1, 1) variance paths for the regression residuals.
+
+    Both are first-order linear recurrences evaluated with
+    ``scipy.signal.lfilter`` (EWMA through ``ewma.ewma_variance``), in the same
+    operation order as the row-by-row loop. The first residual seeds EWMA with
+    its square and GARCH with the unconditional variance.
+    """
+    residuals = np.asarray(residuals, dtype=float)
+    ewma_var = ewma_variance(residuals, 1 - ewma_weight)
+    squared = residuals**2
+    garch_var = np.empty_like(squared)
+    if len(squared) == 0:
+        return ewma_var, garch_var
+
+    garch_var[0] = unconditional_variance
+    garch_var[1:] = lfilter([1.0], [1.0, -beta], omega + alpha * squared[:-1], zi=[beta * garch_var[0]])[0]
+    return ewma_var, garch_var
+
+
+def build_table(df, returns, reg_df, ols, residuals, garch_fit, ewma_lambda=RISKMETRICS_LAMBDA):
     n_prices = len(df)
     data_start_row = 6
     last_data_row = data_start_row + n_prices - 1
@@ -83,50 +145,28 @@ def build_table(df, returns, reg_df, ols, residuals, garch_fit):
     alpha = float(garch_fit.params["alpha[1]"])
     beta = float(garch_fit.params["beta[1]"])
     unconditional_variance = omega / (1 - alpha - beta)
-    ewma_weight = 1 - 0.94
-
-    dates = df["Date"].tolist()
-    prices = df["Value"].tolist()
-    return_values = returns.tolist()
-
-    fitted_values = ols.fittedvalues.to_numpy()
-    regression_residuals = residuals
-
-    predicted_by_row = {}
-    residual_by_row = {}
-    ewma_var_by_row = {}
-    garch_var_by_row = {}
-    restricted_var_by_row = {}
-
-    for idx in range(2, n_prices):
-        row_number = data_start_row + idx
-        reg_pos = idx - 2
-        fitted = float(fitted_values[reg_pos])
-        residual = float(regression_residuals[reg_pos])
-        predicted_by_row[row_number] = fitted
-        residual_by_row[row_number] = residual
-
-        if row_number == 8:
-            ewma_var = residual**2
-            garch_var = unconditional_variance
-            restricted_var = unconditional_variance
-        else:
-            prev_row = row_number - 1
-            ewma_var = ewma_weight * (residual**2) + (1 - ewma_weight) * ewma_var_by_row[prev_row]
-            prev_residual = residual_by_row[prev_row]
-            prev_garch_var = garch_var_by_row[prev_row]
-            garch_var = omega + alpha * (prev_residual**2) + beta * prev_garch_var
-            restricted_var = omega
-
-        ewma_var_by_row[row_number] = ewma_var
-        garch_var_by_row[row_number] = garch_var
-        restricted_var_by_row[row_number] = restricted_var
+    if ewma_lambda in EWMA_CRITERIA:
+        # Pick the decay factor that best forecasts the squared residuals.
+        ewma_lambda, _ = optimal_lambda(np.asarray(residuals, dtype=float), criterion=ewma_lambda)
+    ewma_weight = 1 - ewma_lambda
+
+    # Model columns are aligned arrays starting at the third price (sheet row 8);
+    # the mapping to sheet rows happens in write_workbook.
+    fitted_values = np.asarray(ols.fittedvalues, dtype=float)
+    regression_residuals = np.asarray(residuals, dtype=float)
+    ewma_var, garch_var = variance_recurrences(
+        regression_residuals, omega, alpha, beta, unconditional_variance, ewma_weight
+    )
+    restricted_var = np.full_like(regression_residuals, omega)
+    if len(restricted_var):
+        restricted_var[0] = unconditional_variance
 
     stats = {
         "intercept": intercept,
         "phi": phi,
         "historical_vol": float(reg_df["return"].std(ddof=1)),
         "returns_mean": float(reg_df["return"].mean()),
+        "ewma_lambda": ewma_lambda,
         "ewma_weight": ewma_weight,
         "omega": omega,
         "alpha": alpha,
@@ -155,15 +195,12 @@ def build_table(df, returns, reg_df, ols, residuals, garch_fit):
         "p_values": [float(ols.pvalues.iloc[0]), float(ols.pvalues.iloc[1])],
     }
 
+    squared_residuals = regression_residuals**2
     log_like_full = -0.5 * (
-        sum(garch_var_by_row.values())
-        + sum((residual_by_row[row] ** 2) / garch_var_by_row[row] for row in garch_var_by_row)
-        + len(garch_var_by_row) * stats["ln_2pi"]
+        garch_var.sum() + (squared_residuals / garch_var).sum() + len(garch_var) * stats["ln_2pi"]
     )
     log_like_restricted = -0.5 * (
-        sum(restricted_var_by_row.values())
-        + sum((residual_by_row[row] ** 2) / restricted_var_by_row[row] for row in restricted_var_by_row)
-        + len(restricted_var_by_row) * stats["ln_2pi"]
+        restricted_var.sum() + (squared_residuals / restricted_var).sum() + len(restricted_var) * stats["ln_2pi"]
     )
     stats["llf"] = float(log_like_full)
     stats["restricted_llf"] = float(log_like_restricted)
@@ -171,14 +208,15 @@ def build_table(df, returns, reg_df, ols, residuals, garch_fit):
     stats["chi_sq_95"] = float(chi2.ppf(0.95, 2))
 
     return {
-        "dates": dates,
-        "prices": prices,
-        "returns": return_values,
-        "predicted_by_row": predicted_by_row,
-        "residual_by_row": residual_by_row,
-        "ewma_var_by_row": ewma_var_by_row,
-        "garch_var_by_row": garch_var_by_row,
-        "restricted_var_by_row": restricted_var_by_row,
+        "dates": df["Date"].to_numpy(),
+        "prices": df["Value"].to_numpy(dtype=float),
+        "returns": returns.to_numpy(dtype=float),
+        "fitted": fitted_values,
+        "residuals": regression_residuals,
+        "ewma_var": ewma_var,
+        "garch_var": garch_var,
+        "restricted_var": restricted_var,
+        "first_model_row": data_start_row + 2,
         "stats": stats,
         "last_data_row": last_data_row,
     }
@@ -190,8 +228,11 @@ def derive_output_path(template_path, data_path, output_path, sheet_title):
     return PROJECT_DIR / f"{Path(template_path).stem} - {sheet_title}.xlsx"
 
 
-def write_workbook(table, template_path, output_path, sheet_title, series_label):
-    wb = load_workbook(template_path)
+def write_workbook(table, template_path, output_path, sheet_title, series_label, fast=True, workbook=None):
+    # A pre-parsed template can be passed as workbook; it is filled in place.
+    # ``fast`` styles the new rows through named styles registered once per
+    # template column; otherwise each cell's style is copied from the template.
+    wb = workbook if workbook is not None else load_workbook(template_path)
     ws = wb[wb.sheetnames[0]]
     ws.title = sheet_title
 
@@ -202,41 +243,68 @@ def write_workbook(table, template_path, output_path, sheet_title, series_label)
     last_data_row = table["last_data_row"]
     last_residual_row = residual_start_row + table["stats"]["observations"] - 1
 
-    for row in range(ws.max_row + 1, max(last_data_row, last_residual_row) + 1):
-        if row <= last_data_row:
-            ensure_row_style(ws, row, data_template_row, 1, 14)
-        if row <= last_residual_row:
-            ensure_row_style(ws, row, residual_template_row, 26, 28)
+    new_rows = range(ws.max_row + 1, max(last_data_row, last_residual_row) + 1)
+    if fast:
+        apply_row_styles(
+            ws,
+            [row for row in new_rows if row <= last_data_row],
+            register_row_styles(wb, ws, data_template_row, 1, 14),
+            ws.row_dimensions[data_template_row].height,
+        )
+        apply_row_styles(
+            ws,
+            [row for row in new_rows if row <= last_residual_row],
+            register_row_styles(wb, ws, residual_template_row, 26, 28),
+            ws.row_dimensions[residual_template_row].height,
+        )
+    else:
+        for row in new_rows:
+            if row <= last_data_row:
+                ensure_row_style(ws, row, data_template_row, 1, 14)
+            if row <= last_residual_row:
+                ensure_row_style(ws, row, residual_template_row, 26, 28)
 
     ws["B5"] = f"{series_label} - Index Value"
 
-    for idx, (date_value, price_value) in enumerate(zip(table["dates"], table["prices"]), start=data_start_row):
-        ws.cell(idx, 1, date_value)
-        ws.cell(idx, 2, float(price_value))
-
-        rel_idx = idx - data_start_row
-        return_value = table["returns"][rel_idx]
-        ws.cell(idx, 3, None if pd.isna(return_value) else float(return_value))
-
-        if idx >= 8:
-            lag_value = table["returns"][rel_idx - 1]
-            fitted = table["predicted_by_row"][idx]
-            residual = table["residual_by_row"][idx]
-            ewma_var = table["ewma_var_by_row"][idx]
-            garch_var = table["garch_var_by_row"][idx]
-            restricted_var = table["restricted_var_by_row"][idx]
-
-            ws.cell(idx, 4, float(lag_value))
-            ws.cell(idx, 5, float(fitted))
-            ws.cell(idx, 6, float(residual))
-            ws.cell(idx, 7, float(ewma_var))
-            ws.cell(idx, 8, float(math.sqrt(ewma_var)))
-            ws.cell(idx, 9, float(garch_var))
-            ws.cell(idx, 10, float(math.sqrt(garch_var)))
-            ws.cell(idx, 11, float((residual**2) / garch_var))
-            ws.cell(idx, 12, float(restricted_var))
-            ws.cell(idx, 13, float(math.sqrt(restricted_var)))
-            ws.cell(idx, 14, float((residual**2) / restricted_var))
+    returns = table["returns"]
+    dates = table["dates"]
+    # datetime64 -> datetime.datetime in one pass; iterating Timestamps is slow.
+    date_values = dates.astype("datetime64[us]").tolist() if dates.dtype.kind == "M" else dates.tolist()
+    price_rows = [
+        [date_value, price_value, None if math.isnan(return_value) else return_value]
+        for date_value, price_value, return_value in zip(date_values, table["prices"].tolist(), returns.tolist())
+    ]
+
+    first_model_row = table["first_model_row"]
+    residuals = table["residuals"]
+    squared_residuals = residuals**2
+    model_columns = [
+        returns[first_model_row - data_start_row - 1 : -1],
+        table["fitted"],
+        residuals,
+        table["ewma_var"],
+        np.sqrt(table["ewma_var"]),
+        table["garch_var"],
+        np.sqrt(table["garch_var"]),
+        squared_residuals / table["garch_var"],
+        table["restricted_var"],
+        np.sqrt(table["restricted_var"]),
+        squared_residuals / table["restricted_var"],
+    ]
+    # Columns D..N, one sheet row per model observation.
+    model_rows = np.column_stack(model_columns).tolist()
+    residual_rows = [
+        [obs_idx, predicted, error]
+        for obs_idx, (predicted, error) in enumerate(zip(table["fitted"].tolist(), residuals.tolist()), start=1)
+    ]
+
+    blocks = [
+        (data_start_row, 1, price_rows),
+        (first_model_row, 4, model_rows),
+        (residual_start_row, 26, residual_rows),
+    ]
+    for first_row, first_col, rows in blocks:
+        write_block(ws, first_row, first_col, rows)
 
     stats = table["stats"]
     ws["D1"] = stats["intercept"]
@@ -288,14 +356,6 @@ def write_workbook(table, template_path, output_path, sheet_title, series_label)
         ws.cell(row, 33, float(conf_int.iloc[pos, 0]))
         ws.cell(row, 34, float(conf_int.iloc[pos, 1]))
 
-    residual_values = [table["predicted_by_row"][row] for row in sorted(table["predicted_by_row"])]
-    error_values = [table["residual_by_row"][row] for row in sorted(table["residual_by_row"])]
-    for obs_idx, (predicted, error) in enumerate(zip(residual_values, error_values), start=1):
-        row = residual_start_row + obs_idx - 1
-        ws.cell(row, 26, obs_idx)
-        ws.cell(row, 27, float(predicted))
-        ws.cell(row, 28, float(error))
-
     chart_ranges = {
         0: f"'{ws.title}'!$C$7:$C${last_data_row}",
         1: f"'{ws.title}'!$H$8:$H${last_data_row}",
@@ -317,6 +377,129 @@ def write_workbook(table, template_path, output_path, sheet_title, series_label)
     return output_path
 
 
+# Pickled template workbook installed in each batch worker by init_batch_worker.
+_template_payload = None
+
+
+def init_batch_worker(template_payload):
+    global _template_payload
+    _template_payload = template_payload
+
+
+def serialize_template(template_path):
+    """Parse the template once and pickle the Workbook for the batch workers.
+
+    Unpickling is about twice as fast as re-parsing the xlsx, and every
+    series gets its own fresh copy to fill.
+    """
+    return pickle.dumps(load_workbook(template_path), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def run_batch_item(data_path, template_path, output_dir, date_col=None, value_col=None, ewma_lambda=RISKMETRICS_LAMBDA):
+    # Runs inside a worker process; failures come back as rows, not exceptions.
+    row = {"source": str(data_path), "error": None}
+    timings = {}
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            stage_start = time.perf_counter()
+            frame, series_label, _ = load_series_frame(data_path, date_col=date_col, value_col=value_col)
+            timings["load"] = time.perf_counter() - stage_start
+
+            stage_start = time.perf_counter()
+            fits = fit_models(frame)
+            timings["fit"] = time.perf_counter() - stage_start
+
+            stage_start = time.perf_counter()
+            table = build_table(frame, *fits, ewma_lambda=ewma_lambda)
+            timings["table"] = time.perf_counter() - stage_start
+
+            stage_start = time.perf_counter()
+            workbook = pickle.loads(_template_payload) if _template_payload is not None else None
+            timings["template"] = time.perf_counter() - stage_start
+
+            stage_start = time.perf_counter()
+            sheet_title = safe_sheet_title(series_label, fallback="Series")
+            output_path = Path(output_dir) / f"{Path(template_path).stem} - {Path(data_path).stem}.xlsx"
+            write_workbook(
+                table=table,
+                template_path=template_path,
+                output_path=output_path,
+                sheet_title=sheet_title,
+                series_label=series_label,
+                workbook=workbook,
+            )
+            timings["write"] = time.perf_counter() - stage_start
+        row.update({"series_label": series_label, "rows": len(frame), "output_path": str(output_path)})
+    except Exception as exc:
+        row["error"] = f"{type(exc).__name__}: {exc}"
+    row.update({f"{stage}_seconds": seconds for stage, seconds in timings.items()})
+    row["seconds"] = time.perf_counter() - start
+    return row
+
+
+def print_batch_row(row):
+    name = Path(row["source"]).name
+    if row["error"]:
+        print(f"  {name}: failed after {row['seconds']:.2f}s -> {row['error']}")
+    else:
+        print(
+            f"  {name}: {row['rows']} rows -> {Path(row['output_path']).name} "
+            f"(load {row['load_seconds']:.2f}s, fit {row['fit_seconds']:.2f}s, "
+            f"table {row['table_seconds']:.2f}s, template {row['template_seconds']:.2f}s, write {row['write_seconds']:.2f}s)"
+        )
+
+
+def run_batch(pattern, template_path, output_dir, n_jobs=DEFAULT_N_JOBS, date_col=None, value_col=None, ewma_lambda=RISKMETRICS_LAMBDA):
+    inputs = resolve_batch_inputs(pattern)
+    n_jobs = resolve_n_jobs(n_jobs, len(inputs))
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    start = time.perf_counter()
+    template_payload = serialize_template(template_path)
+    parse_seconds = time.perf_counter() - start
+    print(
+        f"Parsed template {Path(template_path).name} once in {parse_seconds:.2f}s "
+        f"({len(template_payload) / 1e6:.1f} MB serialized)"
+    )
+    print(f"Building {len(inputs)} workbook(s) with {n_jobs} worker process(es)...")
+
+    rows = []
+    if n_jobs > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs, initializer=init_batch_worker, initargs=(template_payload,)) as executor:
+            futures = [
+                executor.submit(run_batch_item, data_path, template_path, output_dir, date_col, value_col, ewma_lambda)
+                for data_path in inputs
+            ]
+            for future in futures:
+                rows.append(future.result())
+                print_batch_row(rows[-1])
+    else:
+        init_batch_worker(template_payload)
+        for data_path in inputs:
+            rows.append(run_batch_item(data_path, template_path, output_dir, date_col, value_col, ewma_lambda))
+            print_batch_row(rows[-1])
+
+    summary_df = pd.DataFrame(rows)
+    failures = int(summary_df["error"].notna().sum())
+    stage_columns = [column for column in ("load_seconds", "fit_seconds", "table_seconds", "template_seconds", "write_seconds") if column in summary_df]
+    print(f"\nWrote {len(rows) - failures} workbook(s) ({failures} failed) to {output_dir} in {time.perf_counter() - start:.1f}s")
+    if stage_columns:
+        totals = summary_df[stage_columns].sum()
+        print("Stage totals across series: " + ", ".join(f"{column[:-8]} {totals[column]:.2f}s" for column in stage_columns))
+    return summary_df
+
+
+def parse_ewma_lambda(value):
+    if value in EWMA_CRITERIA:
+        return value
+    try:
+        return float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a decay factor or one of {EWMA_CRITERIA}, got '{value}'") from None
+
+
 def build_parser():
     parser = argparse.ArgumentParser(description="Fill the class workbook template with a new time-series dataset.")
     parser.add_argument("--data-path", default=str(DEFAULT_DATA_PATH), help="Path to the input data file.")
@@ -325,11 +508,35 @@ def build_parser():
     parser.add_argument("--date-col", default=None, help="Name of the date column. Auto-detected when omitted.")
     parser.add_argument("--value-col", default=None, help="Name of the value column. Auto-detected when omitted.")
     parser.add_argument("--series-name", default=None, help="Optional label to use in the sheet header and chart titles.")
+    parser.add_argument(
+        "--ewma-lambda",
+        type=parse_ewma_lambda,
+        default=RISKMETRICS_LAMBDA,
+        help="EWMA decay factor, or 'likelihood'/'rmse' to pick the best one for the series.",
+    )
+    parser.add_argument(
+        "--batch",
+        default=None,
+        help="Glob pattern or directory of CSV/XLSX files; writes one workbook per series instead of --data-path.",
+    )
+    parser.add_argument("--output-dir", default=str(PROJECT_DIR), help="Directory for the batch workbooks.")
+    parser.add_argument("--n-jobs", type=int, default=DEFAULT_N_JOBS, help="Worker processes in batch mode. Use 0 for one per CPU core.")
     return parser
 
 
 def main():
     args = build_parser().parse_args()
+    if args.batch:
+        run_batch(
+            args.batch,
+            args.template_path,
+            args.output_dir,
+            n_jobs=args.n_jobs,
+            date_col=args.date_col,
+            value_col=args.value_col,
+            ewma_lambda=args.ewma_lambda,
+        )
+        return
 
     frame, series_label, _ = load_series_frame(
         data_path=args.data_path,
@@ -338,7 +545,7 @@ def main():
         series_name=args.series_name,
     )
     returns, reg_df, ols, residuals, garch_fit = fit_models(frame)
-    table = build_table(frame, returns, reg_df, ols, residuals, garch_fit)
+    table = build_table(frame, returns, reg_df, ols, residuals, garch_fit, ewma_lambda=args.ewma_lambda)
 
     sheet_title = safe_sheet_title(series_label, fallback="Series")
     output_path = derive_output_path(args.template_path, args.data_path, args.output_path, sheet_title)
@@ -353,6 +560,7 @@ def main():
     print(f"Saved workbook to {output}")
     print(f"Series label: {series_label}")
     print(f"Rows written: {len(frame)}")
+    print(f"EWMA lambda: {table['stats']['ewma_lambda']:.3f}")
     print(f"Date range: {frame['Date'].iloc[0]} to {frame['Date'].iloc[-1]}")
 
 
@@ -0,0 +1,153 @@
+import numpy as np
+import pandas as pd
+from scipy import stats
+from scipy.signal import fftconvolve
+
+
+HAC_KERNELS = ("bartlett", "parzen", "qs")
+BANDWIDTH_METHODS = ("andrews", "newey-west")
+# Up to this many lags the meat is summed lag by lag with matrix products;
+# beyond it (QS always, long Bartlett/Parzen windows) one FFT convolution is cheaper.
+DIRECT_LAG_LIMIT = 64
+
+# Kernel characteristic exponent q and plug-in constants from Andrews (1991) /
+# Newey and West (1994), plus the NW pilot-lag exponent.
+KERNEL_CONSTANTS = {
+    "bartlett": {"q": 1, "c_gamma": 1.1447, "pilot_exponent": 2 / 9},
+    "parzen": {"q": 2, "c_gamma": 2.6614, "pilot_exponent": 4 / 25},
+    "qs": {"q": 2, "c_gamma": 1.3221, "pilot_exponent": 2 / 25},
+}
+
+
+def kernel_weights(kernel, bandwidth, max_lag):
+    """Kernel weights k(j / bandwidth) for lags j = 0..max_lag.
+
+    Bartlett with bandwidth L + 1 is the textbook Newey-West estimator with L lags.
+    """
+    if kernel not in HAC_KERNELS:
+        raise ValueError(f"kernel must be one of {HAC_KERNELS}.")
+    if bandwidth <= 0:
+        raise ValueError("bandwidth must be positive.")
+    x = np.arange(max_lag + 1) / bandwidth
+    if kernel == "bartlett":
+        return np.clip(1 - x, 0.0, None)
+    if kernel == "parzen":
+        return np.where(x <= 0.5, 1 - 6 * x**2 + 6 * x**3, np.where(x <= 1, 2 * (1 - x) ** 3, 0.0))
+
+    z = 6 * np.pi * x[1:] / 5
+    weights = np.ones(max_lag + 1)
+    weights[1:] = 25 / (12 * np.pi**2 * x[1:] ** 2) * (np.sin(z) / z - np.cos(z))
+    return weights
+
+
+def kernel_max_lag(kernel, bandwidth, n_obs):
+    # Bartlett and Parzen vanish at |j| >= bandwidth; QS has unbounded support.
+    if kernel == "qs":
+        return n_obs - 1
+    return int(min(np.ceil(bandwidth) - 1, n_obs - 1))
+
+
+def score_weights(X):
+    # Plug-in rules ignore the intercept's score; constant columns get weight 0.
+    X = np.asarray(X, dtype=float)
+    weights = (np.ptp(X, axis=0) > 0).astype(float)
+    return weights if weights.any() else np.ones(X.shape[1])
+
+
+def newey_west_bandwidth(scores, kernel="bartlett", weights=None):
+    """Newey and West (1994) nonparametric plug-in bandwidth."""
+    constants = KERNEL_CONSTANTS[kernel]
+    n_obs = len(scores)
+    weights = np.ones(scores.shape[1]) if weights is None else weights
+    combined = scores @ weights
+    pilot_lags = int(4 * (n_obs / 100) ** constants["pilot_exponent"])
+    pilot_lags = max(1, min(pilot_lags, n_obs - 1))
+
+    autocovariances = np.array([combined[j:] @ combined[: n_obs - j] for j in range(pilot_lags + 1)]) / n_obs
+    lags = np.arange(1, pilot_lags + 1)
+    s0 = autocovariances[0] + 2 * autocovariances[1:].sum()
+    sq = 2 * (lags ** constants["q"] * autocovariances[1:]).sum()
+    q = constants["q"]
+    gamma = constants["c_gamma"] * ((sq / s0) ** 2) ** (1 / (2 * q + 1))
+    return float(gamma * n_obs ** (1 / (2 * q + 1)))
+
+
+def andrews_bandwidth(scores, kernel="bartlett", weights=None):
+    """Andrews (1991) plug-in bandwidth from AR(1) fits to each score column."""
+    constants = KERNEL_CONSTANTS[kernel]
+    n_obs = len(scores)
+    weights = np.ones(scores.shape[1]) if weights is None else weights
+
+    lagged, current = scores[:-1], scores[1:]
+    rho = (lagged * current).sum(axis=0) / np.maximum((lagged**2).sum(axis=0), np.finfo(float).tiny)
+    rho = np.clip(rho, -0.97, 0.97)
+    sigma2 = ((current - lagged * rho) ** 2).mean(axis=0)
+
+    denominator = (weights * sigma2**2 / (1 - rho) ** 4).sum()
+    if constants["q"] == 1:
+        numerator = (weights * 4 * rho**2 * sigma2**2 / ((1 - rho) ** 6 * (1 + rho) ** 2)).sum()
+        return float(constants["c_gamma"] * (numerator / denominator * n_obs) ** (1 / 3))
+    numerator = (weights * 4 * rho**2 * sigma2**2 / (1 - rho) ** 8).sum()
+    return float(constants["c_gamma"] * (numerator / denominator * n_obs) ** (1 / 5))
+
+
+def select_bandwidth(X, resid, kernel="bartlett", method="andrews"):
+    if method not in BANDWIDTH_METHODS:
+        raise ValueError(f"method must be one of {BANDWIDTH_METHODS}.")
+    X = np.asarray(X, dtype=float)
+    scores = X * np.asarray(resid, dtype=float)[:, np.newaxis]
+    select = andrews_bandwidth if method == "andrews" else newey_west_bandwidth
+    # Degenerate plug-in estimates fall back to the White (lag 0) estimator.
+    return max(select(scores, kernel=kernel, weights=score_weights(X)), 1.0)
+
+
+def hac_meat(scores, weights):
+    """Sum of w_j * (Gamma_j + Gamma_j') over lags, with Gamma_j = sum_t u_t u_{t-j}'."""
+    max_lag = len(weights) - 1
+    if max_lag <= DIRECT_LAG_LIMIT:
+        meat = weights[0] * (scores.T @ scores)
+        for lag in range(1, max_lag + 1):
+            if weights[lag] == 0:
+                continue
+            gamma = scores[lag:].T @ scores[:-lag]
+            meat += weights[lag] * (gamma + gamma.T)
+        return meat
+
+    # u' W u with the symmetric Toeplitz weight matrix W applied by convolution.
+    window = np.concatenate([weights[:0:-1], weights])
+    smoothed = fftconvolve(scores, window[:, np.newaxis], mode="full", axes=0)[max_lag : max_lag + len(scores)]
+    meat = scores.T @ smoothed
+    return (meat + meat.T) / 2
+
+
+def hac_vcov(X, resid, kernel="bartlett", bandwidth=None, bandwidth_method="andrews", bread=None):
+    """HAC (Newey-West type) covariance of OLS coefficients, (X'X)^-1 S (X'X)^-1.
+
+    ``bandwidth`` follows the k(j / bandwidth) convention; when omitted it is
+    chosen by ``bandwidth_method``. No small-sample correction is applied.
+    """
+    X = np.asarray(X, dtype=float)
+    resid = np.asarray(resid, dtype=float)
+    if X.ndim != 2 or len(X) != len(resid):
+        raise ValueError("X must be (n, k) and resid must have n observations.")
+    if bandwidth is None:
+        bandwidth = select_bandwidth(X, resid, kernel=kernel, method=bandwidth_method)
+
+    scores = X * resid[:, np.newaxis]
+    weights = kernel_weights(kernel, bandwidth, kernel_max_lag(kernel, bandwidth, len(X)))
+    meat = hac_meat(scores, weights)
+    if bread is None:
+        bread = np.linalg.pinv(X.T @ X)
+    return bread @ meat @ bread
+
+
+def hac_table(params, vcov, names=None, df_resid=None):
+    """Coefficient table with HAC standard errors; t p-values when df_resid is given, else normal."""
+    params = np.asarray(params, dtype=float)
+    se = np.sqrt(np.maximum(0, np.diag(vcov)))
+    t_values = params / se
+    if df_resid is None:
+        p_values = 2 * stats.norm.sf(np.abs(t_values))
+    else:
+        p_values = 2 * stats.t.sf(np.abs(t_values), df=df_resid)
+    return pd.DataFrame({"coef": params, "hac_se": se, "t": t_values, "p_value": p_values}, index=names)
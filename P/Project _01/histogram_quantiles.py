@@ -0,0 +1,48 @@
+import numpy as np
+
+
+HISTOGRAM_BINS = 8192
+
+
+class HistogramQuantiles:
+    """Per-step quantile estimates from fixed-width histograms of streamed values.
+
+    ``pilot_values`` (n_paths, n_steps) fixes each step's range, padded on
+    both sides; values outside it land in the edge bins, and the running
+    minimum and maximum clip the estimates. Memory is n_steps x n_bins counts
+    however many values are added.
+    """
+
+    def __init__(self, pilot_values, n_bins=HISTOGRAM_BINS, padding=0.25):
+        low = pilot_values.min(axis=0)
+        high = pilot_values.max(axis=0)
+        span = high - low
+        self.n_steps = pilot_values.shape[1]
+        self.n_bins = n_bins
+        self.low = low - padding * span
+        self.width = np.where(span > 0, (1 + 2 * padding) * span / n_bins, 1.0)
+        self.counts = np.zeros((self.n_steps, n_bins), dtype=np.int64)
+        self.minimum = np.full(self.n_steps, np.inf)
+        self.maximum = np.full(self.n_steps, -np.inf)
+
+    def add(self, step, values):
+        bins = np.floor((values - self.low[step]) / self.width[step]).astype(np.int64)
+        np.clip(bins, 0, self.n_bins - 1, out=bins)
+        self.counts[step] += np.bincount(bins, minlength=self.n_bins)
+        self.minimum[step] = min(self.minimum[step], values.min())
+        self.maximum[step] = max(self.maximum[step], values.max())
+
+    def quantiles(self, probabilities):
+        result = np.empty((len(probabilities), self.n_steps))
+        for step in range(self.n_steps):
+            if self.minimum[step] == self.maximum[step]:
+                result[:, step] = self.minimum[step]
+                continue
+            cumulative = np.cumsum(self.counts[step])
+            targets = probabilities * cumulative[-1]
+            bins = np.searchsorted(cumulative, targets, side="left")
+            below = np.where(bins > 0, cumulative[np.maximum(bins - 1, 0)], 0)
+            fraction = (targets - below) / np.maximum(self.counts[step][bins], 1)
+            values = self.low[step] + (bins + fraction) * self.width[step]
+            result[:, step] = np.clip(values, self.minimum[step], self.maximum[step])
+        return result
@@ -0,0 +1,168 @@
+import functools
+import json
+import os
+import platform
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+class StageProfiler:
+    """Records wall time, CPU time and peak traced memory for named stages.
+
+    Peak memory comes from tracemalloc, which also sees NumPy buffers; nested
+    stages fold their peak into the enclosing stage. Records are plain dicts so
+    they can be returned from worker processes and merged into one run record.
+    """
+
+    def __init__(self, run_name=None, trace_memory=True):
+        self.run_name = run_name
+        self.trace_memory = trace_memory
+        self.records = []
+        self._stack = []
+        self._started_tracing = False
+        self.started_at = time.time()
+
+    def _start_tracing(self):
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    @contextmanager
+    def stage(self, name, **metadata):
+        self._start_tracing()
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                self._stack[-1]["peak_seen"] = max(self._stack[-1]["peak_seen"], peak)
+            tracemalloc.reset_peak()
+        else:
+            current = 0
+
+        frame = {"peak_seen": 0}
+        self._stack.append(frame)
+        start_epoch = time.time()
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - start_wall
+            cpu = time.process_time() - start_cpu
+            self._stack.pop()
+
+            peak_bytes = None
+            if tracemalloc.is_tracing():
+                _, peak = tracemalloc.get_traced_memory()
+                peak = max(peak, frame["peak_seen"])
+                peak_bytes = max(0, peak - current)
+                if self._stack:
+                    self._stack[-1]["peak_seen"] = max(self._stack[-1]["peak_seen"], peak)
+
+            self.records.append(
+                {
+                    "stage": name,
+                    "run": self.run_name,
+                    "depth": len(self._stack),
+                    "start_epoch": start_epoch,
+                    "wall_seconds": wall,
+                    "cpu_seconds": cpu,
+                    "peak_memory_bytes": peak_bytes,
+                    "max_rss_bytes": max_rss_bytes(),
+                    "pid": os.getpid(),
+                    "thread": threading.get_ident(),
+                    **metadata,
+                }
+            )
+
+    def stop(self):
+        if self._started_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._started_tracing = False
+
+
+def max_rss_bytes():
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes on Linux.
+    return int(usage if sys.platform == "darwin" else usage * 1024)
+
+
+def profiled(stage_name):
+    """Wrap a method in ``self.profiler.stage`` when the instance carries a profiler."""
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            profiler = getattr(self, "profiler", None)
+            if profiler is None:
+                return method(self, *args, **kwargs)
+            with profiler.stage(stage_name):
+                return method(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def build_run_record(records, command=None, started_at=None, extra=None):
+    totals = {}
+    for record in records:
+        stage_total = totals.setdefault(record["stage"], {"calls": 0, "wall_seconds": 0.0, "cpu_seconds": 0.0, "peak_memory_bytes": 0})
+        stage_total["calls"] += 1
+        stage_total["wall_seconds"] += record["wall_seconds"]
+        stage_total["cpu_seconds"] += record["cpu_seconds"]
+        stage_total["peak_memory_bytes"] = max(stage_total["peak_memory_bytes"], record["peak_memory_bytes"] or 0)
+
+    return {
+        "command": command if command is not None else sys.argv,
+        "started_at": started_at,
+        "finished_at": time.time(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        **(extra or {}),
+        "stage_totals": totals,
+        "stages": records,
+    }
+
+
+def write_run_record(run_record, output_path):
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(run_record, indent=2, default=str), encoding="utf-8")
+    return output_path
+
+
+def write_chrome_trace(records, output_path):
+    # Chrome trace "complete" events; load the file in chrome://tracing or Perfetto.
+    events = []
+    for record in records:
+        events.append(
+            {
+                "name": record["stage"],
+                "cat": record.get("run") or "stage",
+                "ph": "X",
+                "ts": record["start_epoch"] * 1e6,
+                "dur": record["wall_seconds"] * 1e6,
+                "pid": record["pid"],
+                "tid": record["thread"],
+                "args": {
+                    "run": record.get("run"),
+                    "cpu_seconds": record["cpu_seconds"],
+                    "peak_memory_bytes": record["peak_memory_bytes"],
+                },
+            }
+        )
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}), encoding="utf-8")
+    return output_path
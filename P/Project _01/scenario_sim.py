@@ -0,0 +1,189 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy import stats
+from scipy.signal import lfilter, lfiltic
+
+from batch_utils import resolve_n_jobs
+from histogram_quantiles import HistogramQuantiles
+
+
+INNOVATION_METHODS = ("bootstrap", "t", "normal")
+DEFAULT_PERCENTILES = (2.5, 16.0, 50.0, 84.0, 97.5)
+DEFAULT_N_PATHS = 20_000
+DEFAULT_CHUNK_SIZE = 5_000
+WEEKS_PER_YEAR = 52
+
+
+def fit_innovations(method, resid=None, h=None):
+    """Describe the unit-variance shocks the simulator draws.
+
+    ``bootstrap`` resamples the standardized GARCH residuals resid / sqrt(h)
+    (filtered historical simulation), ``t`` draws from a Student-t with its
+    degrees of freedom fitted to those residuals, and ``normal`` matches the
+    Gaussian likelihood the GARCH was fitted with.
+    """
+    if method not in INNOVATION_METHODS:
+        raise ValueError(f"Unknown innovation method '{method}'. Choose from {', '.join(INNOVATION_METHODS)}.")
+    if method == "normal":
+        return {"method": method}
+    if resid is None or h is None:
+        raise ValueError(f"Innovation method '{method}' needs the fitted residuals and conditional variances.")
+
+    z = np.asarray(resid, dtype=float) / np.sqrt(np.asarray(h, dtype=float))
+    z = (z - z.mean()) / z.std()
+    if method == "bootstrap":
+        return {"method": method, "pool": z}
+    # Unit variance needs df > 2; below that the t has no variance to match.
+    df = max(stats.t.fit(z, floc=0)[0], 2.05)
+    return {"method": method, "df": df}
+
+
+def draw_innovations(rng, shape, innovations):
+    method = innovations["method"]
+    if method == "bootstrap":
+        return rng.choice(innovations["pool"], size=shape)
+    if method == "t":
+        df = innovations["df"]
+        return rng.standard_t(df, size=shape) * np.sqrt((df - 2) / df)
+    return rng.standard_normal(shape)
+
+
+def simulate_paths(exog_path, beta, garch, start_price, prev_returns, innovations,
+                   n_paths=DEFAULT_N_PATHS, chunk_size=DEFAULT_CHUNK_SIZE, seed=0,
+                   percentiles=DEFAULT_PERCENTILES):
+    """Monte Carlo ARIMAX(2,1,0)-GARCH(1,1) price and volatility fans for one scenario.
+
+    Weekly log returns follow r[t] = b0 + b1 * r[t-1] + b2 * r[t-2] + exog_path[t] + eps[t]
+    with eps[t] = sqrt(h[t]) * z[t] and h[t] = omega + alpha * eps[t-1]**2 + beta * h[t-1].
+    Simulated returns feed the AR terms, so shocks propagate through the
+    mean as well as the variance. The first week's variance is
+    omega + (alpha + beta) * h_last, the same one-step forecast run_scenario
+    starts from. ``beta`` holds at least const, AR1 and AR2; ``garch`` is the
+    dict WTI_model's garch stage returns.
+
+    Paths are simulated ``chunk_size`` at a time, vectorized across paths,
+    and each chunk is folded into per-week histograms of log price and log
+    variance (histogram_quantiles.HistogramQuantiles, the first chunk fixing
+    their ranges) plus a running price sum, so memory stays at one chunk
+    and the fixed-size counts however many paths are drawn. Percentiles are
+    read back from the histograms, within a fraction of a bin of the exact
+    ones. Draws come from one generator seeded with ``seed``; results are
+    reproducible for a given seed and chunk size.
+
+    Returns percentile fans of shape (len(percentiles), horizon) for price
+    and annualised volatility (%), plus the mean price path.
+    """
+    exog_path = np.asarray(exog_path, dtype=float)
+    horizon = len(exog_path)
+    b0, b1, b2 = beta[0], beta[1], beta[2]
+    omega, alpha, beta_g = garch["omega"], garch["alpha"], garch["beta"]
+    h_first = omega + (alpha + beta_g) * garch["h_last"]
+
+    rng = np.random.default_rng(seed)
+    price_sum = np.zeros(horizon)
+    histograms = None
+    for start in range(0, n_paths, chunk_size):
+        m = min(chunk_size, n_paths - start)
+        z = draw_innovations(rng, (horizon, m), innovations)
+        log_prices = np.empty((horizon, m))
+        log_variances = np.empty((horizon, m))
+
+        r1 = np.full(m, prev_returns[0], dtype=float)
+        r2 = np.full(m, prev_returns[1], dtype=float)
+        h = np.full(m, h_first)
+        log_p = np.full(m, np.log(start_price))
+        for w in range(horizon):
+            if w:
+                h = omega + alpha * eps**2 + beta_g * h
+            eps = np.sqrt(h) * z[w]
+            r = b0 + b1 * r1 + b2 * r2 + exog_path[w] + eps
+            log_p = log_p + r
+            log_prices[w] = log_p
+            log_variances[w] = np.log(h)
+            r2, r1 = r1, r
+
+        price_sum += np.exp(log_prices).sum(axis=1)
+        if histograms is None:
+            # The first chunk fixes each week's histogram range and is counted like the rest.
+            histograms = (HistogramQuantiles(log_prices.T), HistogramQuantiles(log_variances.T))
+        for w in range(horizon):
+            histograms[0].add(w, log_prices[w])
+            histograms[1].add(w, log_variances[w])
+
+    # Percentiles commute with the monotone maps back to price and annualised vol.
+    probabilities = np.asarray(percentiles, dtype=float) / 100
+    price_fan = np.exp(histograms[0].quantiles(probabilities))
+    vol_fan = np.exp(histograms[1].quantiles(probabilities) / 2) * np.sqrt(WEEKS_PER_YEAR) * 100
+    return {
+        "percentiles": tuple(percentiles),
+        "prices": price_fan,
+        "vols": vol_fan,
+        "mean_price": price_sum / n_paths,
+        "n_paths": n_paths,
+    }
+
+
+def simulate_scenarios(exog_paths, beta, garch, start_price, prev_returns, innovations,
+                       n_paths=DEFAULT_N_PATHS, chunk_size=DEFAULT_CHUNK_SIZE, seed=0,
+                       percentiles=DEFAULT_PERCENTILES, n_jobs=1):
+    """Run simulate_paths for each ``{name: exog_path}``, in worker processes when n_jobs > 1.
+
+    Every scenario uses the same seed (common random numbers), so the gaps
+    between their fans come from the scenario paths rather than sampling noise.
+    """
+    names = list(exog_paths)
+    n_jobs = resolve_n_jobs(n_jobs, len(names))
+    args = (beta, garch, start_price, prev_returns, innovations, n_paths, chunk_size, seed, percentiles)
+    if n_jobs > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            futures = {name: executor.submit(simulate_paths, exog_paths[name], *args) for name in names}
+            return {name: future.result() for name, future in futures.items()}
+    return {name: simulate_paths(exog_paths[name], *args) for name in names}
+
+
+def build_shock_grid(base, axes):
+    """Every combination of per-variable shock paths on top of a base path.
+
+    ``base`` is a (horizon, n_exog) shock path. ``axes`` maps exog column
+    positions to candidate values, each either a scalar (the same shock every
+    week) or a length-horizon path. Returns the (n_scenarios, horizon,
+    n_exog) shock tensor and an (n_scenarios, n_axes) array giving each
+    scenario's index into every axis, in ``axes`` order.
+    """
+    base = np.asarray(base, dtype=float)
+    horizon = base.shape[0]
+    options = []
+    for values in axes.values():
+        values = np.asarray(values, dtype=float)
+        options.append(np.repeat(values[:, None], horizon, axis=1) if values.ndim == 1 else values)
+
+    combos = np.indices([len(values) for values in options]).reshape(len(options), -1).T
+    shocks = np.repeat(base[None], len(combos), axis=0)
+    for j, column in enumerate(axes):
+        shocks[:, :, column] = options[j][combos[:, j]]
+    return shocks, combos
+
+
+def scenario_grid(shocks, beta, start_price, prev_returns):
+    """Mean ARIMAX(2,1,0) price paths for a batch of exogenous shock scenarios.
+
+    ``shocks`` is (n_scenarios, horizon, n_exog) with columns in the order of
+    beta[3:]. The exogenous terms for every scenario and week come from one
+    contraction with the betas, and the AR(2) recursion
+    r[t] = b0 + x[t] + b1 * r[t-1] + b2 * r[t-2] runs for all scenarios in a
+    single ``lfilter`` call, started from ``prev_returns`` (r[-1], r[-2]).
+    Returns the (n_scenarios, horizon) price matrix.
+    """
+    shocks = np.asarray(shocks, dtype=float)
+    beta = np.asarray(beta, dtype=float)
+    if shocks.ndim != 3 or shocks.shape[2] != len(beta) - 3:
+        raise ValueError(
+            f"Expected an (n_scenarios, horizon, {len(beta) - 3}) shock tensor, got shape {shocks.shape}."
+        )
+
+    drift = beta[0] + shocks @ beta[3:]
+    a = [1.0, -beta[1], -beta[2]]
+    zi = lfiltic([1.0], a, y=[prev_returns[0], prev_returns[1]])
+    returns = lfilter([1.0], a, drift, axis=1, zi=np.tile(zi, (len(shocks), 1)))[0]
+    return start_price * np.exp(np.cumsum(returns, axis=1))
@@ -0,0 +1,249 @@
+import argparse
+import json
+import os
+import re
+from pathlib import Path
+from urllib.parse import parse_qs
+
+import numpy as np
+import pandas as pd
+
+from fit_cache import atomic_write_bytes
+from time_series_utils import STORE_URI_PREFIX, load_time_series, make_series_label
+
+
+DEFAULT_STORE_DIR = Path(__file__).resolve().parent / ".series-store"
+SERIES_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_.\-]+$")
+
+
+def to_ticks(value, unit):
+    return int(np.datetime64(pd.Timestamp(value), unit).astype(np.int64))
+
+
+class SeriesStore:
+    """Append-only store of daily series as raw int64 timestamp and float64 value files.
+
+    Each series lives in ``<root>/<name>/`` as ``timestamps.i8``,
+    ``values.f8`` and a ``meta.json`` whose ``count`` is the number of valid
+    rows. Appends write to the end of both arrays and then replace the
+    metadata, so a crash mid-append leaves trailing bytes that readers ignore.
+    Reads memory-map the arrays and binary-search the timestamps, so a date
+    range touches only the pages it needs.
+    """
+
+    def __init__(self, root=DEFAULT_STORE_DIR):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _series_dir(self, name):
+        if not SERIES_NAME_PATTERN.match(name):
+            raise ValueError(f"Invalid series name '{name}'. Use letters, digits, '.', '_' and '-'.")
+        return self.root / name
+
+    def _read_meta(self, name):
+        meta_path = self._series_dir(name) / "meta.json"
+        try:
+            return json.loads(meta_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            raise KeyError(f"Series '{name}' is not in the store at {self.root}") from None
+
+    def _write_meta(self, name, meta):
+        atomic_write_bytes(self._series_dir(name) / "meta.json", json.dumps(meta, indent=2).encode("utf-8"))
+
+    def names(self):
+        return sorted(path.parent.name for path in self.root.glob("*/meta.json"))
+
+    def __contains__(self, name):
+        return (self._series_dir(name) / "meta.json").exists()
+
+    def info(self, name):
+        return self._read_meta(name)
+
+    def write(self, name, series, metadata=None):
+        """Create or replace a series from a pandas Series with a DatetimeIndex."""
+        if not isinstance(series.index, pd.DatetimeIndex) or series.index.tz is not None:
+            raise ValueError("The store holds series with a timezone-naive DatetimeIndex only.")
+        series = series.dropna().sort_index()
+        if series.index.has_duplicates:
+            raise ValueError("The series index has duplicate timestamps.")
+
+        series_dir = self._series_dir(name)
+        series_dir.mkdir(parents=True, exist_ok=True)
+        unit = series.index.unit
+        atomic_write_bytes(series_dir / "timestamps.i8", series.index.asi8.astype("<i8").tobytes())
+        atomic_write_bytes(series_dir / "values.f8", series.to_numpy(dtype="<f8").tobytes())
+
+        metadata = metadata or {}
+        meta = {
+            "name": name,
+            "count": int(len(series)),
+            "unit": unit,
+            "date_column": metadata.get("date_column", series.index.name),
+            "value_column": metadata.get("value_column", series.name),
+            "series_label": metadata.get("series_label", make_series_label(series.name or name)),
+            "source_name": metadata.get("source_name", name),
+        }
+        self._write_meta(name, meta)
+        return meta
+
+    def import_file(self, name, data_path, date_col=None, value_col=None):
+        series, metadata = load_time_series(data_path, date_col=date_col, value_col=value_col, cache=False)
+        return self.write(name, series, metadata)
+
+    def append(self, name, timestamps, values):
+        """Append rows after the last stored timestamp; cost depends on the rows added, not the history."""
+        meta = self._read_meta(name)
+        timestamps = pd.DatetimeIndex(pd.to_datetime(timestamps)).as_unit(meta["unit"]).asi8
+        values = np.asarray(values, dtype="<f8").ravel()
+        if len(timestamps) != len(values):
+            raise ValueError("timestamps and values must have the same length.")
+        if len(values) == 0:
+            return meta
+        if np.any(np.diff(timestamps) <= 0):
+            raise ValueError("Appended timestamps must be strictly increasing.")
+
+        series_dir = self._series_dir(name)
+        count = meta["count"]
+        if count:
+            last = np.memmap(series_dir / "timestamps.i8", dtype="<i8", mode="r", offset=(count - 1) * 8, shape=(1,))
+            if timestamps[0] <= last[0]:
+                raise ValueError("Appended timestamps must be later than the last stored timestamp.")
+
+        for filename, payload, itemsize in (
+            ("timestamps.i8", timestamps.astype("<i8"), 8),
+            ("values.f8", values, 8),
+        ):
+            with open(series_dir / filename, "r+b") as handle:
+                # Drop any bytes past count left behind by an interrupted append.
+                handle.truncate(count * itemsize)
+                handle.seek(count * itemsize)
+                handle.write(payload.tobytes())
+                handle.flush()
+                os.fsync(handle.fileno())
+
+        meta["count"] = count + len(values)
+        self._write_meta(name, meta)
+        return meta
+
+    def _memmaps(self, name, meta):
+        count = meta["count"]
+        if count == 0:
+            return np.empty(0, dtype="<i8"), np.empty(0, dtype="<f8")
+        series_dir = self._series_dir(name)
+        timestamps = np.memmap(series_dir / "timestamps.i8", dtype="<i8", mode="r", shape=(count,))
+        values = np.memmap(series_dir / "values.f8", dtype="<f8", mode="r", shape=(count,))
+        return timestamps, values
+
+    def read(self, name, start=None, end=None):
+        """Return ``(series, metadata)`` for the rows with start <= date <= end."""
+        meta = self._read_meta(name)
+        timestamps, values = self._memmaps(name, meta)
+        unit = meta["unit"]
+
+        first = 0
+        last = len(timestamps)
+        if start is not None:
+            first = int(np.searchsorted(timestamps, to_ticks(start, unit), side="left"))
+        if end is not None:
+            last = int(np.searchsorted(timestamps, to_ticks(end, unit), side="right"))
+        last = max(first, last)
+
+        index = pd.DatetimeIndex(np.array(timestamps[first:last]).view(f"datetime64[{unit}]"), name=meta["date_column"])
+        series = pd.Series(np.array(values[first:last]), index=index, name=meta["value_column"])
+        metadata = {
+            "date_column": meta["date_column"],
+            "value_column": meta["value_column"],
+            "series_label": meta["series_label"],
+            "source_name": meta["source_name"],
+        }
+        return series, metadata
+
+    def delete(self, name):
+        series_dir = self._series_dir(name)
+        for filename in ("meta.json", "timestamps.i8", "values.f8"):
+            try:
+                (series_dir / filename).unlink()
+            except FileNotFoundError:
+                pass
+        try:
+            series_dir.rmdir()
+        except OSError:
+            pass
+
+
+def make_store_uri(name, root=DEFAULT_STORE_DIR, start=None, end=None):
+    uri = f"{STORE_URI_PREFIX}{Path(root).resolve()}#{name}"
+    query = "&".join(f"{key}={value}" for key, value in (("start", start), ("end", end)) if value is not None)
+    return f"{uri}?{query}" if query else uri
+
+
+def parse_store_uri(uri):
+    """Split ``store://<root>#<name>[?start=...&end=...]`` into (root, name, start, end).
+
+    An empty root (``store://#OVXCLS``) means the default store directory.
+    """
+    if not str(uri).startswith(STORE_URI_PREFIX):
+        raise ValueError(f"Not a store URI: {uri}")
+    location = str(uri)[len(STORE_URI_PREFIX):]
+    root, separator, name = location.rpartition("#")
+    if not separator or not name:
+        raise ValueError(f"Store URI needs a series name after '#': {uri}")
+    name, _, query = name.partition("?")
+    params = parse_qs(query)
+    start = params.get("start", [None])[0]
+    end = params.get("end", [None])[0]
+    return Path(root) if root else DEFAULT_STORE_DIR, name, start, end
+
+
+def load_store_uri(uri):
+    root, name, start, end = parse_store_uri(uri)
+    return SeriesStore(root).read(name, start=start, end=end)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Append-only memory-mapped store for daily series.")
+    parser.add_argument("--store-dir", default=str(DEFAULT_STORE_DIR), help="Store root directory.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = subparsers.add_parser("import", help="Create or replace a series from a CSV/XLSX file.")
+    import_parser.add_argument("name", help="Series name in the store.")
+    import_parser.add_argument("--data-path", required=True, help="Path to the input data file.")
+    import_parser.add_argument("--date-col", default=None, help="Name of the date column.")
+    import_parser.add_argument("--value-col", default=None, help="Name of the value column.")
+
+    append_parser = subparsers.add_parser("append", help="Append one observation to a series.")
+    append_parser.add_argument("name", help="Series name in the store.")
+    append_parser.add_argument("date", help="Observation date, later than the last stored date.")
+    append_parser.add_argument("value", type=float, help="Observation value.")
+
+    show_parser = subparsers.add_parser("show", help="Print a date range of a series.")
+    show_parser.add_argument("name", help="Series name in the store.")
+    show_parser.add_argument("--start", default=None, help="First date to include.")
+    show_parser.add_argument("--end", default=None, help="Last date to include.")
+
+    subparsers.add_parser("list", help="List stored series.")
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
+    store = SeriesStore(args.store_dir)
+
+    if args.command == "import":
+        meta = store.import_file(args.name, args.data_path, date_col=args.date_col, value_col=args.value_col)
+        print(f"Stored {meta['count']} observations as '{args.name}'.")
+        print(f"URI: {make_store_uri(args.name, store.root)}")
+    elif args.command == "append":
+        meta = store.append(args.name, [args.date], [args.value])
+        print(f"'{args.name}' now holds {meta['count']} observations.")
+    elif args.command == "show":
+        series, _ = store.read(args.name, start=args.start, end=args.end)
+        print(series)
+    else:
+        for name in store.names():
+            meta = store.info(name)
+            print(f"{name}: {meta['count']} observations ({meta['value_column']})")
+
+
+if __name__ == "__main__":
+    main()
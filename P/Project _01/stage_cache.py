@@ -0,0 +1,243 @@
+import contextlib
+import hashlib
+import inspect
+import io
+import os
+import pickle
+import sys
+import time
+from pathlib import Path
+
+from fit_cache import atomic_write_bytes
+
+
+DEFAULT_STAGE_CACHE_DIR = Path(__file__).resolve().parent / ".stage-cache"
+STAGE_CACHE_VERSION = 2
+
+
+def file_signature(path):
+    """Size and mtime of an input file, so stages keyed on it re-run when it changes."""
+    stat = os.stat(path)
+    return {"path": str(Path(path).resolve()), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def code_names(code):
+    """Global and attribute names a code object (and any nested function or comprehension) refers to."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names |= code_names(const)
+    return names
+
+
+def source_dependencies(func, root=None):
+    """Source text a stage's result depends on, keyed by qualified name.
+
+    Starting from ``func``, every function or class it names that is defined in
+    its own module is followed recursively and contributes its own source.
+    Anything it reaches from another module in ``root`` (the directory of
+    ``func``'s module by default) contributes that whole module's source, along
+    with every other ``root`` module it imports. Library modules are not hashed.
+    """
+    home = inspect.getmodule(func)
+    root = Path(root or Path(inspect.getsourcefile(func)).parent).resolve()
+
+    def local_module(obj):
+        module = obj if inspect.ismodule(obj) else inspect.getmodule(obj)
+        path = getattr(module, "__file__", None)
+        if path is None or Path(path).resolve().parent != root:
+            return None
+        return module
+
+    sources = {}
+    pending = [func]
+    while pending:
+        obj = pending.pop()
+        module = local_module(obj)
+        if module is None:
+            continue
+        if module is not home:
+            name = f"module:{Path(module.__file__).stem}"
+            if name in sources:
+                continue
+            sources[name] = inspect.getsource(module)
+            pending.extend(value for value in vars(module).values()
+                           if inspect.ismodule(value) or inspect.isfunction(value) or inspect.isclass(value))
+            continue
+        if inspect.ismodule(obj):
+            continue
+        # The file stem, not __name__, so running a script as __main__ shares its cache.
+        name = f"{Path(module.__file__).stem}.{obj.__qualname__}"
+        if name in sources:
+            continue
+        sources[name] = inspect.getsource(obj)
+        if inspect.isclass(obj):
+            pending.extend(value for value in vars(obj).values() if inspect.isfunction(value))
+            continue
+        code = obj.__code__
+        for global_name in code_names(code):
+            value = obj.__globals__.get(global_name)
+            if inspect.ismodule(value) or inspect.isfunction(value) or inspect.isclass(value):
+                pending.append(value)
+    return sources
+
+
+class Tee(io.TextIOBase):
+    def __init__(self, *streams):
+        self.streams = streams
+
+    def write(self, text):
+        for stream in self.streams:
+            stream.write(text)
+        return len(text)
+
+    def flush(self):
+        for stream in self.streams:
+            stream.flush()
+
+
+class Pipeline:
+    """Named stages with explicit inputs, memoized on disk.
+
+    A stage's key hashes its own source, the source of the functions it calls
+    (found by ``source_dependencies``, plus any extra ``helpers``), its
+    parameters and the keys of the stages it reads, so editing one stage or
+    anything it calls invalidates it and everything downstream while leaving
+    upstream results cached. Each stage function receives its inputs' results and its
+    parameters as keyword arguments. Whatever a stage prints is stored with
+    its result and replayed on a cache hit, so cached and fresh runs print the
+    same report. Stages listed with ``artifacts`` return file paths that must
+    still exist for a hit to count. Stages registered with ``default=False``
+    only run when asked for by name.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_STAGE_CACHE_DIR, use_cache=True):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.use_cache = use_cache and cache_dir is not None
+        self.stages = {}
+        if self.use_cache:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def stage(self, name, inputs=(), params=None, helpers=(), artifacts=False, default=True):
+        def decorator(func):
+            if name in self.stages:
+                raise ValueError(f"Stage '{name}' is already registered.")
+            unknown = [dependency for dependency in inputs if dependency not in self.stages]
+            if unknown:
+                raise ValueError(f"Stage '{name}' reads unregistered stages {unknown}; register them first.")
+            self.stages[name] = {
+                "func": func,
+                "inputs": tuple(inputs),
+                "params": dict(params or {}),
+                "helpers": tuple(helpers),
+                "artifacts": artifacts,
+                "default": default,
+            }
+            return func
+
+        return decorator
+
+    def dependencies(self, targets):
+        """Targets plus everything they read, in registration (topological) order."""
+        needed = set()
+        pending = list(targets)
+        while pending:
+            name = pending.pop()
+            if name not in self.stages:
+                raise ValueError(f"Unknown stage '{name}'. Stages: {', '.join(self.stages)}")
+            if name not in needed:
+                needed.add(name)
+                pending.extend(self.stages[name]["inputs"])
+        return [name for name in self.stages if name in needed]
+
+    def stage_key(self, name, keys):
+        spec = self.stages[name]
+        digest = hashlib.sha256(f"{STAGE_CACHE_VERSION}|{name}".encode("utf-8"))
+        sources = {}
+        for func in (spec["func"], *spec["helpers"]):
+            sources.update(source_dependencies(func))
+        for source_name in sorted(sources):
+            digest.update(f"{source_name}\n{sources[source_name]}".encode("utf-8"))
+        digest.update(repr(sorted(spec["params"].items())).encode("utf-8"))
+        for dependency in spec["inputs"]:
+            digest.update(keys[dependency].encode("utf-8"))
+        return digest.hexdigest()
+
+    def _entry_path(self, name, key):
+        return self.cache_dir / f"{name}-{key[:20]}.pkl"
+
+    def _load(self, name, key):
+        try:
+            with open(self._entry_path(name, key), "rb") as handle:
+                entry = pickle.load(handle)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+        if self.stages[name]["artifacts"]:
+            paths = entry["result"] if isinstance(entry["result"], (list, tuple)) else [entry["result"]]
+            if not all(Path(path).exists() for path in paths):
+                return None
+        return entry
+
+    def _store(self, name, key, entry):
+        path = self._entry_path(name, key)
+        atomic_write_bytes(path, pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL))
+        # One entry per stage is enough to skip unchanged work; drop superseded ones.
+        for stale in self.cache_dir.glob(f"{name}-*.pkl"):
+            if stale != path:
+                try:
+                    stale.unlink()
+                except OSError:
+                    pass
+
+    def run(self, targets=None, force=(), replay=None):
+        """Run ``targets`` (the default stages if none) and whatever they depend on.
+
+        Returns ``(results, log)`` where ``log`` lists each stage's status and
+        seconds. Output of cached stages is replayed for the stages in
+        ``replay`` (the targets by default).
+        """
+        if not targets:
+            targets = [name for name, spec in self.stages.items() if spec["default"]]
+        targets = list(targets)
+        replay = set(targets if replay is None else replay)
+        force = set(force)
+        order = self.dependencies(targets)
+
+        results, keys, log = {}, {}, []
+        for name in order:
+            spec = self.stages[name]
+            keys[name] = self.stage_key(name, keys)
+            start = time.perf_counter()
+
+            entry = None
+            if self.use_cache and name not in force:
+                entry = self._load(name, keys[name])
+            if entry is not None:
+                if name in replay:
+                    sys.stdout.write(entry["stdout"])
+                status = "cached"
+            else:
+                kwargs = {dependency: results[dependency] for dependency in spec["inputs"]}
+                captured = io.StringIO()
+                with contextlib.redirect_stdout(Tee(sys.stdout, captured)):
+                    result = spec["func"](**kwargs, **spec["params"])
+                entry = {"result": result, "stdout": captured.getvalue(), "created": time.time()}
+                if self.use_cache:
+                    self._store(name, keys[name], entry)
+                status = "ran"
+
+            results[name] = entry["result"]
+            log.append({"stage": name, "status": status, "seconds": time.perf_counter() - start, "key": keys[name]})
+        return results, log
+
+    def clear(self):
+        removed = 0
+        if self.cache_dir is None:
+            return removed
+        for path in self.cache_dir.glob("*.pkl"):
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                pass
+        return removed
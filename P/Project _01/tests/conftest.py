@@ -0,0 +1,55 @@
+import contextlib
+import io
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+os.environ.setdefault("MPLCONFIGDIR", tempfile.gettempdir())
+
+# The modules under test are flat scripts in the project directory, not a package.
+PROJECT_DIR = Path(__file__).resolve().parents[1]
+if str(PROJECT_DIR) not in sys.path:
+    sys.path.insert(0, str(PROJECT_DIR))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def simulate_garch11(n_rows, seed=0, omega=2e-5, alpha=0.08, beta=0.9):
+    """Zero-mean GARCH(1,1) returns started from the unconditional variance."""
+    shocks = np.random.default_rng(seed).standard_normal(n_rows)
+    returns = np.empty(n_rows)
+    variance = omega / (1 - alpha - beta)
+    for t in range(n_rows):
+        returns[t] = np.sqrt(variance) * shocks[t]
+        variance = omega + alpha * returns[t] ** 2 + beta * variance
+    return returns
+
+
+def write_price_csv(path, n_rows, seed=0):
+    returns = simulate_garch11(n_rows, seed=seed)
+    dates = pd.bdate_range("2000-01-03", periods=n_rows)
+    prices = 30 * np.exp(np.cumsum(returns))
+    pd.DataFrame({"Date": dates.strftime("%Y-%m-%d"), "Value": prices.round(6)}).to_csv(path, index=False)
+    return path
+
+
+def quiet(func, *args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args, **kwargs)
+
+
+@pytest.fixture(scope="session")
+def price_csv(tmp_path_factory):
+    return write_price_csv(tmp_path_factory.mktemp("prices") / "prices.csv", 1500)
+
+
+@pytest.fixture
+def fitted_model(price_csv):
+    from Garch import GarchModel
+
+    model = quiet(GarchModel, data_path=str(price_csv))
+    quiet(model.fit)
+    return model
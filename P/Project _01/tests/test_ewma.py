@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import simulate_garch11
+from ewma import DEFAULT_LAMBDAS, ewma_scores, ewma_variance, optimal_lambda
+
+
+def loop_ewma_variance(returns, decay, initial_variance=None):
+    variance = np.empty(len(returns))
+    variance[0] = returns[0] ** 2 if initial_variance is None else initial_variance
+    for t in range(1, len(returns)):
+        variance[t] = decay * variance[t - 1] + (1 - decay) * returns[t] ** 2
+    return variance
+
+
+@pytest.fixture(scope="module")
+def panel():
+    return np.column_stack([simulate_garch11(1_000, seed=seed) for seed in range(4)])
+
+
+def test_panel_matches_per_lambda_loops(panel):
+    lambdas = np.array([0.85, 0.94, 0.97])
+
+    variances = ewma_variance(panel, lambdas)
+
+    assert variances.shape == (len(panel), len(lambdas), panel.shape[1])
+    for position, decay in enumerate(lambdas):
+        for column in range(panel.shape[1]):
+            np.testing.assert_allclose(variances[:, position, column], loop_ewma_variance(panel[:, column], decay), rtol=1e-12)
+
+
+def test_result_shapes(panel):
+    lambdas = DEFAULT_LAMBDAS[:5]
+
+    assert ewma_variance(panel[:, 0], lambdas).shape == (len(panel), len(lambdas))
+    assert ewma_variance(panel, lambdas).shape == (len(panel), len(lambdas), panel.shape[1])
+    np.testing.assert_array_equal(ewma_variance(panel[:, 2], lambdas), ewma_variance(panel, lambdas)[:, :, 2])
+
+
+def test_single_series_matches_pandas_ewm(panel):
+    returns = panel[:, 0]
+
+    variance = ewma_variance(returns, 0.94)
+
+    expected = pd.Series(returns**2).ewm(alpha=0.06, adjust=False).mean().to_numpy()
+    assert variance.shape == (len(returns),)
+    np.testing.assert_allclose(variance, expected, rtol=1e-12)
+
+
+def test_initial_variance_seeds_every_series(panel):
+    seeds = np.array([1e-4, 2e-4, 3e-4, 4e-4])
+
+    variances = ewma_variance(panel, 0.94, initial_variance=seeds)
+
+    for column, seed in enumerate(seeds):
+        np.testing.assert_allclose(variances[:, column], loop_ewma_variance(panel[:, column], 0.94, seed), rtol=1e-12)
+
+
+@pytest.mark.parametrize("criterion", ["likelihood", "rmse"])
+def test_optimal_lambda_matches_grid_search(panel, criterion):
+    best, scores = optimal_lambda(pd.DataFrame(panel, columns=list("abcd")), criterion=criterion)
+
+    for column in range(panel.shape[1]):
+        grid = [ewma_scores(panel[:, column], ewma_variance(panel[:, column], [decay]), criterion=criterion)[0] for decay in DEFAULT_LAMBDAS]
+        pick = np.argmax(grid) if criterion == "likelihood" else np.argmin(grid)
+        assert best.iloc[column] == DEFAULT_LAMBDAS[pick]
+        np.testing.assert_allclose(scores.iloc[:, column].to_numpy(), grid, rtol=1e-10)
+
+
+@pytest.mark.parametrize("returns, lambdas", [(np.array([0.01, np.nan, 0.02]), 0.94), (np.zeros(10), 1.0), (np.zeros((2, 2, 2)), 0.94)])
+def test_invalid_inputs_raise(returns, lambdas):
+    with pytest.raises(ValueError):
+        ewma_variance(returns, lambdas)
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+from arch import arch_model
+
+from conftest import quiet, simulate_garch11
+from garch_kernel import GARCH11_START, fit_garch11, garch11_nll, garch11_nll_grad, garch11_variance
+
+
+def loop_garch11_nll(params, r):
+    omega, alpha, beta = params
+    h = np.var(r)
+    nll = 0.0
+    for t in range(len(r)):
+        if t > 0:
+            h = omega + alpha * r[t - 1] ** 2 + beta * h
+        nll += 0.5 * (np.log(2 * np.pi * h) + r[t] ** 2 / h)
+    return nll
+
+
+@pytest.fixture(scope="module")
+def returns():
+    # alpha and beta well away from GARCH11_START, so a stalled optimizer shows.
+    return simulate_garch11(5_000, seed=1, omega=2e-5, alpha=0.12, beta=0.84)
+
+
+@pytest.fixture(scope="module")
+def arch_params(returns):
+    fit = arch_model(returns * 100, mean="Zero", vol="GARCH", p=1, q=1).fit(disp="off")
+    return fit.params.to_numpy() * np.array([1e-4, 1.0, 1.0])
+
+
+@pytest.mark.parametrize("params", [GARCH11_START, (3e-5, 0.12, 0.84), (1e-4, 0.3, 0.5)])
+def test_nll_matches_loop(returns, params):
+    assert garch11_nll(params, returns) == pytest.approx(loop_garch11_nll(params, returns), rel=1e-12)
+
+
+def test_variance_matches_recursion(returns):
+    omega, alpha, beta = 3e-5, 0.12, 0.84
+    h = garch11_variance((omega, alpha, beta), returns)
+
+    assert h[0] == np.var(returns)
+    np.testing.assert_allclose(h[1:], omega + alpha * returns[:-1] ** 2 + beta * h[:-1], rtol=1e-12)
+
+
+def test_analytic_score_matches_finite_differences(returns):
+    params = np.array([3e-5, 0.12, 0.84])
+    steps = np.array([1e-10, 1e-6, 1e-6])
+
+    _, grad = garch11_nll_grad(params, returns)
+    numerical = np.array([
+        (garch11_nll(params + step * unit, returns) - garch11_nll(params - step * unit, returns)) / (2 * step)
+        for step, unit in zip(steps, np.eye(3))
+    ])
+
+    np.testing.assert_allclose(grad, numerical, rtol=1e-5)
+
+
+def test_fit_moves_to_arch_estimates(returns, arch_params):
+    fit = fit_garch11(returns)
+
+    assert fit.success
+    assert abs(fit.x[1] - GARCH11_START[1]) > 0.02 and abs(fit.x[2] - GARCH11_START[2]) > 0.02
+    # arch backcasts h[0], so its estimates differ slightly; on this sample
+    # length the initial variance barely matters.
+    np.testing.assert_allclose(fit.x[1:], arch_params[1:], atol=0.005)
+    assert fit.x[0] == pytest.approx(arch_params[0], rel=0.05)
+    assert fit.fun <= garch11_nll(arch_params, returns)
+
+
+def test_fit_is_start_and_scale_invariant(returns):
+    fit = fit_garch11(returns)
+    other_start = fit_garch11(returns, start=(0.05 * np.var(returns), 0.2, 0.7))
+    rescaled = fit_garch11(returns * 100)
+
+    np.testing.assert_allclose(other_start.x, fit.x, rtol=1e-4)
+    np.testing.assert_allclose(rescaled.x, fit.x * np.array([1e4, 1.0, 1.0]), rtol=1e-4)
+    assert fit.fun == pytest.approx(garch11_nll(fit.x, returns), rel=1e-12)
+
+
+def test_wti_fit_converges():
+    WTI_model = pytest.importorskip("WTI_model")
+    results, _ = quiet(WTI_model.run_pipeline, ["arimax"], use_cache=False)
+    resid = results["arimax"]["resid_tr"]
+
+    fit = fit_garch11(resid)
+
+    assert fit.success
+    assert abs(fit.x[1] - GARCH11_START[1]) > 0.01
+    # Score in the standardized units the optimizer works in.
+    np.testing.assert_allclose(fit.jac * np.array([np.var(resid), 1.0, 1.0]), 0.0, atol=1e-3)
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from garch_server import ModelRegistry
+
+
+def forecast_variance(summary):
+    return np.array(summary["forecast"]["columns"]["forecast_variance"])
+
+
+def test_forecast_reflects_streamed_updates(price_csv):
+    registry = ModelRegistry()
+    payload = {"data_path": str(price_csv), "horizon": 5}
+    before = registry.forecast(payload)
+
+    model = registry.get_model(payload)
+    last_level = float(model.series.iloc[-1])
+    # A large move so the one-step variance clearly changes.
+    update = registry.update({**payload, "observations": [last_level * 1.08, last_level * 1.02]})
+    after = registry.forecast(payload)
+
+    assert update["accepted"] == 2
+    assert forecast_variance(after)[0] == pytest.approx(update["forecast_variance"], rel=1e-12)
+    assert not np.allclose(forecast_variance(after), forecast_variance(before))
+    assert after["forecast"]["index"][0] > before["forecast"]["index"][0]
+
+
+def test_refit_discards_streamed_state(price_csv):
+    registry = ModelRegistry()
+    payload = {"data_path": str(price_csv), "horizon": 5}
+    before = registry.forecast(payload)
+    last_level = float(registry.get_model(payload).series.iloc[-1])
+    registry.update({**payload, "observations": [last_level * 1.08]})
+
+    registry.refit(payload)
+
+    np.testing.assert_allclose(forecast_variance(registry.forecast(payload)), forecast_variance(before), rtol=1e-10)
+
+
+def test_streamed_forecast_matches_fit_before_any_tick(fitted_model):
+    expected = fitted_model.result.forecast(horizon=10, reindex=False).variance.iloc[-1].to_numpy()
+
+    np.testing.assert_allclose(fitted_model.start_stream().variance_forecast(10), expected, rtol=1e-10)
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+import statsmodels.api as sm
+
+import hac
+from hac import HAC_KERNELS, hac_vcov, kernel_weights, select_bandwidth
+
+
+def loop_newey_west_vcov(X, e, lags):
+    n, k = X.shape
+    XtX_inv = np.linalg.pinv(X.T @ X)
+    S = np.zeros((k, k))
+    for t in range(n):
+        S += e[t] ** 2 * np.outer(X[t], X[t])
+    for lag in range(1, lags + 1):
+        w = 1 - lag / (lags + 1)
+        Gl = sum(e[t] * e[t - lag] * np.outer(X[t], X[t - lag]) for t in range(lag, n))
+        S += w * (Gl + Gl.T)
+    return XtX_inv @ S @ XtX_inv
+
+
+@pytest.fixture(scope="module")
+def regression():
+    rng = np.random.default_rng(11)
+    n_rows = 400
+    X = np.column_stack([np.ones(n_rows), rng.standard_normal((n_rows, 3))])
+    noise = rng.standard_normal(n_rows)
+    resid = np.empty(n_rows)
+    resid[0] = noise[0]
+    for t in range(1, n_rows):
+        resid[t] = 0.5 * resid[t - 1] + noise[t]
+    y = X @ np.array([0.1, 0.5, -0.2, 0.3]) + resid
+    ols = sm.OLS(y, X).fit()
+    return X, y, ols.resid
+
+
+@pytest.mark.parametrize("lags", [0, 4, 12])
+def test_bartlett_matches_outer_product_loop(regression, lags):
+    X, _, resid = regression
+
+    np.testing.assert_allclose(hac_vcov(X, resid, "bartlett", lags + 1), loop_newey_west_vcov(X, resid, lags), rtol=1e-10)
+
+
+def test_bartlett_matches_statsmodels(regression):
+    X, y, resid = regression
+    expected = sm.OLS(y, X).fit(cov_type="HAC", cov_kwds={"maxlags": 6, "use_correction": False}).cov_params()
+
+    np.testing.assert_allclose(hac_vcov(X, resid, "bartlett", 7), expected, rtol=1e-10)
+
+
+@pytest.mark.parametrize("kernel", HAC_KERNELS)
+def test_fft_meat_matches_direct_sum(regression, kernel, monkeypatch):
+    X, _, resid = regression
+    scores = X * resid[:, np.newaxis]
+    weights = kernel_weights(kernel, 90.0, hac.kernel_max_lag(kernel, 90.0, len(X)))
+    fft_meat = hac.hac_meat(scores, weights)
+
+    monkeypatch.setattr(hac, "DIRECT_LAG_LIMIT", len(weights))
+    np.testing.assert_allclose(fft_meat, hac.hac_meat(scores, weights), rtol=1e-9)
+
+
+def test_kernel_weights():
+    np.testing.assert_allclose(kernel_weights("bartlett", 4.0, 5), [1.0, 0.75, 0.5, 0.25, 0.0, 0.0])
+    np.testing.assert_allclose(kernel_weights("parzen", 4.0, 4), [1.0, 0.71875, 0.25, 0.03125, 0.0])
+    qs = kernel_weights("qs", 2.0, 50)
+    assert qs[0] == 1.0 and np.all(np.abs(qs[1:]) < 1.0)
+    with pytest.raises(ValueError):
+        kernel_weights("uniform", 4.0, 4)
+
+
+@pytest.mark.parametrize("method", ["andrews", "newey-west"])
+@pytest.mark.parametrize("kernel", HAC_KERNELS)
+def test_selected_bandwidth_is_positive(regression, kernel, method):
+    X, _, resid = regression
+
+    assert select_bandwidth(X, resid, kernel=kernel, method=method) >= 1.0
@@ -0,0 +1,44 @@
+import json
+import sys
+import time
+
+import Garch
+from conftest import quiet
+
+
+def run_main(monkeypatch, argv):
+    monkeypatch.setattr(sys, "argv", argv)
+    before = time.time()
+    quiet(Garch.main)
+    return before
+
+
+def assert_run_fields(record, argv, before):
+    assert record["command"] == argv
+    assert before <= record["started_at"] <= record["finished_at"]
+    assert record["stages"] and all(stage["start_epoch"] >= record["started_at"] for stage in record["stages"])
+
+
+def test_single_run_record_has_command_and_start(price_csv, tmp_path, monkeypatch):
+    profile_path = tmp_path / "profile.json"
+    argv = ["Garch.py", "--data-path", str(price_csv), "--profile", "--profile-path", str(profile_path)]
+
+    before = run_main(monkeypatch, argv)
+
+    record = json.loads(profile_path.read_text(encoding="utf-8"))
+    assert record["mode"] == "single"
+    assert_run_fields(record, argv, before)
+
+
+def test_batch_run_record_has_command_and_start(price_csv, tmp_path, monkeypatch):
+    profile_path = tmp_path / "profile.json"
+    argv = [
+        "Garch.py", "--batch", str(price_csv), "--summary-path", str(tmp_path / "summary.csv"),
+        "--profile", "--profile-path", str(profile_path),
+    ]
+
+    before = run_main(monkeypatch, argv)
+
+    record = json.loads(profile_path.read_text(encoding="utf-8"))
+    assert record["mode"] == "batch"
+    assert_run_fields(record, argv, before)
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from conftest import quiet
+from scenario_sim import build_shock_grid, scenario_grid
+
+HORIZON = 12
+BETA = np.array([0.001, 0.2, -0.1, 0.5, -0.03, 0.01])
+START_PRICE = 80.0
+PREV_RETURNS = (0.02, -0.01)
+
+
+def loop_scenario_grid(shocks, beta, start_price, prev_returns):
+    # The scalar AR(2) mean recursion, one scenario and one week at a time.
+    prices = np.empty(shocks.shape[:2])
+    for s, path in enumerate(shocks):
+        price, (prev1, prev2) = start_price, prev_returns
+        for w, x in enumerate(path):
+            mu = beta[0] + beta[1] * prev1 + beta[2] * prev2 + float(beta[3:] @ x)
+            price *= np.exp(mu)
+            prices[s, w] = price
+            prev2, prev1 = prev1, mu
+    return prices
+
+
+@pytest.fixture
+def grid():
+    rng = np.random.default_rng(0)
+    base = rng.normal(0.0, 0.01, (HORIZON, 3))
+    axes = {0: [-0.02, 0.0, 0.02], 2: rng.normal(0.0, 0.05, (4, HORIZON))}
+    return base, axes, build_shock_grid(base, axes)
+
+
+def test_shock_grid_covers_every_combination(grid):
+    base, axes, (shocks, combos) = grid
+
+    assert shocks.shape == (12, HORIZON, 3)
+    assert combos.shape == (12, 2)
+    assert len({tuple(row) for row in combos}) == 12
+    for shock, (i, j) in zip(shocks, combos):
+        np.testing.assert_array_equal(shock[:, 0], axes[0][i])
+        np.testing.assert_array_equal(shock[:, 1], base[:, 1])
+        np.testing.assert_array_equal(shock[:, 2], axes[2][j])
+
+
+def test_grid_matches_scalar_recursion(grid):
+    shocks = grid[2][0]
+
+    prices = scenario_grid(shocks, BETA, START_PRICE, PREV_RETURNS)
+
+    np.testing.assert_allclose(prices, loop_scenario_grid(shocks, BETA, START_PRICE, PREV_RETURNS), rtol=1e-12)
+
+
+def test_grid_rejects_mismatched_shocks(grid):
+    shocks = grid[2][0]
+
+    with pytest.raises(ValueError, match="shock tensor"):
+        scenario_grid(shocks[:, :, :2], BETA, START_PRICE, PREV_RETURNS)
+
+
+def test_named_scenarios_match_run_scenario():
+    WTI_model = pytest.importorskip("WTI_model")
+    results, _ = quiet(WTI_model.run_pipeline, ["garch", "conditions"], use_cache=False)
+    arimax, garch, conditions = results["arimax"], results["garch"], results["conditions"]
+    wti_close = results["weekly"]["master"]["WTI_Close"]
+    curr_wti, exog_cols, horizon = conditions["curr_wti"], arimax["exog_cols"], WTI_model.H
+    names = ("base", "bull", "bear")
+    shocks = np.stack([WTI_model.scenario_shock_matrix(name, exog_cols, horizon) for name in names])
+
+    prices = scenario_grid(shocks, arimax["beta"], curr_wti, WTI_model.start_returns(wti_close, curr_wti))
+
+    for name, row in zip(names, prices):
+        expected = WTI_model.run_scenario(name, curr_wti, arimax["beta"], garch, wti_close, exog_cols, horizon)
+        np.testing.assert_allclose(row, expected["prices"], rtol=1e-12)
@@ -0,0 +1,82 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from scenario_sim import DEFAULT_PERCENTILES, WEEKS_PER_YEAR, draw_innovations, fit_innovations, simulate_paths
+
+HORIZON = 26
+BETA = np.array([0.001, 0.15, -0.05])
+GARCH = {"omega": 6.8e-5, "alpha": 0.10, "beta": 0.84, "h_last": 2.5e-3}
+START_PRICE = 75.0
+PREV_RETURNS = (0.01, -0.02)
+
+
+@pytest.fixture(scope="module")
+def exog_path():
+    return np.linspace(-0.004, 0.003, HORIZON)
+
+
+def exact_paths(exog_path, z):
+    # Every path kept in full: the direct reading of the recursion.
+    horizon, n_paths = z.shape
+    log_prices = np.empty((horizon, n_paths))
+    variances = np.empty((horizon, n_paths))
+    r1, r2 = np.full(n_paths, PREV_RETURNS[0]), np.full(n_paths, PREV_RETURNS[1])
+    h = np.full(n_paths, GARCH["omega"] + (GARCH["alpha"] + GARCH["beta"]) * GARCH["h_last"])
+    log_p = np.full(n_paths, np.log(START_PRICE))
+    for w in range(horizon):
+        if w:
+            h = GARCH["omega"] + GARCH["alpha"] * eps**2 + GARCH["beta"] * h
+        eps = np.sqrt(h) * z[w]
+        r = BETA[0] + BETA[1] * r1 + BETA[2] * r2 + exog_path[w] + eps
+        log_p = log_p + r
+        log_prices[w], variances[w] = log_p, h
+        r2, r1 = r1, r
+    return np.exp(log_prices), np.sqrt(variances * WEEKS_PER_YEAR) * 100
+
+
+def simulate(exog_path, innovations, **kwargs):
+    return simulate_paths(exog_path, BETA, GARCH, START_PRICE, PREV_RETURNS, innovations, **kwargs)
+
+
+@pytest.mark.parametrize("method", ["normal", "t"])
+def test_fans_match_exact_percentiles(exog_path, method):
+    resid = np.random.default_rng(5).standard_t(5, 500) * 0.05
+    innovations = fit_innovations(method, resid, np.full(500, 0.0025))
+    n_paths = 20_000
+    # One chunk consumes the generator exactly like the full draw below.
+    z = draw_innovations(np.random.default_rng(3), (HORIZON, n_paths), innovations)
+    prices, vols = exact_paths(exog_path, z)
+
+    fan = simulate(exog_path, innovations, n_paths=n_paths, chunk_size=n_paths, seed=3)
+
+    np.testing.assert_allclose(fan["prices"], np.percentile(prices, DEFAULT_PERCENTILES, axis=1), rtol=1e-3)
+    np.testing.assert_allclose(fan["vols"], np.percentile(vols, DEFAULT_PERCENTILES, axis=1), rtol=1e-3)
+    np.testing.assert_allclose(fan["mean_price"], prices.mean(axis=1), rtol=1e-12)
+    assert fan["prices"].shape == fan["vols"].shape == (len(DEFAULT_PERCENTILES), HORIZON)
+
+
+def test_chunked_run_is_reproducible_and_close_to_single_chunk(exog_path):
+    innovations = {"method": "normal"}
+    chunked = simulate(exog_path, innovations, n_paths=20_000, chunk_size=3_000, seed=7)
+    again = simulate(exog_path, innovations, n_paths=20_000, chunk_size=3_000, seed=7)
+
+    np.testing.assert_array_equal(chunked["prices"], again["prices"])
+    assert chunked["n_paths"] == 20_000
+    assert np.all(np.diff(chunked["prices"], axis=0) > 0)
+
+
+def test_peak_memory_does_not_grow_with_paths(exog_path):
+    def peak(n_paths):
+        tracemalloc.start()
+        simulate(exog_path, {"method": "normal"}, n_paths=n_paths, chunk_size=2_000)
+        size = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return size
+
+    small, large = peak(4_000), peak(100_000)
+
+    # Keeping every path would need 16 bytes per path-week (about 40 MiB here).
+    assert large < 1.2 * small
+    assert large < 16 * 100_000 * HORIZON / 4
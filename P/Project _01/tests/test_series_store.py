@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from series_store import SeriesStore, make_store_uri
+from time_series_utils import load_time_series
+
+
+def test_import_read_round_trip(tmp_path, price_csv):
+    store = SeriesStore(tmp_path / "store")
+    store.import_file("prices", price_csv)
+    expected, expected_meta = load_time_series(price_csv, cache=False)
+
+    series, metadata = load_time_series(make_store_uri("prices", tmp_path / "store"))
+
+    pd.testing.assert_series_equal(series, expected, check_freq=False)
+    assert metadata["value_column"] == expected_meta["value_column"]
+
+
+def test_append_and_slice(tmp_path, price_csv):
+    store = SeriesStore(tmp_path / "store")
+    store.import_file("prices", price_csv)
+    history, _ = store.read("prices")
+    new_dates = pd.bdate_range(history.index[-1] + pd.offsets.BDay(1), periods=5)
+
+    store.append("prices", new_dates, np.arange(5.0))
+    series, _ = store.read("prices", start=new_dates[1], end=new_dates[3])
+
+    assert store.info("prices")["count"] == len(history) + 5
+    np.testing.assert_array_equal(series.index, new_dates[1:4])
+    np.testing.assert_array_equal(series.to_numpy(), [1.0, 2.0, 3.0])
+
+
+def test_append_ignores_bytes_from_an_interrupted_append(tmp_path, price_csv):
+    store = SeriesStore(tmp_path / "store")
+    store.import_file("prices", price_csv)
+    history, _ = store.read("prices")
+    with open(tmp_path / "store" / "prices" / "values.f8", "ab") as handle:
+        handle.write(b"\x00" * 12)
+
+    next_date = history.index[-1] + pd.offsets.BDay(1)
+    store.append("prices", [next_date], [99.0])
+    series, _ = store.read("prices")
+
+    pd.testing.assert_series_equal(series.iloc[:-1], history)
+    assert series.iloc[-1] == 99.0
+
+
+def test_append_rejects_out_of_order_timestamps(tmp_path, price_csv):
+    store = SeriesStore(tmp_path / "store")
+    store.import_file("prices", price_csv)
+    history, _ = store.read("prices")
+
+    with pytest.raises(ValueError):
+        store.append("prices", [history.index[-1]], [1.0])
@@ -0,0 +1,136 @@
+import importlib
+import sys
+
+import pytest
+
+from stage_cache import Pipeline, source_dependencies
+
+
+HELPERS = """
+def scale(x):
+    return 2 * x
+"""
+
+STAGES = """
+import helpers_mod
+from helpers_mod import scale
+
+
+def offset(x):
+    return x + 1
+
+
+class Doubler:
+    def apply(self, x):
+        return scale(x)
+
+
+def load():
+    return 3
+
+
+def transform(load):
+    return offset(scale(load))
+
+
+def via_class(load):
+    return Doubler().apply(load)
+
+
+def via_module(load):
+    return helpers_mod.scale(load)
+
+
+def untouched(load):
+    return load
+"""
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    (tmp_path / "helpers_mod.py").write_text(HELPERS)
+    (tmp_path / "stages_mod.py").write_text(STAGES)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield tmp_path
+    for name in ("helpers_mod", "stages_mod"):
+        sys.modules.pop(name, None)
+
+
+def build(cache_dir):
+    stages_mod = importlib.import_module("stages_mod")
+    pipeline = Pipeline(cache_dir=cache_dir)
+    pipeline.stage("load")(stages_mod.load)
+    for name in ("transform", "via_class", "via_module", "untouched"):
+        pipeline.stage(name, inputs=("load",))(getattr(stages_mod, name))
+    return pipeline
+
+
+def reload(project, module, old, new):
+    path = project / f"{module}.py"
+    path.write_text(path.read_text().replace(old, new))
+    for name in ("helpers_mod", "stages_mod"):
+        sys.modules.pop(name, None)
+    importlib.invalidate_caches()
+
+
+def test_dependencies_cover_called_functions_and_modules(project):
+    stages_mod = importlib.import_module("stages_mod")
+
+    assert set(source_dependencies(stages_mod.transform)) == {
+        "stages_mod.transform", "stages_mod.offset", "module:helpers_mod"}
+    assert "stages_mod.Doubler" in source_dependencies(stages_mod.via_class)
+    assert "module:helpers_mod" in source_dependencies(stages_mod.via_module)
+    assert set(source_dependencies(stages_mod.untouched)) == {"stages_mod.untouched"}
+
+
+def test_editing_imported_helper_invalidates_callers_only(project, tmp_path_factory):
+    cache_dir = tmp_path_factory.mktemp("stage-cache")
+    results, log = build(cache_dir).run(["transform", "via_class", "via_module", "untouched"])
+    assert results["transform"] == 7
+    assert {entry["status"] for entry in log} == {"ran"}
+
+    reload(project, "helpers_mod", "2 * x", "3 * x + 0")
+    results, log = build(cache_dir).run(["transform", "via_class", "via_module", "untouched"])
+
+    status = {entry["stage"]: entry["status"] for entry in log}
+    assert status == {"load": "cached", "transform": "ran", "via_class": "ran", "via_module": "ran",
+                      "untouched": "cached"}
+    assert results["transform"] == 10
+
+
+def test_editing_same_module_helper_invalidates_stage(project, tmp_path_factory):
+    cache_dir = tmp_path_factory.mktemp("stage-cache")
+    build(cache_dir).run(["transform", "untouched"])
+
+    reload(project, "stages_mod", "return x + 1", "return x + 10")
+    results, log = build(cache_dir).run(["transform", "untouched"])
+
+    status = {entry["stage"]: entry["status"] for entry in log}
+    assert status == {"load": "cached", "transform": "ran", "untouched": "cached"}
+    assert results["transform"] == 16
+
+
+def test_wti_stages_hash_the_shared_modules_they_call():
+    WTI_model = pytest.importorskip("WTI_model")
+    stages = WTI_model.build_pipeline(use_cache=False).stages
+
+    def modules(name):
+        return {key for key in source_dependencies(stages[name]["func"]) if key.startswith("module:")}
+
+    assert "module:time_series_utils" in modules("sheets")
+    assert "module:hac" in modules("arimax")
+    assert "module:garch_kernel" in modules("garch")
+    assert "module:scenario_sim" in modules("monte_carlo")
+    assert "module:scenario_sim" in modules("scenario_grid")
+
+
+def test_wti_cached_run_replays_the_fresh_report(tmp_path, capsys):
+    WTI_model = pytest.importorskip("WTI_model")
+
+    WTI_model.run_pipeline(cache_dir=tmp_path, output_dir=tmp_path)
+    fresh = capsys.readouterr().out
+    _, log = WTI_model.run_pipeline(cache_dir=tmp_path, output_dir=tmp_path)
+    cached = capsys.readouterr().out
+
+    assert {entry["status"] for entry in log} == {"cached"}
+    assert cached == fresh
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from time_series_utils import load_time_series, stream_time_series
+
+
+@pytest.fixture(scope="module")
+def tick_csv(tmp_path_factory):
+    rng = np.random.default_rng(3)
+    n_rows = 20_000
+    times = pd.Timestamp("2020-01-01") + pd.to_timedelta(np.arange(n_rows) * 7, unit="min")
+    prices = 60 * np.exp(np.cumsum(rng.normal(0.0, 0.001, n_rows)))
+    frame = pd.DataFrame({"Timestamp": times.strftime("%Y-%m-%d %H:%M"), "Price": prices.round(4)})
+    # Shuffled so chunk boundaries split periods and rows arrive out of order.
+    path = tmp_path_factory.mktemp("ticks") / "ticks.csv"
+    frame.sample(frac=1.0, random_state=0).to_csv(path, index=False)
+    return path
+
+
+@pytest.mark.parametrize("freq, resample_freq", [("D", "D"), ("W-FRI", "W-FRI"), ("M", "ME")])
+@pytest.mark.parametrize("how", ["last", "mean"])
+def test_stream_matches_in_memory_resample(tick_csv, freq, resample_freq, how):
+    series, _ = load_time_series(tick_csv, cache=False)
+    expected = getattr(series.sort_index().resample(resample_freq), how)().dropna()
+
+    streamed, metadata = stream_time_series(tick_csv, freq=freq, how=how, chunksize=3_000)
+
+    assert metadata["chunks"] > 1
+    np.testing.assert_array_equal(streamed.index.to_numpy(), expected.index.to_numpy())
+    np.testing.assert_allclose(streamed.to_numpy(), expected.to_numpy(), rtol=1e-12)
+
+
+def test_stream_ohlc_matches_in_memory_resample(tick_csv):
+    series, _ = load_time_series(tick_csv, cache=False)
+    expected = series.sort_index().resample("D").ohlc().dropna()
+
+    streamed, _ = stream_time_series(tick_csv, freq="D", how="ohlc", chunksize=3_000)
+
+    np.testing.assert_allclose(streamed[["open", "high", "low", "close"]].to_numpy(), expected.to_numpy(), rtol=0)
@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+import pytest
+from arch import arch_model
+
+from Garch import GarchStreamState
+
+
+def test_update_matches_fixed_parameter_recursion(fitted_model):
+    rng = np.random.default_rng(1)
+    last_level = float(fitted_model.series.iloc[-1])
+    levels = last_level * np.exp(np.cumsum(rng.normal(0.0, 0.02, 50)))
+
+    update = fitted_model.update(levels)
+
+    new_returns = 100 * np.diff(np.log(np.concatenate([[last_level], levels])))
+    extended = pd.concat([fitted_model.returns, pd.Series(new_returns)], ignore_index=True)
+    fixed = arch_model(extended, mean="Constant", vol="GARCH", p=1, q=1).fix(fitted_model.result.params)
+    expected = float(fixed.forecast(horizon=1, reindex=False).variance.iloc[-1, 0])
+
+    assert update["accepted"] == len(levels)
+    assert update["forecast_variance"] == pytest.approx(expected, rel=1e-10)
+
+
+def test_rejected_tick_does_not_become_reference_level(fitted_model):
+    last_level = float(fitted_model.series.iloc[-1])
+    valid = [last_level * 1.01, last_level * 1.02, last_level * 1.03]
+    clean = fitted_model.build_recursion_state()
+    for level in valid:
+        clean.push(level)
+
+    update = fitted_model.update([valid[0], 0.0, valid[1], -5.0, float("nan"), valid[2]])
+
+    assert update["accepted"] == 3
+    assert fitted_model.stream_state.last_level == valid[2]
+    assert update["forecast_variance"] == pytest.approx(clean.next_variance, rel=1e-12)
+
+
+@pytest.mark.parametrize("return_type, bad_reference", [("log", 0.0), ("log", -1.0), ("pct", 0.0)])
+def test_valid_tick_replaces_unusable_reference(return_type, bad_reference):
+    state = GarchStreamState(
+        mu=0.0, omega=0.1, alphas=[0.1], betas=[0.8], return_type=return_type, last_level=bad_reference,
+        recent_sq_resid=[1.0], recent_variance=[1.0], last_variance=1.0, next_variance=1.0,
+    )
+
+    assert not state.push(50.0)
+    assert state.last_level == 50.0
+    assert state.push(51.0)
+    assert state.observations == 1
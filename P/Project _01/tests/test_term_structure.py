@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+from scipy.stats import norm
+
+
+def test_term_structure_matches_arch_forecast(fitted_model):
+    horizon = 60
+    expected = fitted_model.result.forecast(horizon=horizon, reindex=False).variance.iloc[-1].to_numpy()
+
+    term_df = fitted_model.variance_term_structure(horizon)
+
+    np.testing.assert_allclose(term_df["step_variance"].to_numpy(), expected, rtol=1e-10)
+    np.testing.assert_allclose(term_df["cumulative_variance"].to_numpy(), np.cumsum(expected), rtol=1e-10)
+
+
+def test_multi_day_var_uses_cumulative_variance(fitted_model):
+    term_df = fitted_model.variance_term_structure(20)
+    mu = float(fitted_model.result.params["mu"])
+
+    var_df = fitted_model.multi_day_var(horizons=(1, 20), levels=(0.99,), term_df=term_df)
+
+    for horizon in (1, 20):
+        scale = np.sqrt(term_df["cumulative_variance"].iloc[horizon - 1])
+        tail = norm.ppf(0.01)
+        assert var_df.loc[horizon, "var_0.99"] == pytest.approx(-(horizon * mu + scale * tail), rel=1e-12)
+        assert var_df.loc[horizon, "es_0.99"] == pytest.approx(-horizon * mu + scale * norm.pdf(tail) / 0.01, rel=1e-12)
@@ -0,0 +1,74 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from time_series_utils import load_workbook_sheets, read_workbook_sheet, workbook_sidecar_path
+
+REQUIRED = {"Prices": ["WTI", "Brent"], "Stocks": ["Crude"]}
+
+
+def write_workbook(path, scale=1.0):
+    dates = pd.bdate_range("2020-01-01", periods=300)
+    rng = np.random.default_rng(0)
+    with pd.ExcelWriter(path) as writer:
+        prices = pd.DataFrame({"Date": dates, "WTI": 60 * scale + rng.normal(size=300),
+                               "Brent": 65 + rng.normal(size=300)})
+        prices.to_excel(writer, sheet_name="Prices", index=False)
+        stocks = pd.DataFrame({"Date": dates[::5], "Crude": rng.integers(400, 500, 60)})
+        stocks.to_excel(writer, sheet_name="Stocks", index=False)
+        pd.DataFrame({"Note": ["source: EIA"]}).to_excel(writer, sheet_name="Notes", index=False)
+    return path
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    return write_workbook(tmp_path / "oil.xlsx")
+
+
+def test_sidecar_frames_match_per_sheet_reads(workbook):
+    fresh = load_workbook_sheets(workbook, REQUIRED)
+    assert workbook_sidecar_path(workbook).exists()
+    cached = load_workbook_sheets(workbook, REQUIRED)
+
+    for sheet in REQUIRED:
+        expected = read_workbook_sheet(workbook, sheet)
+        pd.testing.assert_frame_equal(fresh[sheet], expected)
+        pd.testing.assert_frame_equal(cached[sheet], expected)
+
+
+def test_all_dated_sheets_are_read_without_required(workbook):
+    sheets = load_workbook_sheets(workbook, cache=False)
+
+    assert set(sheets) == {"Prices", "Stocks"}
+
+
+def test_changed_workbook_invalidates_sidecar(workbook):
+    load_workbook_sheets(workbook, REQUIRED)
+    write_workbook(workbook, scale=2.0)
+
+    sheets = load_workbook_sheets(workbook, REQUIRED)
+
+    pd.testing.assert_frame_equal(sheets["Prices"], read_workbook_sheet(workbook, "Prices"))
+
+
+def test_touched_workbook_keeps_sidecar(workbook):
+    load_workbook_sheets(workbook, REQUIRED)
+    sidecar = workbook_sidecar_path(workbook)
+    stat = os.stat(workbook)
+    os.utime(workbook, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    sheets = load_workbook_sheets(workbook, REQUIRED)
+
+    pd.testing.assert_frame_equal(sheets["Prices"], read_workbook_sheet(workbook, "Prices"))
+    assert sidecar.exists()
+
+
+@pytest.mark.parametrize("required, message", [
+    ({"Futures": ["WTI"]}, "no time-series sheet 'Futures'"),
+    ({"Prices": ["WTI", "Dubai"]}, r"missing columns: \['Dubai'\]"),
+])
+def test_missing_sheet_or_column_raises(workbook, required, message):
+    with pytest.raises(ValueError, match=message):
+        load_workbook_sheets(workbook, required, cache=False)
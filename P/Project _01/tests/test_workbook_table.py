@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import generate_ovx_workbook
+from conftest import quiet
+
+
+def row_by_row_table(residuals, omega, alpha, beta, ewma_weight):
+    # The per-row loop build_table ran before its columns became arrays.
+    unconditional_variance = omega / (1 - alpha - beta)
+    ewma_var, garch_var, restricted_var = [], [], []
+    for t, residual in enumerate(residuals):
+        if t == 0:
+            ewma_var.append(residual**2)
+            garch_var.append(unconditional_variance)
+            restricted_var.append(unconditional_variance)
+        else:
+            ewma_var.append(ewma_weight * residual**2 + (1 - ewma_weight) * ewma_var[-1])
+            garch_var.append(omega + alpha * residuals[t - 1] ** 2 + beta * garch_var[-1])
+            restricted_var.append(omega)
+    return np.array(ewma_var), np.array(garch_var), np.array(restricted_var)
+
+
+def log_likelihood(residuals, variance):
+    return -0.5 * (variance.sum() + (residuals**2 / variance).sum() + len(variance) * np.log(2 * np.pi))
+
+
+@pytest.fixture(scope="module")
+def table():
+    rng = np.random.default_rng(11)
+    n_rows = 2_000
+    dates = pd.bdate_range("1990-01-01", periods=n_rows)
+    frame = pd.DataFrame({"Date": dates.to_list(), "Value": 30 * np.exp(np.cumsum(rng.normal(0.0, 0.03, n_rows)))})
+    return quiet(lambda: generate_ovx_workbook.build_table(frame, *generate_ovx_workbook.fit_models(frame)))
+
+
+def test_variance_columns_match_row_by_row_loop(table):
+    stats = table["stats"]
+    residuals = np.asarray(table["residuals"], dtype=float)
+
+    ewma_var, garch_var, restricted_var = row_by_row_table(
+        residuals, stats["omega"], stats["alpha"], stats["beta"], stats["ewma_weight"]
+    )
+
+    np.testing.assert_allclose(table["ewma_var"], ewma_var, rtol=1e-12)
+    np.testing.assert_allclose(table["garch_var"], garch_var, rtol=1e-12)
+    np.testing.assert_array_equal(table["restricted_var"], restricted_var)
+    assert stats["llf"] == pytest.approx(log_likelihood(residuals, garch_var), rel=1e-12)
+    assert stats["restricted_llf"] == pytest.approx(log_likelihood(residuals, restricted_var), rel=1e-12)
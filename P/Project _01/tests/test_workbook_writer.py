@@ -0,0 +1,84 @@
+from copy import copy
+
+import numpy as np
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+
+import generate_ovx_workbook
+from conftest import PROJECT_DIR, quiet
+
+
+TEMPLATE_PATH = PROJECT_DIR / "Volatility Class Work (2) - Value.xlsx"
+DATA_TEMPLATE_ROW, RESIDUAL_TEMPLATE_ROW = 3825, 3843
+
+
+@pytest.fixture(scope="module")
+def synthetic_table():
+    # Enough rows to run past the template's last row, so new styled rows are created.
+    n_rows = 5_000
+    rng = np.random.default_rng(5)
+    dates = pd.bdate_range("1990-01-01", periods=n_rows)
+    frame = pd.DataFrame({"Date": dates.to_list(), "Value": 30 * np.exp(np.cumsum(rng.normal(0.0, 0.03, n_rows)))})
+    return quiet(lambda: generate_ovx_workbook.build_table(frame, *generate_ovx_workbook.fit_models(frame)))
+
+
+@pytest.fixture(scope="module")
+def filled_workbook(synthetic_table, tmp_path_factory):
+    template_rows = load_workbook(TEMPLATE_PATH).worksheets[0].max_row
+    output_path = tmp_path_factory.mktemp("workbook") / "filled.xlsx"
+    generate_ovx_workbook.write_workbook(synthetic_table, TEMPLATE_PATH, output_path, "Synthetic", "Synthetic")
+    return synthetic_table, load_workbook(output_path).worksheets[0], template_rows
+
+
+def style_of(cell):
+    # copy() unwraps openpyxl's StyleProxy, which does not compare equal to another proxy.
+    return tuple(copy(getattr(cell, name)) for name in generate_ovx_workbook.STYLE_ATTRIBUTES)
+
+
+def test_new_rows_carry_template_styles(filled_workbook):
+    table, ws, template_rows = filled_workbook
+    last_residual_row = 26 + table["stats"]["observations"] - 1
+    assert table["last_data_row"] > template_rows
+
+    for row in (template_rows + 1, table["last_data_row"]):
+        for col_idx in range(1, 15):
+            assert style_of(ws.cell(row, col_idx)) == style_of(ws.cell(DATA_TEMPLATE_ROW, col_idx))
+        assert ws.row_dimensions[row].height == ws.row_dimensions[DATA_TEMPLATE_ROW].height
+    for col_idx in range(26, 29):
+        assert style_of(ws.cell(last_residual_row, col_idx)) == style_of(ws.cell(RESIDUAL_TEMPLATE_ROW, col_idx))
+
+
+def test_values_round_trip(filled_workbook):
+    table, ws, _ = filled_workbook
+    last_row = table["last_data_row"]
+    first_model_row = table["first_model_row"]
+
+    assert ws.cell(last_row, 2).value == pytest.approx(table["prices"][-1], rel=1e-12)
+    assert ws.cell(last_row, 9).value == pytest.approx(table["garch_var"][-1], rel=1e-12)
+    assert ws.cell(first_model_row, 6).value == pytest.approx(table["residuals"][0], rel=1e-12)
+    assert ws.cell(26 + len(table["residuals"]) - 1, 26).value == len(table["residuals"])
+
+
+def test_named_style_writer_matches_per_cell_writer(synthetic_table, tmp_path):
+    sheets = {}
+    for fast in (False, True):
+        output_path = tmp_path / f"{'fast' if fast else 'cell'}.xlsx"
+        generate_ovx_workbook.write_workbook(synthetic_table, TEMPLATE_PATH, output_path, "Synthetic", "Synthetic", fast=fast)
+        sheets[fast] = load_workbook(output_path).worksheets[0]
+
+    fast_ws, cell_ws = sheets[True], sheets[False]
+    assert (fast_ws.max_row, fast_ws.max_column) == (cell_ws.max_row, cell_ws.max_column)
+    for fast_row, cell_row in zip(fast_ws.iter_rows(), cell_ws.iter_rows()):
+        for fast_cell, cell_cell in zip(fast_row, cell_row):
+            assert fast_cell.value == cell_cell.value
+            assert style_of(fast_cell) == style_of(cell_cell)
+
+
+def test_reused_workbook_registers_styles_once(synthetic_table, tmp_path):
+    workbook = load_workbook(TEMPLATE_PATH)
+    generate_ovx_workbook.write_workbook(synthetic_table, TEMPLATE_PATH, tmp_path / "a.xlsx", "A", "A", workbook=workbook)
+    registered = len(workbook.named_styles)
+    generate_ovx_workbook.write_workbook(synthetic_table, TEMPLATE_PATH, tmp_path / "b.xlsx", "B", "B", workbook=workbook)
+
+    assert len(workbook.named_styles) == registered
@@ -1,8 +1,17 @@
+import csv
+import hashlib
+import io
+import json
+import os
+import warnings
+from collections import OrderedDict
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 
+from fit_cache import atomic_write_bytes
+
 
 DATE_CANDIDATES = {
     "date",
@@ -26,6 +35,21 @@ VALUE_CANDIDATES = {
     "level",
 }
 
+STORE_URI_PREFIX = "store://"
+SIDECAR_VERSION = 1
+SIDECAR_SUFFIX = ".series.npz"
+WORKBOOK_SIDECAR_VERSION = 1
+WORKBOOK_SIDECAR_SUFFIX = ".sheets.npz"
+
+DATE_SAMPLE_ROWS = 200
+VALUE_SAMPLE_ROWS = 2000
+SCHEMA_CACHE_SIZE = 512
+RESAMPLE_METHODS = {"last", "mean", "ohlc"}
+# Period aliases for the supported targets; "ME" is pandas' resample spelling of month end.
+RESAMPLE_PERIODS = {"D": "D", "W-FRI": "W-FRI", "M": "M", "ME": "M"}
+# Resolved (date, value) columns keyed on header names and pandas dtypes.
+_schema_cache = OrderedDict()
+
 
 def normalize_name(name):
     return str(name).strip().lower().replace("_", " ")
@@ -42,12 +66,27 @@ def safe_sheet_title(name, fallback="Series"):
     return (cleaned or fallback)[:31]
 
 
-def read_tabular_data(data_path):
+def sniff_delimiter(data_path):
+    # Same rule as pandas' sep=None: sniff the first line only.
+    with open(data_path, newline="", encoding="utf-8-sig") as handle:
+        first_line = handle.readline()
+    return csv.Sniffer().sniff(first_line).delimiter
+
+
+def read_tabular_data(data_path, delimiter=None):
     path = Path(data_path)
     suffix = path.suffix.lower()
 
     if suffix in {".csv", ".txt", ".tsv"}:
-        df = pd.read_csv(path, sep=None, engine="python")
+        if delimiter is None:
+            try:
+                delimiter = sniff_delimiter(path)
+            except csv.Error:
+                delimiter = None
+        if delimiter is None:
+            df = pd.read_csv(path, sep=None, engine="python")
+        else:
+            df = pd.read_csv(path, sep=delimiter)
     elif suffix in {".xlsx", ".xls"}:
         df = pd.read_excel(path)
     else:
@@ -73,6 +112,15 @@ def resolve_column(columns, requested_name=None, candidates=None):
     return None
 
 
+def sample_rows(df, n_rows):
+    # Evenly spaced rows, always including the first and last, so a sample
+    # sees both ends of long exports.
+    if len(df) <= n_rows:
+        return df
+    positions = np.unique(np.linspace(0, len(df) - 1, n_rows).astype(np.int64))
+    return df.iloc[positions]
+
+
 def infer_date_column(df):
     candidate = resolve_column(df.columns, candidates=DATE_CANDIDATES)
     if candidate is not None:
@@ -80,40 +128,55 @@ def infer_date_column(df):
 
     best_column = None
     best_score = 0.0
-    sample_size = max(1, min(len(df), 200))
+    head = df.head(DATE_SAMPLE_ROWS)
 
     for column in df.columns:
-        parsed = pd.to_datetime(df[column], errors="coerce")
-        score = parsed.notna().head(sample_size).mean()
+        with warnings.catch_warnings():
+            # Non-date columns make pandas fall back to per-element parsing and warn.
+            warnings.simplefilter("ignore", UserWarning)
+            score = pd.to_datetime(head[column], errors="coerce").notna().mean()
         if score > best_score:
             best_score = score
             best_column = column
+            if best_score == 1.0:
+                # Later columns can only tie, and ties keep the first column.
+                break
 
     if best_score >= 0.8:
         return best_column
     return None
 
 
+def has_numeric_values(series):
+    head = series.head(VALUE_SAMPLE_ROWS)
+    if pd.to_numeric(head, errors="coerce").notna().any():
+        return True
+    if len(series) <= len(head):
+        return False
+    return bool(pd.to_numeric(series.iloc[len(head):], errors="coerce").notna().any())
+
+
 def infer_value_column(df, date_column=None, requested_name=None):
     if requested_name:
         column = resolve_column(df.columns, requested_name=requested_name)
-        series = pd.to_numeric(df[column], errors="coerce")
-        if series.notna().sum() == 0:
+        if not has_numeric_values(df[column]):
             raise ValueError(f"Column '{requested_name}' does not contain numeric data.")
         return column
 
     candidate_cols = [col for col in df.columns if col != date_column]
 
     for column in candidate_cols:
-        if normalize_name(column) in VALUE_CANDIDATES:
-            series = pd.to_numeric(df[column], errors="coerce")
-            if series.notna().sum() > 0:
-                return column
+        if normalize_name(column) in VALUE_CANDIDATES and has_numeric_values(df[column]):
+            return column
 
+    sample = sample_rows(df, VALUE_SAMPLE_ROWS)
     numeric_scores = []
     for column in candidate_cols:
-        series = pd.to_numeric(df[column], errors="coerce")
-        score = series.notna().mean()
+        values = sample[column]
+        if values.dtype.kind in "iuf":
+            score = values.notna().mean()
+        else:
+            score = pd.to_numeric(values, errors="coerce").notna().mean()
         if score > 0:
             numeric_scores.append((score, column))
 
@@ -124,11 +187,380 @@ def infer_value_column(df, date_column=None, requested_name=None):
     return numeric_scores[0][1]
 
 
-def load_time_series(data_path, date_col=None, value_col=None):
-    df = read_tabular_data(data_path)
+def schema_signature(df, date_col=None, value_col=None):
+    layout = [[str(column), str(dtype)] for column, dtype in df.dtypes.items()]
+    return hashlib.sha256(json.dumps([layout, date_col, value_col]).encode("utf-8")).hexdigest()
+
+
+def resolve_schema(df, date_col=None, value_col=None):
+    """Return ``(date_column, value_column)``, reusing earlier choices for the same file layout.
+
+    A cached schema is only reused after a sample check that its value column
+    is still numeric and its date column still parses.
+    """
+    signature = schema_signature(df, date_col, value_col)
+    cached = _schema_cache.get(signature)
+    if cached is not None:
+        date_column, value_column = cached
+        date_ok = date_column is None or date_col is not None or (
+            pd.to_datetime(df[date_column].head(DATE_SAMPLE_ROWS), errors="coerce").notna().mean() >= 0.8
+        )
+        if date_ok and has_numeric_values(df[value_column]):
+            _schema_cache.move_to_end(signature)
+            return cached
+
     date_column = resolve_column(df.columns, requested_name=date_col) if date_col else infer_date_column(df)
     value_column = infer_value_column(df, date_column=date_column, requested_name=value_col)
 
+    _schema_cache[signature] = (date_column, value_column)
+    if len(_schema_cache) > SCHEMA_CACHE_SIZE:
+        _schema_cache.popitem(last=False)
+    return date_column, value_column
+
+
+def looks_like_data_row(row):
+    cells = [str(cell).strip() for cell in row]
+    if not cells or not cells[0]:
+        return False
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        if pd.notna(pd.to_datetime(cells[0], errors="coerce")):
+            return True
+    numeric = pd.to_numeric(pd.Series(cells[1:], dtype=object), errors="coerce")
+    return len(cells) > 1 and numeric.notna().any() and numeric.notna().sum() == sum(bool(cell) for cell in cells[1:])
+
+
+def detect_header_rows(rows, max_header_rows=10):
+    # Header rows run until the first row that starts with a date or carries
+    # only numbers, e.g. three rows for yfinance's Price/Ticker/Date layout.
+    for position, row in enumerate(rows[:max_header_rows]):
+        if position > 0 and looks_like_data_row(row):
+            return position
+    return 1
+
+
+def combine_header_rows(header_rows):
+    n_columns = max(len(row) for row in header_rows)
+    levels = [
+        [str(row[position]).strip() if position < len(row) and pd.notna(row[position]) else "" for position in range(n_columns)]
+        for row in header_rows
+    ]
+    first_level = [level_values for level_values in zip(*levels)]
+    names = [next((value for value in values if value), "") for values in first_level]
+    duplicated = {name for name in names if names.count(name) > 1}
+    combined = []
+    for position, values in enumerate(first_level):
+        if position == 0:
+            # The index column is named by its last non-empty level ("Date").
+            combined.append(next((value for value in reversed(values) if value), names[0]))
+        elif names[position] in duplicated:
+            combined.append(" ".join(value for value in values if value))
+        else:
+            combined.append(names[position])
+    return combined
+
+
+def load_panel(data_path, columns=None, date_col=None, header_rows=None):
+    """Load several numeric columns from one file into a single float64 block.
+
+    The file is parsed once. Multi-row headers (``header_rows=None`` detects
+    them) are collapsed to one name per column, using the first level unless
+    it is ambiguous. Rows are aligned on a shared, sorted DatetimeIndex and
+    the values live in one Fortran-ordered float64 array, so
+    ``panel.to_numpy()`` and ``panel[column].to_numpy()`` are views rather
+    than copies. Returns ``(panel, metadata)``.
+    """
+    path = Path(data_path)
+    suffix = path.suffix.lower()
+
+    if suffix in {".csv", ".txt", ".tsv"}:
+        try:
+            delimiter = sniff_delimiter(path)
+        except csv.Error:
+            delimiter = ","
+        with open(path, newline="", encoding="utf-8-sig") as handle:
+            reader = csv.reader(handle, delimiter=delimiter)
+            head_rows = [row for _, row in zip(range(12), reader)]
+        n_header = header_rows if header_rows is not None else detect_header_rows(head_rows)
+        raw = pd.read_csv(path, sep=delimiter, header=None, skiprows=n_header)
+        header = head_rows[:n_header]
+    elif suffix in {".xlsx", ".xls"}:
+        delimiter = None
+        table = pd.read_excel(path, header=None)
+        head_rows = table.head(12).astype(object).values.tolist()
+        n_header = header_rows if header_rows is not None else detect_header_rows(head_rows)
+        raw = table.iloc[n_header:].reset_index(drop=True)
+        header = head_rows[:n_header]
+    else:
+        raise ValueError(f"Unsupported file type: {suffix}")
+
+    if n_header < 1:
+        raise ValueError("header_rows must be at least 1.")
+    names = combine_header_rows(header)
+    if len(names) < raw.shape[1]:
+        names += [f"column_{position}" for position in range(len(names), raw.shape[1])]
+    raw.columns = names[: raw.shape[1]]
+
+    if date_col:
+        date_column = resolve_column(raw.columns, requested_name=date_col)
+    elif n_header > 1:
+        date_column = raw.columns[0]
+    else:
+        date_column = infer_date_column(raw)
+    if date_column is None:
+        raise ValueError("load_panel needs a date column; none was found.")
+
+    if columns is None:
+        selected = []
+        for column in raw.columns:
+            if column == date_column:
+                continue
+            if raw[column].dtype.kind in "iuf" or has_numeric_values(raw[column]):
+                selected.append(column)
+    else:
+        selected = [resolve_column(raw.columns, requested_name=column) for column in columns]
+    if not selected:
+        raise ValueError("No numeric columns found for the panel.")
+
+    dates = pd.to_datetime(raw[date_column], errors="coerce")
+    valid = dates.notna().to_numpy()
+    order = np.argsort(dates.to_numpy()[valid], kind="stable")
+    index = pd.DatetimeIndex(dates.to_numpy()[valid][order], name=date_column)
+
+    block = np.empty((len(index), len(selected)), dtype=np.float64, order="F")
+    for position, column in enumerate(selected):
+        values = raw[column]
+        if values.dtype.kind not in "iuf":
+            values = pd.to_numeric(values, errors="coerce")
+        block[:, position] = values.to_numpy(dtype=np.float64, na_value=np.nan)[valid][order]
+
+    panel = pd.DataFrame(block, index=index, columns=pd.Index(selected), copy=False)
+    metadata = {
+        "date_column": date_column,
+        "columns": list(selected),
+        "header_rows": n_header,
+        "delimiter": delimiter,
+        "source_name": path.stem,
+    }
+    return panel, metadata
+
+
+def is_store_uri(data_path):
+    return str(data_path).startswith(STORE_URI_PREFIX)
+
+
+def hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def sidecar_path(data_path, cache_dir=None):
+    path = Path(data_path)
+    directory = Path(cache_dir) if cache_dir is not None else path.parent
+    return directory / f".{path.name}{SIDECAR_SUFFIX}"
+
+
+def read_sidecar(data_path, date_col=None, value_col=None, cache_dir=None):
+    """Return ``(series, metadata)`` from the sidecar, or None when it is missing or stale.
+
+    The source's size and mtime are checked first; only when they differ is
+    the source re-hashed, so a touched but unchanged file still hits.
+    """
+    cache_path = sidecar_path(data_path, cache_dir)
+    try:
+        with np.load(cache_path, allow_pickle=False) as payload:
+            info = json.loads(str(payload["info"]))
+            index_values = payload["index"]
+            values = payload["values"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+    if info.get("version") != SIDECAR_VERSION or info.get("request") != [date_col, value_col]:
+        return None
+
+    stat = os.stat(data_path)
+    if (stat.st_size, stat.st_mtime_ns) != (info["source_size"], info["source_mtime_ns"]):
+        if stat.st_size != info["source_size"] or hash_file(data_path) != info["source_hash"]:
+            return None
+        info["source_mtime_ns"] = stat.st_mtime_ns
+        write_sidecar(cache_path, info, index_values, values)
+
+    metadata = info["metadata"]
+    if metadata["date_column"] is not None:
+        index = pd.DatetimeIndex(index_values.view(info["index_dtype"]), name=metadata["date_column"])
+    else:
+        index = pd.Index(index_values)
+    series = pd.Series(values, index=index, name=metadata["value_column"])
+    return series, dict(metadata, delimiter=info["delimiter"])
+
+
+def write_sidecar(cache_path, info, index_values, values):
+    buffer = io.BytesIO()
+    np.savez(buffer, info=np.array(json.dumps(info)), index=index_values, values=values)
+    try:
+        atomic_write_bytes(cache_path, buffer.getvalue())
+    except OSError:
+        # A read-only data directory just means no caching.
+        return False
+    return True
+
+
+def workbook_sidecar_path(workbook_path, cache_dir=None):
+    path = Path(workbook_path)
+    directory = Path(cache_dir) if cache_dir is not None else path.parent
+    return directory / f".{path.name}{WORKBOOK_SIDECAR_SUFFIX}"
+
+
+def frame_to_arrays(frame):
+    """Split a date-indexed sheet into plain arrays, or None if it has non-numeric columns."""
+    if not isinstance(frame.index, pd.DatetimeIndex) or frame.index.tz is not None:
+        return None
+    if any(dtype.kind not in "iufb" for dtype in frame.dtypes):
+        return None
+    layout = {
+        "index_name": frame.index.name,
+        "index_dtype": str(frame.index.dtype),
+        "columns": list(frame.columns),
+    }
+    arrays = [frame.index.asi8] + [frame[column].to_numpy() for column in frame.columns]
+    return layout, arrays
+
+
+def read_workbook_sidecar(workbook_path, cache_dir=None):
+    """Return ``{sheet: DataFrame}`` from the workbook sidecar, or None when it is missing or stale.
+
+    Freshness is checked the same way as the series sidecar: size and mtime
+    first, then the content hash when only the mtime moved.
+    """
+    cache_path = workbook_sidecar_path(workbook_path, cache_dir)
+    try:
+        with np.load(cache_path, allow_pickle=False) as payload:
+            info = json.loads(str(payload["info"]))
+            if info.get("version") != WORKBOOK_SIDECAR_VERSION:
+                return None
+            arrays = {key: payload[key] for key in payload.files if key != "info"}
+    except (OSError, ValueError, KeyError):
+        return None
+
+    stat = os.stat(workbook_path)
+    if (stat.st_size, stat.st_mtime_ns) != (info["source_size"], info["source_mtime_ns"]):
+        if stat.st_size != info["source_size"] or hash_file(workbook_path) != info["source_hash"]:
+            return None
+        info["source_mtime_ns"] = stat.st_mtime_ns
+        write_workbook_sidecar(cache_path, info, arrays)
+
+    sheets = {}
+    for position, (sheet, layout) in enumerate(info["sheets"].items()):
+        index = pd.DatetimeIndex(arrays[f"{position}/index"].view(layout["index_dtype"]), name=layout["index_name"])
+        data = {column: arrays[f"{position}/{j}"] for j, column in enumerate(layout["columns"])}
+        sheets[sheet] = pd.DataFrame(data, index=index, columns=layout["columns"])
+    return sheets
+
+
+def write_workbook_sidecar(cache_path, info, arrays):
+    buffer = io.BytesIO()
+    np.savez(buffer, info=np.array(json.dumps(info)), **arrays)
+    try:
+        atomic_write_bytes(cache_path, buffer.getvalue())
+    except OSError:
+        return False
+    return True
+
+
+def read_workbook_sheet(workbook, sheet, date_col=0):
+    """Parse one sheet of a path or open ``pd.ExcelFile``, indexed by ``date_col``; undated rows are dropped."""
+    df = pd.read_excel(workbook, sheet_name=sheet, parse_dates=[date_col])
+    df.columns = [str(c) for c in df.columns]
+    dc = df.columns[date_col]
+    df[dc] = pd.to_datetime(df[dc], errors="coerce")
+    return df.dropna(subset=[dc]).set_index(dc)
+
+
+def load_workbook_sheets(workbook_path, required=None, date_col=0, cache=True, cache_dir=None):
+    """Load the time-series sheets of an Excel workbook.
+
+    ``required`` maps sheet names to the columns each must have (all sheets
+    are read when it is None); any missing sheet or column raises ValueError.
+    With ``cache`` every all-numeric sheet read is written column by column
+    to a ``.<name>.sheets.npz`` sidecar, and later calls rebuild the frames
+    from it without openpyxl until the workbook's contents change. Parsing
+    the XLSX costs the same however the sheets are grouped; the sidecar is
+    what makes repeat loads fast.
+    """
+    sheets = read_workbook_sidecar(workbook_path, cache_dir=cache_dir) if cache else None
+    if sheets is not None and any(sheet not in sheets for sheet in required or {}):
+        # Only all-numeric sheets are cached; anything else needs the workbook.
+        sheets = None
+    if sheets is None:
+        source_stat = os.stat(workbook_path) if cache else None
+        sheets = {}
+        with pd.ExcelFile(workbook_path) as workbook:
+            # Missing required sheets are reported below with missing columns.
+            for sheet in [name for name in required or workbook.sheet_names if name in workbook.sheet_names]:
+                frame = read_workbook_sheet(workbook, sheet, date_col=date_col)
+                if not frame.empty:
+                    sheets[sheet] = frame
+        if cache:
+            info = {
+                "version": WORKBOOK_SIDECAR_VERSION,
+                "source_size": source_stat.st_size,
+                "source_mtime_ns": source_stat.st_mtime_ns,
+                "source_hash": hash_file(workbook_path),
+                "sheets": {},
+            }
+            arrays = {}
+            for sheet, frame in sheets.items():
+                split = frame_to_arrays(frame)
+                if split is None:
+                    continue
+                layout, sheet_arrays = split
+                position = len(info["sheets"])
+                info["sheets"][sheet] = layout
+                arrays[f"{position}/index"] = sheet_arrays[0]
+                arrays.update({f"{position}/{j}": values for j, values in enumerate(sheet_arrays[1:])})
+            write_workbook_sidecar(workbook_sidecar_path(workbook_path, cache_dir), info, arrays)
+
+    for sheet, columns in (required or {}).items():
+        if sheet not in sheets:
+            raise ValueError(f"Workbook '{Path(workbook_path).name}' has no time-series sheet '{sheet}'.")
+        missing_cols = [col for col in columns if col not in sheets[sheet].columns]
+        if missing_cols:
+            raise ValueError(f"Sheet '{sheet}' is missing columns: {missing_cols}")
+    return sheets
+
+
+def load_time_series(data_path, date_col=None, value_col=None, cache=True, cache_dir=None):
+    """Load one series and its resolved columns from a CSV or Excel file.
+
+    With ``cache`` the parsed series is written to a ``.<name>.series.npz``
+    sidecar next to the source (or in ``cache_dir``), together with the
+    resolved columns and delimiter, and later calls read the sidecar until
+    the source's contents change. ``store://<root>#<name>`` URIs are read
+    from a series_store.SeriesStore instead of a file.
+    """
+    if is_store_uri(data_path):
+        from series_store import load_store_uri
+
+        return load_store_uri(data_path)
+
+    if cache:
+        cached = read_sidecar(data_path, date_col=date_col, value_col=value_col, cache_dir=cache_dir)
+        if cached is not None:
+            return cached
+
+    source_stat = os.stat(data_path) if cache else None
+    delimiter = None
+    if Path(data_path).suffix.lower() in {".csv", ".txt", ".tsv"}:
+        try:
+            delimiter = sniff_delimiter(data_path)
+        except csv.Error:
+            delimiter = None
+    df = read_tabular_data(data_path, delimiter=delimiter)
+    date_column, value_column = resolve_schema(df, date_col=date_col, value_col=value_col)
+
     working_df = df.copy()
 
     if date_column is not None:
@@ -154,4 +586,161 @@ def load_time_series(data_path, date_col=None, value_col=None):
         "series_label": series_label,
         "source_name": Path(data_path).stem,
     }
-    return series, metadata
+
+    if cache:
+        index_values = None
+        if date_column is None:
+            index_values = series.index.to_numpy(dtype=np.int64)
+        elif isinstance(series.index, pd.DatetimeIndex) and series.index.tz is None:
+            index_values = series.index.asi8
+        # Only naive datetime or integer indexes and numeric values round-trip without pickle.
+        if index_values is not None and series.dtype.kind in "iuf":
+            info = {
+                "version": SIDECAR_VERSION,
+                "request": [date_col, value_col],
+                "source_size": source_stat.st_size,
+                "source_mtime_ns": source_stat.st_mtime_ns,
+                "source_hash": hash_file(data_path),
+                "delimiter": delimiter,
+                "index_dtype": str(series.index.dtype),
+                "metadata": metadata,
+            }
+            write_sidecar(
+                sidecar_path(data_path, cache_dir),
+                info,
+                np.ascontiguousarray(index_values, dtype=np.int64),
+                series.to_numpy(),
+            )
+    return series, dict(metadata, delimiter=delimiter)
+
+
+def aggregate_chunk(timestamps, values, period_freq):
+    order = np.argsort(timestamps, kind="stable")
+    chunk = pd.DataFrame({"time": timestamps[order], "value": values[order]})
+    chunk["bucket"] = chunk["time"].dt.to_period(period_freq)
+    grouped = chunk.groupby("bucket", sort=False)
+    return pd.DataFrame(
+        {
+            "first_time": grouped["time"].first(),
+            "open": grouped["value"].first(),
+            "high": grouped["value"].max(),
+            "low": grouped["value"].min(),
+            "last_time": grouped["time"].last(),
+            "close": grouped["value"].last(),
+            "sum": grouped["value"].sum(),
+            "count": grouped["value"].count(),
+        }
+    )
+
+
+def merge_aggregates(totals, chunk_totals):
+    if totals is None:
+        return chunk_totals
+    overlap = totals.index.intersection(chunk_totals.index)
+    if overlap.empty:
+        return pd.concat([totals, chunk_totals])
+
+    # Only buckets seen in both are recombined; the rest are appended as is.
+    old, new = totals.loc[overlap], chunk_totals.loc[overlap]
+    take_new_open = (new["first_time"] < old["first_time"]).to_numpy()
+    take_new_close = (new["last_time"] >= old["last_time"]).to_numpy()
+    merged = pd.DataFrame(
+        {
+            "first_time": np.where(take_new_open, new["first_time"], old["first_time"]),
+            "open": np.where(take_new_open, new["open"], old["open"]),
+            "high": np.maximum(old["high"].to_numpy(), new["high"].to_numpy()),
+            "low": np.minimum(old["low"].to_numpy(), new["low"].to_numpy()),
+            "last_time": np.where(take_new_close, new["last_time"], old["last_time"]),
+            "close": np.where(take_new_close, new["close"], old["close"]),
+            "sum": old["sum"].to_numpy() + new["sum"].to_numpy(),
+            "count": old["count"].to_numpy() + new["count"].to_numpy(),
+        },
+        index=overlap,
+    )
+    totals = totals.drop(overlap)
+    return pd.concat([totals, merged, chunk_totals.drop(overlap)])
+
+
+def stream_time_series(data_path, freq="D", how="last", date_col=None, value_col=None, chunksize=500_000):
+    """Read a large delimited file in chunks and resample it to ``freq`` on the fly.
+
+    ``freq`` is one of "D", "W-FRI" or "M"/"ME"; rows are labelled with the
+    period end, as ``Series.resample`` does. ``how`` is "last" or "mean"
+    (a Series) or "ohlc" (a DataFrame with open/high/low/close/count).
+    Memory is bounded by ``chunksize`` plus one row per output period, and
+    rows may arrive in any order.
+    """
+    path = Path(data_path)
+    if path.suffix.lower() not in {".csv", ".txt", ".tsv"}:
+        raise ValueError(f"Streaming loads support delimited text files only, not {path.suffix}")
+    if freq not in RESAMPLE_PERIODS:
+        raise ValueError(f"freq must be one of {sorted(RESAMPLE_PERIODS)}.")
+    if how not in RESAMPLE_METHODS:
+        raise ValueError(f"how must be one of {sorted(RESAMPLE_METHODS)}.")
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1.")
+
+    try:
+        delimiter = sniff_delimiter(path)
+    except csv.Error:
+        delimiter = None
+    read_options = {"sep": delimiter} if delimiter is not None else {"sep": None, "engine": "python"}
+
+    header = pd.read_csv(path, nrows=VALUE_SAMPLE_ROWS, **read_options)
+    header.columns = [str(col).strip() for col in header.columns]
+    date_column, value_column = resolve_schema(header, date_col=date_col, value_col=value_col)
+    if date_column is None:
+        raise ValueError("Streaming resampling needs a date column; none was found.")
+
+    raw_columns = [column for column in pd.read_csv(path, nrows=0, **read_options).columns]
+    stripped = {str(column).strip(): column for column in raw_columns}
+    usecols = [stripped[date_column], stripped[value_column]]
+
+    totals = None
+    rows_read = 0
+    n_chunks = 0
+    period_freq = RESAMPLE_PERIODS[freq]
+    for chunk in pd.read_csv(path, usecols=usecols, chunksize=chunksize, **read_options):
+        n_chunks += 1
+        rows_read += len(chunk)
+        timestamps = pd.to_datetime(chunk[usecols[0]], errors="coerce")
+        values = pd.to_numeric(chunk[usecols[1]], errors="coerce")
+        valid = (timestamps.notna() & values.notna()).to_numpy()
+        if not valid.any():
+            continue
+        chunk_totals = aggregate_chunk(timestamps[valid].reset_index(drop=True), values.to_numpy()[valid], period_freq)
+        totals = merge_aggregates(totals, chunk_totals)
+
+    if totals is None or totals.empty:
+        raise ValueError("Selected series is empty after removing invalid rows.")
+
+    totals = totals.sort_index()
+    index = pd.DatetimeIndex(totals.index.to_timestamp(how="end").normalize(), name=date_column)
+    if how == "ohlc":
+        result = pd.DataFrame(
+            {
+                "open": totals["open"].to_numpy(),
+                "high": totals["high"].to_numpy(),
+                "low": totals["low"].to_numpy(),
+                "close": totals["close"].to_numpy(),
+                "count": totals["count"].to_numpy(),
+            },
+            index=index,
+        )
+    elif how == "mean":
+        result = pd.Series((totals["sum"] / totals["count"]).to_numpy(), index=index, name=value_column)
+    else:
+        result = pd.Series(totals["close"].to_numpy(), index=index, name=value_column)
+
+    metadata = {
+        "date_column": date_column,
+        "value_column": value_column,
+        "series_label": make_series_label(value_column or path.stem),
+        "source_name": path.stem,
+        "delimiter": delimiter,
+        "freq": freq,
+        "how": how,
+        "rows_read": rows_read,
+        "chunks": n_chunks,
+    }
+    return result, metadata
@@ -10,6 +10,8 @@ import statsmodels.api as sm
 from statsmodels.stats.diagnostic import linear_reset, het_arch
 from arch import arch_model
 
+from ewma import DEFAULT_LAMBDAS, RISKMETRICS_LAMBDA, ewma_variance, optimal_lambda
+
 # -----------------------------
 # 1. Load Data
 # -----------------------------
@@ -203,3 +205,39 @@ else:
     print("Red Zone: Model is not acceptable")
 
 print("\nProject Completed Successfully!")
+
+# -----------------------------
+# 16. EWMA (RiskMetrics) VaR: Decay-Factor Comparison
+# -----------------------------
+best_lambda, lambda_scores = optimal_lambda(returns.to_numpy(), DEFAULT_LAMBDAS, criterion="likelihood")
+
+# One pass gives the variance path for every lambda; row t is the forecast for
+# day t + 1, so shift by a day before comparing with realized returns.
+ewma_paths = ewma_variance(returns.to_numpy(), DEFAULT_LAMBDAS)
+ewma_var = pd.DataFrame(z_score * np.sqrt(ewma_paths), index=returns.index, columns=DEFAULT_LAMBDAS).shift(1)
+ewma_violation_ratio = ewma_var.iloc[1:].gt(returns.iloc[1:], axis=0).mean()
+
+print("\nEWMA VaR by Decay Factor:")
+for decay in (RISKMETRICS_LAMBDA, best_lambda):
+    print(
+        f"lambda={decay:.3f}  log-likelihood={lambda_scores.loc[decay]:.2f}  "
+        f"violation ratio={ewma_violation_ratio.loc[decay]:.4f}"
+    )
+print("Optimal lambda (max likelihood):", best_lambda)
+
+plt.figure()
+plt.plot(lambda_scores.index, lambda_scores.values)
+plt.axvline(best_lambda, linestyle='--', label=f'Optimal lambda ({best_lambda:.3f})')
+plt.title("EWMA Log-Likelihood by Decay Factor")
+plt.xlabel("Lambda")
+plt.ylabel("Log-Likelihood")
+plt.legend()
+plt.show()
+
+plt.figure()
+plt.plot(returns, label='Returns')
+plt.plot(ewma_var[RISKMETRICS_LAMBDA], label=f'EWMA VaR (lambda={RISKMETRICS_LAMBDA})', linestyle='--')
+plt.plot(ewma_var[best_lambda], label=f'EWMA VaR (lambda={best_lambda:.3f})', linestyle=':')
+plt.title("EWMA VaR Backtesting")
+plt.legend()
+plt.show()
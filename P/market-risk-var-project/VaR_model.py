@@ -4,6 +4,8 @@ import pandas as pd
 import matplotlib.pyplot as plt
 from scipy.stats import norm
 
+from ewma import ewma_variance, optimal_lambda
+
 ticker = "^GSPC"
 
 data = yf.download(ticker, start="2018-01-01", end="2024-01-01")
@@ -70,20 +72,28 @@ mc_percentile = np.percentile(sim_returns, (1 - confidence) * 100)
 monte_carlo_var = -mc_percentile * portfolio_value
 
 # =========================
-# 5. Print Results
+# 5. EWMA (RiskMetrics) VaR
+# =========================
+best_lambda, _ = optimal_lambda(returns.to_numpy())
+ewma_std = np.sqrt(ewma_variance(returns.to_numpy(), best_lambda)[-1])
+ewma_var = portfolio_value * -(mean + z * ewma_std)
+
+# =========================
+# 6. Print Results
 # =========================
 print("\n VALUE AT RISK (VaR) RESULTS")
 print("--------------------------------")
 print(f"Parametric VaR  : ${parametric_var:,.2f}")
 print(f"Historical VaR  : ${historical_var:,.2f}")
 print(f"Monte Carlo VaR : ${monte_carlo_var:,.2f}")
+print(f"EWMA VaR        : ${ewma_var:,.2f}  (lambda={best_lambda:.3f})")
 
 # =========================
-# 6. Visualization
+# 7. Visualization
 # =========================
 results = pd.DataFrame({
-    "Method": ["Parametric", "Historical", "Monte Carlo"],
-    "VaR": [parametric_var, historical_var, monte_carlo_var]
+    "Method": ["Parametric", "Historical", "Monte Carlo", "EWMA"],
+    "VaR": [parametric_var, historical_var, monte_carlo_var, ewma_var]
 })
 
 plt.figure()
@@ -5,6 +5,8 @@ from scipy.stats import norm
 import matplotlib.pyplot as plt
 from arch import arch_model
 
+from ewma import RISKMETRICS_LAMBDA, ewma_variance, optimal_lambda
+
 # =========================
 # 1. LOAD DATA
 # =========================
@@ -53,7 +55,18 @@ garch_vol = garch_fit.conditional_volatility / 100
 garch_var = -portfolio_value * (mean + z * garch_vol.iloc[-1])
 
 # =========================
-# 5. STRESS TESTING
+# 5. EWMA (RISKMETRICS) MODEL
+# =========================
+best_lambda, _ = optimal_lambda(returns.to_numpy())
+
+# Last row of each path is the variance forecast for the next day.
+ewma_vol = np.sqrt(ewma_variance(returns.to_numpy(), [RISKMETRICS_LAMBDA, best_lambda])[-1])
+
+riskmetrics_var = -portfolio_value * (mean + z * ewma_vol[0])
+optimal_ewma_var = -portfolio_value * (mean + z * ewma_vol[1])
+
+# =========================
+# 6. STRESS TESTING
 # =========================
 stress_scenarios = {
     "Market Crash (-20%)": -0.20,
@@ -64,7 +77,7 @@ stress_scenarios = {
 stress_results = {k: v * portfolio_value for k, v in stress_scenarios.items()}
 
 # =========================
-# 6. BACKTESTING (Kupiec)
+# 7. BACKTESTING (Kupiec)
 # =========================
 var_series = - (mean + z * std)
 
@@ -75,7 +88,7 @@ total_obs = len(returns)
 violation_ratio = num_violations / total_obs
 
 # =========================
-# 7. RESULTS
+# 8. RESULTS
 # =========================
 print("\n📊 VALUE AT RISK")
 print("------------------------")
@@ -83,6 +96,8 @@ print(f"Parametric VaR : ${parametric_var:,.2f}")
 print(f"Historical VaR : ${hist_var:,.2f}")
 print(f"Monte Carlo VaR: ${mc_var:,.2f}")
 print(f"GARCH VaR      : ${garch_var:,.2f}")
+print(f"EWMA VaR (λ={RISKMETRICS_LAMBDA:.2f}): ${riskmetrics_var:,.2f}")
+print(f"EWMA VaR (λ={best_lambda:.3f}): ${optimal_ewma_var:,.2f}  (max-likelihood decay)")
 
 print("\n📉 EXPECTED SHORTFALL")
 print("------------------------")
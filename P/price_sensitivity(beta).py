@@ -3,6 +3,8 @@ import pandas as pd
 import numpy as np
 import statsmodels.api as sm
 
+from hac import hac_vcov
+
 # =========================================================
 # 1. DATA LOADER (ROBUST)
 # =========================================================
@@ -50,6 +52,15 @@ def beta_ols(stock, market):
     return model.params.iloc[1]
 
 
+def beta_ols_hac(stock, market, kernel="bartlett"):
+    # Daily returns are autocorrelated and heteroskedastic, so report a HAC
+    # standard error with an automatically chosen bandwidth.
+    X = sm.add_constant(market)
+    model = sm.OLS(stock, X).fit()
+    vcov = hac_vcov(np.asarray(X, dtype=float), model.resid.values, kernel=kernel)
+    return model.params.iloc[1], np.sqrt(vcov[1, 1])
+
+
 # =========================================================
 # 3. ROLLING BETA (TIME-VARYING)
 # =========================================================
@@ -103,6 +114,7 @@ if __name__ == "__main__":
     b_ols = beta_ols(stock, market)
     b_corr = beta_corr(stock, market)
     b_down = beta_downside(stock, market)
+    _, b_ols_se = beta_ols_hac(stock, market)
 
     print("Always consider the context and data quality when choosing a Beta estimation method.")
     print("Covariance-based Beta can be unstable if market variance is low.")
@@ -112,7 +124,7 @@ if __name__ == "__main__":
 
     print("\n📊 BETA COMPARISON")
     print("Cov Beta      :", round(b_cov, 4))
-    print("OLS Beta      :", round(b_ols, 4))
+    print("OLS Beta      :", round(b_ols, 4), f"(HAC SE {b_ols_se:.4f})")
     print("Corr Beta     :", round(b_corr, 4))
     print("Downside Beta :", round(b_down, 4))
 